@@ -0,0 +1,72 @@
+"""Micro-benchmark: per-step overhead of the WeaverGraph agent node.
+
+Compares the cached tool-bound LLM / prebuilt system message against rebinding
+tools and rebuilding the system message on every step (the previous behaviour).
+The fake LLM converts tool schemas in ``bind_tools`` like real chat models do,
+so the measurement isolates framework overhead from network latency.
+
+Usage (example):
+    python -m benchmarks.agent_step --steps 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from weaver.core.graph import WeaverGraph
+
+
+class SchemaConvertingFakeLLM(Runnable):
+    """Instant fake chat model whose ``bind_tools`` pays the schema conversion cost."""
+
+    def __init__(self, schemas=None):
+        self.schemas = schemas or []
+
+    def bind_tools(self, tools):
+        return SchemaConvertingFakeLLM([convert_to_openai_tool(t) for t in tools])
+
+    def invoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        return AIMessage(content="ok")
+
+
+def run(steps: int, history: int) -> Dict[str, Any]:
+    graph = WeaverGraph(system_prompt="SYSTEM", llm=SchemaConvertingFakeLLM())
+    state = {"input": [HumanMessage(content=f"m{i}") for i in range(history)]}
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        graph._agent_node(state)
+    cached_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        bound = graph.llm.bind_tools(graph.tools)
+        bound.invoke([SystemMessage(content=graph.system_prompt)] + state["input"])
+    rebind_s = time.perf_counter() - start
+
+    return {
+        "steps": steps,
+        "history": history,
+        "cached_us_per_step": cached_s / steps * 1e6,
+        "rebind_us_per_step": rebind_s / steps * 1e6,
+        "speedup": rebind_s / cached_s if cached_s else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--history", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.steps, args.history), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Local OpenAI-compatible stand-in server for benchmarks and tests.
+
+`FakeOpenAIServer` serves ``POST /v1/chat/completions`` (plain JSON or SSE when
+``"stream": true``) on 127.0.0.1 with HTTP/1.1 keep-alive, so a real
+``ChatOpenAI`` client can talk to it without network access or an API key. It
+counts accepted TCP connections and requests, which is what connection-reuse
+measurements need, and can add a fixed ``latency`` per request.
+
+Faults are injected per request from a seeded RNG: with probability
+``error_rate`` the server answers ``500``, with probability ``slow_rate`` it
+stalls for ``slow_latency`` seconds first (a tail-latency outlier).
+
+Usage (example):
+    with FakeOpenAIServer(latency=0.01) as server:
+        llm = ChatOpenAI(model="stand-in", api_key="sk-local", base_url=server.url)
+        llm.invoke("hi")
+        print(server.connections, server.requests)
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: one TCP connection serves many requests
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    server: "_Server"
+
+    def log_message(self, format: str, *args: Any) -> None:  # quiet
+        pass
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        fault = self.server.owner._record(body)
+        delay = self.server.owner.latency + (
+            self.server.owner.slow_latency if fault == "slow" else 0
+        )
+        if delay:
+            time.sleep(delay)
+        if fault == "error":
+            self._send_json(500, {"error": {"message": "injected fault", "type": "server_error"}})
+            return
+        completion = self.server.owner._completion(body)
+        if body.get("stream"):
+            self._send_stream(completion)
+        else:
+            self._send_json(200, completion)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, completion: Dict[str, Any]) -> None:
+        base = {k: completion[k] for k in ("id", "created", "model")}
+        content = completion["choices"][0]["message"]["content"]
+        chunks = [
+            {"index": 0, "delta": {"role": "assistant", "content": content}},
+            {"index": 0, "delta": {}, "finish_reason": "stop"},
+        ]
+        events = [{**base, "object": "chat.completion.chunk", "choices": [c]} for c in chunks]
+        data = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+        payload = data.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "FakeOpenAIServer"
+
+    def process_request(self, request, client_address) -> None:
+        self.owner._connected()
+        super().process_request(request, client_address)
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients drop pooled or hedged-away connections mid-request; not a server bug.
+        pass
+
+
+class FakeOpenAIServer:
+    """Threaded OpenAI-compatible chat-completions server on an ephemeral port."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        reply: str = "ok",
+        *,
+        error_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_latency: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.reply = reply
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.connections = 0
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self.bodies: List[Dict[str, Any]] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as ``base_url`` (includes the ``/v1`` prefix)."""
+        if self._server is None:
+            raise RuntimeError("server not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _connected(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _record(self, body: Dict[str, Any]) -> Optional[str]:
+        """Count the request and draw its injected fault (``"error"``, ``"slow"`` or None)."""
+        with self._lock:
+            self.requests += 1
+            self.bodies.append(body)
+            draw = self._rng.random()
+            if draw < self.error_rate:
+                self.errors += 1
+                return "error"
+            if draw < self.error_rate + self.slow_rate:
+                return "slow"
+            return None
+
+    def _completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": f"chatcmpl-{next(self._ids)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stand-in"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.reply},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
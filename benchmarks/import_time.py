@@ -0,0 +1,127 @@
+"""Benchmark: cold-start import cost of Weaver entry points.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``;
+the report gives the cumulative import time attributable to it (interpreter
+startup excluded), the number of modules it loaded, the slowest of those, and
+any heavy dependency that should only load on first use (provider SDKs,
+LangGraph, python-dotenv).
+
+``--check`` exits non-zero when a module exceeds its ``BUDGETS`` entry or
+eagerly imports a deferred dependency. The test-suite only asserts the latter,
+since wall-clock budgets are too noisy for shared CI runners.
+
+Usage (example):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time weaver.runtime --repeat 5 --check --out imports.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Milliseconds of cumulative import time allowed per entry point (generous for CI).
+BUDGETS: Dict[str, float] = {
+    "weaver.core": 250.0,
+    "weaver.runtime": 250.0,
+    "weaver.models": 1500.0,
+    "weaver.core.graph": 3000.0,
+    "weaver.runtime.runtime": 3000.0,
+}
+# Top-level packages that must load on first use only.
+DEFERRED = ("langchain_openai", "openai", "langgraph", "dotenv")
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _importtime(statement: str) -> List[Tuple[str, int, int]]:
+    """Run ``statement`` in a fresh interpreter; return (module, depth, cumulative µs)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_SRC), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, int(cumulative)))
+    return rows
+
+
+def measure(module: str, *, top: int = 10) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and report its cold-start cost."""
+    startup = {name for name, _, _ in _importtime("pass")}
+    rows = [row for row in _importtime(f"import {module}") if row[0] not in startup]
+    loaded = {name for name, _, _ in rows}
+    # Top-level rows partition the import tree, so their cumulative times add up.
+    total_us = sum(cumulative for _, depth, cumulative in rows if depth == 0)
+    slowest = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": total_us / 1e3,
+        "modules_loaded": len(loaded),
+        "slowest": [{"module": name, "cumulative_ms": us / 1e3} for name, _, us in slowest],
+        "deferred_loaded": sorted(
+            pkg for pkg in DEFERRED if any(n == pkg or n.startswith(pkg + ".") for n in loaded)
+        ),
+    }
+
+
+def measure_best(module: str, repeat: int = 3) -> Dict[str, Any]:
+    """Best-of-``repeat`` `measure` (the minimum is least disturbed by system noise)."""
+    return min((measure(module) for _ in range(max(1, repeat))), key=lambda r: r["total_ms"])
+
+
+def check(
+    results: Sequence[Dict[str, Any]], budgets: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """Return a description of every budget overrun or eagerly loaded deferred package."""
+    budgets = budgets if budgets is not None else BUDGETS
+    problems = []
+    for result in results:
+        module = result["module"]
+        budget = budgets.get(module)
+        if budget is not None and result["total_ms"] > budget:
+            problems.append(f"{module}: {result['total_ms']:.0f} ms > budget {budget:.0f} ms")
+        for pkg in result["deferred_loaded"]:
+            problems.append(f"{module}: eagerly imports {pkg}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS))
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N fresh interpreters")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on budget violations")
+    parser.add_argument("--out", default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    results = [measure_best(module, args.repeat) for module in args.modules]
+    report: Dict[str, Any] = {
+        "benchmark": "import_time",
+        "python": sys.version.split()[0],
+        "results": results,
+        "problems": check(results),
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    if args.check and report["problems"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark: LLM call success rate and tail latency under injected faults.
+
+Sends ``requests`` sequential chat completions to the fault-injecting
+`FakeOpenAIServer` (``--error-rate`` of 500s, ``--slow-rate`` of calls stalled
+by ``--slow-ms``) through a real ``ChatOpenAI`` client, once per resilience
+configuration:
+
+* ``plain``: no retries, no hedging
+* ``retry``: jittered exponential retry
+* ``retry+hedge``: retry plus a hedged second request after the recent p95
+
+Reports success rate and p50/p99 latency of the successful calls. The server
+RNG is seeded, so every configuration sees the same fault sequence per request
+number. Hedging after the p95 only trims tails rarer than 5%: keep
+``--slow-rate`` below 0.05 to see it.
+
+Usage (example):
+    python -m benchmarks.llm_resilience --requests 300 --error-rate 0.05 --slow-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import HumanMessage
+
+from benchmarks.fake_openai import FakeOpenAIServer
+from benchmarks.runtime_latency import _percentile
+from weaver.core.providers import HttpPoolConfig, ProviderRegistry
+from weaver.core.resilience import HedgePolicy, ResilientLLM, RetryPolicy
+
+CONFIGS: Dict[str, Dict[str, Optional[Any]]] = {
+    "plain": {"retry": RetryPolicy(max_attempts=1), "hedge": None},
+    "retry": {"retry": RetryPolicy(max_attempts=4, base_delay=0.01), "hedge": None},
+    "retry+hedge": {
+        "retry": RetryPolicy(max_attempts=4, base_delay=0.01),
+        "hedge": HedgePolicy(initial_delay=0.05, min_samples=20),
+    },
+}
+
+
+def run(
+    name: str,
+    *,
+    requests: int = 200,
+    latency: float = 0.002,
+    error_rate: float = 0.05,
+    slow_rate: float = 0.02,
+    slow_latency: float = 0.5,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Measure one resilience configuration from `CONFIGS`."""
+    server = FakeOpenAIServer(
+        latency=latency,
+        error_rate=error_rate,
+        slow_rate=slow_rate,
+        slow_latency=slow_latency,
+        seed=seed,
+    )
+    with server:
+        registry = ProviderRegistry(HttpPoolConfig())
+        chat = registry.chat_model("stand-in", api_key="sk-local", base_url=server.url)
+        llm = ResilientLLM(chat, seed=seed, **CONFIGS[name])
+        latencies: List[float] = []
+        failures = 0
+        for _ in range(requests):
+            start = time.perf_counter()
+            try:
+                llm.invoke([HumanMessage(content="hi")])
+            except Exception:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+        registry.close()
+    return {
+        "config": name,
+        "requests": requests,
+        "success_rate": 1 - failures / requests,
+        "p50_ms": statistics.median(latencies) * 1e3 if latencies else None,
+        "p99_ms": _percentile(latencies, 99) * 1e3 if latencies else None,
+        "server_requests": server.requests,
+        "retries": llm.stats.retries,
+        "hedges": llm.stats.hedges,
+        "hedge_wins": llm.stats.hedge_wins,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Base server latency")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Share of 500 responses")
+    parser.add_argument("--slow-rate", type=float, default=0.02, help="Share of stalled calls")
+    parser.add_argument("--slow-ms", type=float, default=500.0, help="Stall added to slow calls")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--configs", nargs="+", choices=list(CONFIGS), default=list(CONFIGS))
+    args = parser.parse_args()
+    results = [
+        run(
+            name,
+            requests=args.requests,
+            latency=args.latency_ms / 1e3,
+            error_rate=args.error_rate,
+            slow_rate=args.slow_rate,
+            slow_latency=args.slow_ms / 1e3,
+            seed=args.seed,
+        )
+        for name in args.configs
+    ]
+    print(json.dumps({"benchmark": "llm_resilience", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: incremental perspective views vs naive per-request filtering.
+
+Usage (example):
+    python -m benchmarks.perspective --participants 12 --turns 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from weaver.runtime.perspective import PerspectiveIndex, project_history
+
+
+def build_space(participants: int, turns: int, seed: int = 0) -> List[BaseMessage]:
+    """Synthesize a mediation history: each turn one user speaks, the agent replies
+    privately to the speaker and every fourth turn posts to the shared space."""
+    rng = random.Random(seed)
+    users = [f"user{i}" for i in range(participants)]
+    history: List[BaseMessage] = []
+    for turn in range(turns):
+        speaker = rng.choice(users)
+        history.append(
+            HumanMessage(content=f"t{turn}", id=f"h{turn}", additional_kwargs={"user_id": speaker})
+        )
+        calls = [{"name": "reply_privately", "args": {"recipient": speaker}, "id": f"p{turn}"}]
+        if turn % 4 == 0:
+            calls.append({"name": "post_to_shared", "args": {"content": "s"}, "id": f"s{turn}"})
+        history.append(AIMessage(content="", id=f"a{turn}", tool_calls=calls))
+        for call in calls:
+            history.append(
+                ToolMessage(
+                    content="ok", name=call["name"], tool_call_id=call["id"], id=f"r{call['id']}"
+                )
+            )
+        history.append(AIMessage(content="done", id=f"f{turn}"))
+    return history
+
+
+def run(participants: int, turns: int, repeat: int) -> Dict[str, Any]:
+    history = build_space(participants, turns)
+    users = [f"user{i}" for i in range(participants)]
+
+    index = PerspectiveIndex()
+    start = time.perf_counter()
+    index.observe("bench", history)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for user in users:
+            index.view("bench", user)
+    indexed_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for user in users:
+            project_history(history, user)
+    naive_s = time.perf_counter() - start
+
+    projections = repeat * len(users)
+    return {
+        "participants": participants,
+        "history_messages": len(history),
+        "index_build_ms": build_s * 1e3,
+        "indexed_us_per_projection": indexed_s / projections * 1e6,
+        "naive_us_per_projection": naive_s / projections * 1e6,
+        "speedup": naive_s / indexed_s if indexed_s else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--participants", type=int, nargs="+", default=[10, 25, 50])
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results = [run(p, args.turns, args.repeat) for p in args.participants]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: connection reuse and latency of shared vs per-graph LLM clients.
+
+Runs ``requests`` chat completions spread round-robin over ``clients`` client
+instances against the local `FakeOpenAIServer`, once with a private connection
+pool per instance (what a fresh ``ChatOpenAI`` per graph amounts to) and once
+with clients from a `ProviderRegistry`. Reports TCP connections opened and
+request latency percentiles.
+
+Usage (example):
+    python -m benchmarks.provider_pool --clients 16 --requests 400 --latency-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from benchmarks.fake_openai import FakeOpenAIServer
+from benchmarks.runtime_latency import _percentile
+from weaver.core.providers import HttpPoolConfig, ProviderRegistry
+
+
+def _private_clients(url: str, clients: int) -> List[Any]:
+    return [
+        ChatOpenAI(model=f"m{i}", api_key="sk-local", base_url=url, http_client=httpx.Client())
+        for i in range(clients)
+    ]
+
+
+def run(
+    mode: str, *, clients: int = 8, requests: int = 200, latency: float = 0.0
+) -> Dict[str, Any]:
+    """Measure one mode: ``"private"`` (pool per client) or ``"shared"`` (registry)."""
+    with FakeOpenAIServer(latency=latency) as server:
+        registry = ProviderRegistry(HttpPoolConfig())
+        if mode == "shared":
+            models = [
+                registry.chat_model(f"m{i}", api_key="sk-local", base_url=server.url)
+                for i in range(clients)
+            ]
+        else:
+            models = _private_clients(server.url, clients)
+        latencies: List[float] = []
+        for i in range(requests):
+            start = time.perf_counter()
+            models[i % clients].invoke("hi")
+            latencies.append(time.perf_counter() - start)
+        registry.close()
+        return {
+            "mode": mode,
+            "clients": clients,
+            "requests": requests,
+            "connections": server.connections,
+            "p50_ms": statistics.median(latencies) * 1e3,
+            "p99_ms": _percentile(latencies, 99) * 1e3,
+            "first_request_ms": latencies[0] * 1e3,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=8, help="Client instances (graphs)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server latency per call")
+    args = parser.parse_args()
+    results = [
+        run(mode, clients=args.clients, requests=args.requests, latency=args.latency_ms / 1e3)
+        for mode in ("private", "shared")
+    ]
+    print(json.dumps({"benchmark": "provider_pool", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
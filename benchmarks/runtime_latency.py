@@ -0,0 +1,280 @@
+"""Benchmark: WeaverRuntime.invoke latency, allocations and throughput.
+
+A deterministic fake chat model with configurable latency stands in for the LLM,
+so results measure the runtime (context preparation, graph loop, tool execution,
+memory append) plus a fixed, known model cost. Each axis - history length,
+spaces, participants per space, tool calls per turn - is varied on its own
+around a base scenario.
+
+Results are written as JSON; ``--baseline`` compares them to an earlier run and
+exits non-zero when a scenario regressed beyond ``--tolerance``.
+
+Usage (example):
+    python -m benchmarks.runtime_latency --out bench.json
+    python -m benchmarks.runtime_latency --out new.json --baseline bench.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Sequence
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import Runnable
+
+from benchmarks.perspective import build_space
+from weaver.core.graph import WeaverGraph
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.policy import MediationPolicy
+from weaver.runtime.runtime import WeaverRuntime
+
+AXES = ("history", "spaces", "participants", "tool_calls")
+BASE_SCENARIO = {"history": 100, "spaces": 4, "participants": 4, "tool_calls": 1}
+DEFAULT_SWEEP = {
+    "history": [0, 100, 1000],
+    "spaces": [1, 4, 32],
+    "participants": [2, 4, 16],
+    "tool_calls": [0, 1, 4],
+}
+# Lower is better for latencies/allocations, higher for throughput.
+COMPARED = {"p50_ms": -1, "p99_ms": -1, "throughput_rps": 1, "alloc_kib_per_invoke": -1}
+
+
+class FakeChatLLM(Runnable):
+    """Deterministic chat model: ``tool_calls`` tool calls, then a final answer.
+
+    On a fresh user message it requests ``tool_calls`` deliveries (private replies
+    to the sender, one shared post every other call); after tool results it
+    answers. Every call costs ``latency`` seconds (``time.sleep`` /
+    ``asyncio.sleep``).
+    """
+
+    def __init__(self, latency: float = 0.0, tool_calls: int = 0):
+        self.latency = latency
+        self.tool_calls = tool_calls
+        self._ids = itertools.count()
+
+    def bind_tools(self, tools):
+        return self
+
+    def _respond(self, messages) -> AIMessage:
+        last = messages[-1]
+        if self.tool_calls and isinstance(last, HumanMessage):
+            sender = last.additional_kwargs.get("user_id", "user")
+            calls = []
+            for i in range(self.tool_calls):
+                call_id = f"call{next(self._ids)}"
+                if i % 2:
+                    calls.append(
+                        {"name": "post_to_shared", "args": {"content": "s"}, "id": call_id}
+                    )
+                else:
+                    args = {"recipient": sender, "content": "p"}
+                    calls.append({"name": "reply_privately", "args": args, "id": call_id})
+            return AIMessage(content="", tool_calls=calls)
+        done = isinstance(last, ToolMessage)
+        return AIMessage(content="delivered" if done else "ok")
+
+    def invoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+def _runtime(scenario: Dict[str, int], latency: float) -> WeaverRuntime:
+    policy = MediationPolicy.default()
+    llm = FakeChatLLM(latency=latency, tool_calls=scenario["tool_calls"])
+    graph = WeaverGraph(system_prompt=policy.format_system_prompt(), llm=llm)
+    runtime = WeaverRuntime(policy, graph=graph)
+    # build_space emits ~5 messages per turn; prefill each space to ``history``.
+    turns = -(-scenario["history"] // 5)
+    for s in range(scenario["spaces"]):
+        prefill = build_space(scenario["participants"], turns, seed=s)[: scenario["history"]]
+        runtime.memory.append(f"space{s}", prefill)
+    return runtime
+
+
+def _events(scenario: Dict[str, int], requests: int) -> List[tuple]:
+    # Round-robin over spaces; speakers rotate within each space.
+    return [
+        (
+            f"space{i % scenario['spaces']}",
+            UserMessageEvent(
+                user_id=f"user{(i // scenario['spaces']) % scenario['participants']}",
+                content=f"request {i}",
+            ),
+        )
+        for i in range(requests)
+    ]
+
+
+def _percentile(samples: Sequence[float], q: float) -> float:
+    ordered = sorted(samples)
+    rank = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[rank]
+
+
+def run_scenario(
+    scenario: Dict[str, int],
+    *,
+    requests: int = 200,
+    latency: float = 0.0,
+    mode: str = "sync",
+    warmup: int = 5,
+) -> Dict[str, Any]:
+    """Measure one scenario.
+
+    ``mode="async"`` submits all requests at once via ``ainvoke`` (spaces run
+    concurrently, turns within a space serialize); ``"sync"`` calls ``invoke``
+    back to back.
+    """
+    runtime = _runtime(scenario, latency)
+    for space_id, event in _events(scenario, warmup):
+        runtime.invoke(space_id, event)
+
+    events = _events(scenario, requests)
+    latencies: List[float] = []
+    if mode == "async":
+
+        async def timed(space_id, event):
+            start = time.perf_counter()
+            await runtime.ainvoke(space_id, event)
+            latencies.append(time.perf_counter() - start)
+
+        async def drive():
+            await asyncio.gather(*(timed(space_id, event) for space_id, event in events))
+
+        start = time.perf_counter()
+        asyncio.run(drive())
+        wall = time.perf_counter() - start
+    else:
+        start = time.perf_counter()
+        for space_id, event in events:
+            t0 = time.perf_counter()
+            runtime.invoke(space_id, event)
+            latencies.append(time.perf_counter() - t0)
+        wall = time.perf_counter() - start
+
+    # Allocations are measured in a separate pass: tracemalloc skews latency.
+    sample = events[: max(1, requests // 10)]
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        start_mem, _ = tracemalloc.get_traced_memory()
+        for space_id, event in sample:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            runtime.invoke(space_id, event)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        end_mem, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        **scenario,
+        "mode": mode,
+        "requests": requests,
+        "llm_latency_ms": latency * 1e3,
+        "p50_ms": statistics.median(latencies) * 1e3,
+        "p99_ms": _percentile(latencies, 99) * 1e3,
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+        "throughput_rps": requests / wall if wall else float("inf"),
+        "alloc_kib_per_invoke": statistics.fmean(peaks) / 1024,  # peak working set
+        "retained_kib_per_invoke": (end_mem - start_mem) / 1024 / len(sample),
+    }
+
+
+def scenarios(sweep: Dict[str, Sequence[int]], base: Dict[str, int]) -> List[Dict[str, int]]:
+    """One-factor-at-a-time: vary each axis around ``base`` (duplicates removed)."""
+    out: List[Dict[str, int]] = []
+    for axis in AXES:
+        for value in sweep.get(axis, [base[axis]]):
+            scenario = {**base, axis: value}
+            if scenario not in out:
+                out.append(scenario)
+    return out
+
+
+def scenario_key(result: Dict[str, Any]) -> str:
+    return ",".join(f"{name}={result[name]}" for name in (*AXES, "mode", "llm_latency_ms"))
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[Dict[str, Any]]:
+    """Return one entry per metric that got worse than ``baseline`` by > ``tolerance``."""
+    previous = {scenario_key(r): r for r in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(scenario_key(result))
+        if old is None:
+            continue
+        for metric, direction in COMPARED.items():
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * direction  # negative = worse
+            if change < -tolerance:
+                regressions.append(
+                    {
+                        "scenario": scenario_key(result),
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "change": change,
+                    }
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake LLM latency per call")
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    for axis in AXES:
+        flag = "--" + axis.replace("_", "-")
+        parser.add_argument(flag, type=int, nargs="+", default=DEFAULT_SWEEP[axis])
+    parser.add_argument("--out", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=None, help="Compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    sweep = {axis: getattr(args, axis) for axis in AXES}
+    results = [
+        run_scenario(s, requests=args.requests, latency=args.latency_ms / 1e3, mode=args.mode)
+        for s in scenarios(sweep, BASE_SCENARIO)
+    ]
+    report: Dict[str, Any] = {
+        "benchmark": "runtime_latency",
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        report["regressions"] = compare(results, baseline, args.tolerance)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import Dict
 from langchain_core.chat_history import InMemoryChatMessageHistory
 from weaver.runtime.policy import MediationPolicy
-from weaver.runtime.runtime import WeaverRuntime
+from weaver.runtime.runtime import WeaverRuntime, load_env
 from weaver.models.events import UserMessageEvent
 
 session_store: Dict[str, InMemoryChatMessageHistory] = {}
@@ -34,6 +34,7 @@ def run_turn(runtime: WeaverRuntime, space_id: str, user_id: str, content: str):
 
 
 def main():
+    load_env()
     policy = MediationPolicy.default()
     runtime = WeaverRuntime(policy=policy)
     space_id = "counseling_123"
@@ -4,64 +4,92 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-from langchain_core.language_models.fake import FakeListLLM
 from langchain_core.runnables import Runnable
 from langchain_core.messages import AIMessage
+from weaver.core.llm_cache import llm_cache_mode, maybe_cache_llm
 import os
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
 
-def _get_llm():
+_FAKE_RESPONSES = [
+    "(基线) 建议达成中间价。",
+    "(基线) 双方可在此价格上继续。",
+    "(基线) 最终成交价建议为 100。",
+]
+
+
+def _get_llm(seed: int | None = None):
+    model = os.getenv("WEAVER_MODEL", "gpt-4o-mini")
     api_key = os.getenv("OPENAI_API_KEY")
     if api_key:
-        return ChatOpenAI(model=os.getenv("WEAVER_MODEL", "gpt-4o-mini"), api_key=api_key)
-    # fallback fake deterministic sequence
-    fake = FakeListLLM(
-        responses=[
-            "(基线) 建议达成中间价。",
-            "(基线) 双方可在此价格上继续。",
-            "(基线) 最终成交价建议为 100。",
-        ]
-    )
+        from weaver.core.providers import default_provider_registry
+        from weaver.core.resilience import maybe_resilient_llm
+
+        base_url = os.getenv("OPENAI_API_BASE") or os.getenv("OPENAI_BASE_URL")
+        llm = default_provider_registry.chat_model(model, api_key=api_key, base_url=base_url)
+        return maybe_cache_llm(maybe_resilient_llm(llm), model)
+    # fallback fake deterministic sequence; the seed picks where it starts so
+    # per-run instances vary without depending on run order
+    from langchain_core.language_models.fake import FakeListLLM
+
+    offset = random.Random(seed).randrange(len(_FAKE_RESPONSES)) if seed is not None else 0
+    fake = FakeListLLM(responses=_FAKE_RESPONSES[offset:] + _FAKE_RESPONSES[:offset])
 
     class _Wrap(Runnable):
         def invoke(self, messages, config=None):  # type: ignore[override]
             txt = fake.invoke(messages)
             return AIMessage(content=txt)
 
+    if llm_cache_mode() == "replay":
+        return maybe_cache_llm(_Wrap(), model)
     return _Wrap()
 
 
 class ZeroShotBaseline:
     """Simple baseline: concatenate all dialogue and ask LLM for final price."""
 
-    def __init__(self):
-        self.llm = _get_llm()
+    def __init__(self, seed: int | None = None):
+        self.llm = _get_llm(seed)
 
     def run(self, conversation: List[str]) -> Dict[str, Any]:
-        prompt = "\n".join(conversation) + "\n请直接给出一个双方都可能接受的单一成交价格数值。"
-        ai = self.llm.invoke([HumanMessage(content=prompt)])
+        ai = self.llm.invoke(self._messages(conversation))
         return {"final_price": ai.content, "raw": ai.content}
 
+    async def arun(self, conversation: List[str]) -> Dict[str, Any]:
+        ai = await self.llm.ainvoke(self._messages(conversation))
+        return {"final_price": ai.content, "raw": ai.content}
+
+    @staticmethod
+    def _messages(conversation: List[str]) -> List[HumanMessage]:
+        prompt = "\n".join(conversation) + "\n请直接给出一个双方都可能接受的单一成交价格数值。"
+        return [HumanMessage(content=prompt)]
+
 
 class BroadcastBaseline:
     """Baseline broadcasting all private info openly each turn."""
 
-    def __init__(self, buyer_secret: int, seller_secret: int):
-        self.llm = _get_llm()
+    def __init__(self, buyer_secret: int, seller_secret: int, seed: int | None = None):
+        self.llm = _get_llm(seed)
         self.buyer_secret = buyer_secret
         self.seller_secret = seller_secret
 
     def run(self, max_rounds: int = 5) -> Dict[str, Any]:
+        ai = self.llm.invoke(self._messages())
+        return {"final_price": ai.content, "raw": ai.content, "leaked": True}
+
+    async def arun(self, max_rounds: int = 5) -> Dict[str, Any]:
+        ai = await self.llm.ainvoke(self._messages())
+        return {"final_price": ai.content, "raw": ai.content, "leaked": True}
+
+    def _messages(self) -> List[HumanMessage]:
         conversation = [
             f"[公开] 买家最高预算: {self.buyer_secret}; 卖家最低心理价: {self.seller_secret}",
             "请给出一个可能的成交价格。",
         ]
-        ai = self.llm.invoke([HumanMessage(content="\n".join(conversation))])
-        return {"final_price": ai.content, "raw": ai.content, "leaked": True}
+        return [HumanMessage(content="\n".join(conversation))]
 
 
 __all__ = ["ZeroShotBaseline", "BroadcastBaseline"]
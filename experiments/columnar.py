@@ -0,0 +1,173 @@
+"""Columnar (NumPy) metrics over run records: rates, turn percentiles, bootstrap CIs.
+
+Usage (example):
+    python -m experiments.columnar experiments/out/results_weaver.jsonl --by buyer_max_budget
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from experiments.results import read_records
+
+# Run records use short field names; accept the NegotiationConfig names too.
+FIELD_ALIASES = {"buyer_max_budget": "buyer_max", "seller_min_price": "seller_min"}
+PERCENTILES = (50, 90, 99)
+
+
+class RunTable:
+    """Run records stored column-wise.
+
+    ``success`` / ``leakage`` are boolean columns and ``turns`` an integer column;
+    every other scalar field found in the records (e.g. ``buyer_max``,
+    ``seller_min``, ``max_rounds``) is kept as a column for `group_by`.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "RunTable":
+        rows: Dict[str, List[Any]] = {"success": [], "leakage": [], "turns": []}
+        extra: Dict[str, List[Any]] = {}
+        for n, record in enumerate(records):
+            rows["success"].append(bool(record.get("success")))
+            rows["leakage"].append(record.get("leakage", 0) > 0)
+            rows["turns"].append(record.get("turns", 0))
+            for key, value in record.items():
+                if key in rows or not isinstance(value, (int, float, str)):
+                    continue
+                column = extra.get(key)
+                if column is None:
+                    column = extra[key] = [None] * n  # backfill runs without the field
+                column.append(value)
+            for key, column in extra.items():
+                if len(column) < n + 1:
+                    column.append(None)
+        columns = {
+            "success": np.asarray(rows["success"], dtype=bool),
+            "leakage": np.asarray(rows["leakage"], dtype=bool),
+            "turns": np.asarray(rows["turns"], dtype=np.int64),
+        }
+        for key, column in extra.items():
+            columns[key] = np.asarray(column)
+        return cls(columns)
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> "RunTable":
+        return cls.from_records(read_records(path))
+
+    def __len__(self) -> int:
+        return len(self.columns["success"])
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[FIELD_ALIASES.get(name, name)]
+
+    def take(self, mask: np.ndarray) -> "RunTable":
+        return RunTable({key: column[mask] for key, column in self.columns.items()})
+
+    # ---------------- Metrics -----------------
+    def summary(self, *, n_boot: int = 2000, ci: float = 0.95, seed: int = 0) -> Dict[str, Any]:
+        """Point estimates, turn percentiles (successful runs) and bootstrap CIs."""
+        success, leakage, turns = (
+            self.columns["success"],
+            self.columns["leakage"],
+            self.columns["turns"],
+        )
+        n = len(self)
+        won = turns[success]
+        out: Dict[str, Any] = {
+            "runs": n,
+            "task_success_rate": float(success.mean()) if n else 0.0,
+            "information_leakage_rate": float(leakage.mean()) if n else 0.0,
+            "negotiation_efficiency": float(won.mean()) if won.size else 0.0,
+        }
+        for q, value in zip(PERCENTILES, _percentiles(won)):
+            out[f"turns_p{q}"] = value
+        if n and n_boot:
+            out.update(self._bootstrap(n_boot, ci, seed))
+        return out
+
+    def _bootstrap(self, n_boot: int, ci: float, seed: int) -> Dict[str, List[float | None]]:
+        # Resampling n records with replacement only changes how often each distinct
+        # (success, leakage, turns) row is drawn, i.e. a multinomial over distinct
+        # rows. Drawing those counts for all replicates at once keeps memory at
+        # O(n_boot x distinct rows) instead of O(n_boot x n).
+        success, leakage, turns = (
+            self.columns["success"],
+            self.columns["leakage"],
+            self.columns["turns"],
+        )
+        n = len(self)
+        rows = np.stack([success, leakage, np.where(success, turns, 0)], axis=1).astype(np.int64)
+        distinct, counts = np.unique(rows, axis=0, return_counts=True)
+        rng = np.random.default_rng(seed)
+        weights = rng.multinomial(n, counts / n, size=n_boot)
+        successes = weights @ distinct[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            efficiency = (weights @ distinct[:, 2]) / successes
+        bounds = [50 * (1 - ci), 50 * (1 + ci)]
+        return {
+            "task_success_rate_ci": _interval(successes / n, bounds),
+            "information_leakage_rate_ci": _interval((weights @ distinct[:, 1]) / n, bounds),
+            "negotiation_efficiency_ci": _interval(efficiency, bounds),
+        }
+
+    def group_by(self, *keys: str, **summary_kwargs: Any) -> List[Dict[str, Any]]:
+        """One `summary` per distinct combination of ``keys`` (sorted by key values)."""
+        if not keys:
+            return [self.summary(**summary_kwargs)]
+        key_columns = [self.column(key) for key in keys]
+        _, first, inverse = np.unique(
+            np.rec.fromarrays(key_columns), return_index=True, return_inverse=True
+        )
+        groups = []
+        for group, row in enumerate(first):
+            values = {key: _scalar(column[row]) for key, column in zip(keys, key_columns)}
+            groups.append(
+                {**values, **self.take(inverse.ravel() == group).summary(**summary_kwargs)}
+            )
+        return groups
+
+
+def _percentiles(values: np.ndarray) -> Sequence[float | None]:
+    if not values.size:
+        return [None] * len(PERCENTILES)
+    return [float(v) for v in np.percentile(values, PERCENTILES)]
+
+
+def _interval(samples: np.ndarray, bounds: List[float]) -> List[float | None]:
+    samples = samples[~np.isnan(samples)]
+    if not samples.size:
+        return [None, None]
+    return [float(v) for v in np.percentile(samples, bounds)]
+
+
+def _scalar(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+__all__ = ["RunTable", "FIELD_ALIASES", "PERCENTILES"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("runs_file", help="JSONL run log written by experiments.runner")
+    parser.add_argument("--by", nargs="*", default=[], help="Group by these record fields")
+    parser.add_argument("--n-boot", type=int, default=2000, help="Bootstrap replicates")
+    parser.add_argument("--ci", type=float, default=0.95, help="Confidence level")
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap seed")
+    args = parser.parse_args()
+
+    table = RunTable.from_jsonl(Path(args.runs_file))
+    groups = table.group_by(*args.by, n_boot=args.n_boot, ci=args.ci, seed=args.seed)
+    print(json.dumps(groups, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -30,8 +30,56 @@ def negotiation_efficiency(runs: List[Dict[str, Any]]) -> float:
     return sum(successful_turn_counts) / len(successful_turn_counts)
 
 
+class RunningMetrics:
+    """Incremental counterpart of the functions above.
+
+    Feed run records one at a time with `update`; the properties equal what the
+    list-based functions return for all records seen so far, in O(1) memory.
+    """
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.successes = 0
+        self.leaks = 0
+        self.success_turns = 0
+        self.success_turn_runs = 0
+
+    def update(self, run: Dict[str, Any]) -> None:
+        self.runs += 1
+        if run.get("success"):
+            self.successes += 1
+            if "turns" in run:
+                self.success_turns += run["turns"]
+                self.success_turn_runs += 1
+        if run.get("leakage", 0) > 0:
+            self.leaks += 1
+
+    @property
+    def task_success_rate(self) -> float:
+        return self.successes / self.runs if self.runs else 0.0
+
+    @property
+    def information_leakage_rate(self) -> float:
+        return self.leaks / self.runs if self.runs else 0.0
+
+    @property
+    def negotiation_efficiency(self) -> float:
+        if not self.success_turn_runs:
+            return 0.0
+        return self.success_turns / self.success_turn_runs
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "task_success_rate": self.task_success_rate,
+            "information_leakage_rate": self.information_leakage_rate,
+            "negotiation_efficiency": self.negotiation_efficiency,
+            "completed_runs": self.runs,
+        }
+
+
 __all__ = [
     "task_success_rate",
     "information_leakage_rate",
     "negotiation_efficiency",
+    "RunningMetrics",
 ]
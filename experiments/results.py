@@ -0,0 +1,81 @@
+"""Append-only JSONL result log with resume support for the experiment runner."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Set
+
+from experiments.metrics import RunningMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def read_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the complete records of a JSONL log, skipping a torn trailing line."""
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping unreadable record in %s", path)
+                continue
+            if isinstance(record, dict) and "run_index" in record:
+                yield record
+
+
+class ResultLog:
+    """One JSONL line per finished run, flushed immediately.
+
+    With ``resume=True`` an existing log is kept: its run indices are reported by
+    ``completed`` and its records pre-load the running metrics. Otherwise the
+    log starts empty. Only aggregates are held in memory, never the runs.
+    """
+
+    def __init__(self, path: Path, *, resume: bool = False) -> None:
+        self.path = path
+        self.metrics = RunningMetrics()
+        self.completed: Set[int] = set()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and path.exists():
+            self._load()
+        else:
+            path.write_text("", encoding="utf-8")
+        self._file = path.open("a", encoding="utf-8")
+
+    def _load(self) -> None:
+        # Rewrite through a temp file so a line torn by a crash cannot be glued
+        # to the next appended record.
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as out:
+            for record in read_records(self.path):
+                if record["run_index"] in self.completed:
+                    continue
+                self._count(record)
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+    def _count(self, record: Dict[str, Any]) -> None:
+        self.completed.add(record["run_index"])
+        self.metrics.update(record)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._count(record)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ResultLog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+__all__ = ["ResultLog", "read_records"]
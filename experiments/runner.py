@@ -2,96 +2,227 @@
 
 Usage (example):
     python -m experiments.runner --config experiments/sample_config.json
+    python -m experiments.runner --workers 4 --concurrency 16 --seed 7
+    python -m experiments.runner --config sweep.json --resume
+
+Each finished run is appended to ``<out>/results_<agent>.jsonl`` right away;
+``results_<agent>.json`` holds the batch config and the running metrics.
+Grids of configs are run by ``python -m experiments.sweep``.
 """
 
 from __future__ import annotations
 
 import json
 import argparse
+import asyncio
+import hashlib
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
 
-from experiments.tasks.negotiation import NegotiationConfig, simulate_weaver_negotiation
-from experiments.metrics import (
-    task_success_rate,
-    information_leakage_rate,
-    negotiation_efficiency,
+from experiments.tasks.negotiation import (
+    NegotiationConfig,
+    asimulate_weaver_negotiation,
+    simulate_weaver_negotiation,
 )
+from experiments.results import ResultLog
 from experiments.baselines import ZeroShotBaseline, BroadcastBaseline
+from weaver.runtime.runtime import load_env
 
 
-def run_weaver(batch_cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
-    runs: List[Dict[str, Any]] = []
-    for _ in range(batch_cfg["runs"]):
-        cfg = NegotiationConfig(
-            buyer_max_budget=batch_cfg["buyer_max_budget"],
-            seller_min_price=batch_cfg["seller_min_price"],
-            max_rounds=batch_cfg.get("max_rounds", 8),
-        )
-        res = simulate_weaver_negotiation(cfg)
-        runs.append(res)
-    return runs
-
-
-def run_zero_shot(batch_cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
-    runs: List[Dict[str, Any]] = []
-    baseline = ZeroShotBaseline()
-    for _ in range(batch_cfg["runs"]):
-        convo = [
-            f"买家最高预算 {batch_cfg['buyer_max_budget']}",
-            f"卖家最低心理价 {batch_cfg['seller_min_price']}",
-            "请直接给出成交价。",
-        ]
-        r = baseline.run(convo)
-        # naive parse attempt
-        price = _extract_int(r["final_price"]) if r.get("final_price") else None
-        success = False
-        if (
-            price is not None
-            and batch_cfg["seller_min_price"] <= price <= batch_cfg["buyer_max_budget"]
-        ):
-            success = True
-        runs.append(
-            {
-                "success": success,
-                "agreement_price": price,
-                "turns": 1,
-                "history": convo,
-                "buyer_max": batch_cfg["buyer_max_budget"],
-                "seller_min": batch_cfg["seller_min_price"],
-                "leakage": 1,  # this baseline exposes values directly
-            }
-        )
-    return runs
-
-
-def run_broadcast(batch_cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
-    runs: List[Dict[str, Any]] = []
-    for _ in range(batch_cfg["runs"]):
-        baseline = BroadcastBaseline(
-            buyer_secret=batch_cfg["buyer_max_budget"],
-            seller_secret=batch_cfg["seller_min_price"],
-        )
-        r = baseline.run()
-        price = _extract_int(r["final_price"]) if r.get("final_price") else None
-        success = False
-        if (
-            price is not None
-            and batch_cfg["seller_min_price"] <= price <= batch_cfg["buyer_max_budget"]
-        ):
-            success = True
-        runs.append(
-            {
-                "success": success,
-                "agreement_price": price,
-                "turns": 1,
-                "history": [r["raw"]],
-                "buyer_max": batch_cfg["buyer_max_budget"],
-                "seller_min": batch_cfg["seller_min_price"],
-                "leakage": 1,
-            }
-        )
-    return runs
+def derive_seed(base_seed: int, index: int) -> int:
+    """Stable per-run seed: depends only on the batch seed and the run index."""
+    digest = hashlib.sha256(f"{base_seed}:{index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _negotiation_cfg(batch_cfg: Dict[str, Any]) -> NegotiationConfig:
+    return NegotiationConfig(
+        buyer_max_budget=batch_cfg["buyer_max_budget"],
+        seller_min_price=batch_cfg["seller_min_price"],
+        max_rounds=batch_cfg.get("max_rounds", 8),
+    )
+
+
+def _zero_shot_convo(batch_cfg: Dict[str, Any]) -> List[str]:
+    return [
+        f"买家最高预算 {batch_cfg['buyer_max_budget']}",
+        f"卖家最低心理价 {batch_cfg['seller_min_price']}",
+        "请直接给出成交价。",
+    ]
+
+
+def _broadcast_baseline(batch_cfg: Dict[str, Any], seed: int) -> BroadcastBaseline:
+    return BroadcastBaseline(
+        buyer_secret=batch_cfg["buyer_max_budget"],
+        seller_secret=batch_cfg["seller_min_price"],
+        seed=seed,
+    )
+
+
+def _baseline_record(batch_cfg: Dict[str, Any], r: Dict[str, Any], history: List[str]):
+    # naive parse attempt
+    price = _extract_int(r["final_price"]) if r.get("final_price") else None
+    success = False
+    if (
+        price is not None
+        and batch_cfg["seller_min_price"] <= price <= batch_cfg["buyer_max_budget"]
+    ):
+        success = True
+    return {
+        "success": success,
+        "agreement_price": price,
+        "turns": 1,
+        "history": history,
+        "buyer_max": batch_cfg["buyer_max_budget"],
+        "seller_min": batch_cfg["seller_min_price"],
+        "leakage": 1,  # baselines expose the private values directly
+    }
+
+
+def run_one(agent: str, batch_cfg: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Execute run ``index`` of a batch; the record depends only on its inputs."""
+    seed = derive_seed(batch_cfg.get("seed", 0), index)
+    if agent == "weaver":
+        record = simulate_weaver_negotiation(_negotiation_cfg(batch_cfg), seed=seed)
+    elif agent == "zero_shot":
+        convo = _zero_shot_convo(batch_cfg)
+        record = _baseline_record(batch_cfg, ZeroShotBaseline(seed=seed).run(convo), convo)
+    else:
+        r = _broadcast_baseline(batch_cfg, seed).run()
+        record = _baseline_record(batch_cfg, r, [r["raw"]])
+    return {"run_index": index, "seed": seed, **record}
+
+
+async def arun_one(agent: str, batch_cfg: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Async counterpart of `run_one`; identical records for identical inputs."""
+    seed = derive_seed(batch_cfg.get("seed", 0), index)
+    if agent == "weaver":
+        record = await asimulate_weaver_negotiation(_negotiation_cfg(batch_cfg), seed=seed)
+    elif agent == "zero_shot":
+        convo = _zero_shot_convo(batch_cfg)
+        r = await ZeroShotBaseline(seed=seed).arun(convo)
+        record = _baseline_record(batch_cfg, r, convo)
+    else:
+        r = await _broadcast_baseline(batch_cfg, seed).arun()
+        record = _baseline_record(batch_cfg, r, [r["raw"]])
+    return {"run_index": index, "seed": seed, **record}
+
+
+def iter_runs(
+    agent: str,
+    batch_cfg: Dict[str, Any],
+    *,
+    workers: int = 1,
+    concurrency: int = 1,
+    indices: Sequence[int] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield run records as they finish (completion order, see ``run_index``).
+
+    ``workers`` > 1 spreads runs over a process pool; ``concurrency`` > 1 keeps
+    that many runs in flight per process on the async path. Seeds derive from
+    ``batch_cfg["seed"]`` and the run index, so records do not depend on either.
+    """
+    if indices is None:
+        indices = range(batch_cfg["runs"])
+    indices = list(indices)
+    concurrency = max(1, concurrency)
+    if workers > 1 and len(indices) > 1:
+        # Chunks of ``concurrency`` runs: each fills one process's async capacity
+        # and finished chunks stream back while the others are still running.
+        chunks = [indices[i : i + concurrency] for i in range(0, len(indices), concurrency)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_chunk, agent, batch_cfg, chunk, concurrency) for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                for _, record in future.result():
+                    yield record
+    elif concurrency > 1:
+        yield from _iter_async(agent, batch_cfg, indices, concurrency)
+    else:
+        for index in indices:
+            yield run_one(agent, batch_cfg, index)
+
+
+def run_batch(
+    agent: str,
+    batch_cfg: Dict[str, Any],
+    *,
+    workers: int = 1,
+    concurrency: int = 1,
+    indices: Sequence[int] | None = None,
+) -> List[Dict[str, Any]]:
+    """Run a batch and return its records in run order (see `iter_runs`)."""
+    records = iter_runs(agent, batch_cfg, workers=workers, concurrency=concurrency, indices=indices)
+    return sorted(records, key=lambda record: record["run_index"])
+
+
+def _run_chunk(
+    agent: str, batch_cfg: Dict[str, Any], indices: Sequence[int], concurrency: int
+) -> List[Tuple[int, Dict[str, Any]]]:
+    if concurrency <= 1:
+        return [(i, run_one(agent, batch_cfg, i)) for i in indices]
+    return asyncio.run(_arun_chunk(agent, batch_cfg, indices, concurrency))
+
+
+async def _arun_chunk(
+    agent: str,
+    batch_cfg: Dict[str, Any],
+    indices: Sequence[int],
+    concurrency: int,
+    on_result: Callable[[Dict[str, Any]], None] | None = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def _one(index: int) -> Tuple[int, Dict[str, Any]]:
+        async with limiter:
+            record = await arun_one(agent, batch_cfg, index)
+        if on_result is not None:
+            on_result(record)
+        return index, record
+
+    return list(await asyncio.gather(*(_one(i) for i in indices)))
+
+
+_DONE = object()
+
+
+def _iter_async(
+    agent: str, batch_cfg: Dict[str, Any], indices: Sequence[int], concurrency: int
+) -> Iterator[Dict[str, Any]]:
+    # The event loop runs in a helper thread so records can be yielded to a plain
+    # (synchronous) consumer as soon as each run completes.
+    finished: queue.Queue = queue.Queue()
+
+    def _drive() -> None:
+        try:
+            asyncio.run(_arun_chunk(agent, batch_cfg, indices, concurrency, finished.put))
+        except BaseException as e:  # surfaced in the consuming thread
+            finished.put(e)
+        finished.put(_DONE)
+
+    thread = threading.Thread(target=_drive, name="experiment-runs", daemon=True)
+    thread.start()
+    while (item := finished.get()) is not _DONE:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+    thread.join()
+
+
+def run_weaver(batch_cfg: Dict[str, Any], **parallelism: int) -> List[Dict[str, Any]]:
+    return run_batch("weaver", batch_cfg, **parallelism)
+
+
+def run_zero_shot(batch_cfg: Dict[str, Any], **parallelism: int) -> List[Dict[str, Any]]:
+    return run_batch("zero_shot", batch_cfg, **parallelism)
+
+
+def run_broadcast(batch_cfg: Dict[str, Any], **parallelism: int) -> List[Dict[str, Any]]:
+    return run_batch("broadcast", batch_cfg, **parallelism)
 
 
 def _extract_int(text: str | None) -> int | None:
@@ -105,17 +236,44 @@ def _extract_int(text: str | None) -> int | None:
     return int(nums[0])
 
 
-def aggregate_and_write(tag: str, runs: List[Dict[str, Any]], out_dir: Path) -> Dict[str, Any]:
-    metrics = {
-        "task_success_rate": task_success_rate(runs),
-        "information_leakage_rate": information_leakage_rate(runs),
-        "negotiation_efficiency": negotiation_efficiency(runs),
-        "runs": runs,
-    }
-    out_dir.mkdir(parents=True, exist_ok=True)
-    with (out_dir / f"results_{tag}.json").open("w", encoding="utf-8") as f:
-        json.dump(metrics, f, ensure_ascii=False, indent=2)
-    return metrics
+def stream_and_write(
+    agent: str,
+    batch_cfg: Dict[str, Any],
+    out_dir: Path,
+    *,
+    resume: bool = False,
+    workers: int = 1,
+    concurrency: int = 1,
+) -> Dict[str, Any]:
+    """Run a batch, appending each record to ``results_<agent>.jsonl`` as it finishes.
+
+    With ``resume`` the existing log is kept and completed run indices are
+    skipped; metrics are running aggregates over old and new records alike.
+    """
+    summary_path = out_dir / f"results_{agent}.json"
+    config = {k: v for k, v in batch_cfg.items() if k != "runs"}
+    if resume and summary_path.exists():
+        previous = json.loads(summary_path.read_text("utf-8")).get("config")
+        if previous is not None and previous != config:
+            raise SystemExit(
+                f"--resume: config differs from the one recorded in {summary_path}: {previous}"
+            )
+    with ResultLog(out_dir / f"results_{agent}.jsonl", resume=resume) as log:
+        pending = [i for i in range(batch_cfg["runs"]) if i not in log.completed]
+        _write_summary(summary_path, config, log)
+        for record in iter_runs(
+            agent, batch_cfg, workers=workers, concurrency=concurrency, indices=pending
+        ):
+            log.write(record)
+        return _write_summary(summary_path, config, log)
+
+
+def _write_summary(path: Path, config: Dict[str, Any], log: ResultLog):
+    summary = {**log.metrics.as_dict(), "config": config, "runs_file": log.path.name}
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    return summary
 
 
 def main():
@@ -123,7 +281,14 @@ def main():
     parser.add_argument("--config", required=False, help="Path to JSON config.")
     parser.add_argument("--out", default="experiments/out", help="Output directory")
     parser.add_argument("--agent", choices=["weaver", "zero_shot", "broadcast"], default="weaver")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--concurrency", type=int, default=1, help="Async runs per worker")
+    parser.add_argument("--seed", type=int, default=None, help="Batch seed (overrides config)")
+    parser.add_argument(
+        "--resume", action="store_true", help="Keep existing results and skip completed runs"
+    )
     args = parser.parse_args()
+    load_env()
 
     if args.config:
         cfg = json.loads(Path(args.config).read_text("utf-8"))
@@ -136,23 +301,20 @@ def main():
             "max_rounds": 6,
         }
 
+    if args.seed is not None:
+        cfg["seed"] = args.seed
+
     out_dir = Path(args.out)
 
-    if args.agent == "weaver":
-        runs = run_weaver(cfg)
-    elif args.agent == "zero_shot":
-        runs = run_zero_shot(cfg)
-    else:
-        runs = run_broadcast(cfg)
-
-    metrics = aggregate_and_write(args.agent, runs, out_dir)
-    print(
-        json.dumps(
-            {"agent": args.agent, **metrics, "runs": "<omitted>"},
-            ensure_ascii=False,
-            indent=2,
-        )
+    metrics = stream_and_write(
+        args.agent,
+        cfg,
+        out_dir,
+        resume=args.resume,
+        workers=args.workers,
+        concurrency=args.concurrency,
     )
+    print(json.dumps({"agent": args.agent, **metrics}, ensure_ascii=False, indent=2))
 
 
 if __name__ == "__main__":
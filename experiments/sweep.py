@@ -0,0 +1,200 @@
+"""Parameter-grid sweeps over NegotiationConfig with per-cell memoization.
+
+Usage (example):
+    python -m experiments.sweep --agent weaver --runs 20 \\
+        --buyer-max 100:140:10 --seller-min 60,80,100 --max-rounds 4,8 --workers 4
+
+Ranges are ``start:stop:step`` (inclusive) or comma-separated values. Finished
+cells are memoized under ``<out>/cells/<config hash>.json``; re-running with a
+larger grid only runs the new cells. The hash also covers the LLM the runs use
+(``WEAVER_MODEL``, endpoint, live vs offline, cache mode), so switching models
+never reuses another model's cells. The consolidated table is written to
+``<out>/sweep_<agent>.csv`` (and ``.json``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from experiments.metrics import RunningMetrics
+from experiments.runner import iter_runs
+from weaver.core.llm_cache import llm_cache_mode
+from weaver.runtime.runtime import load_env
+
+logger = logging.getLogger(__name__)
+
+GRID_PARAMS = ("buyer_max_budget", "seller_min_price", "max_rounds")
+TABLE_COLUMNS = [
+    "agent",
+    *GRID_PARAMS,
+    "runs",
+    "task_success_rate",
+    "information_leakage_rate",
+    "negotiation_efficiency",
+    "config_hash",
+]
+
+
+def parse_range(spec: str) -> List[int]:
+    """``"100:140:10"`` -> [100, 110, ..., 140]; ``"60,80"`` -> [60, 80]."""
+    if ":" in spec:
+        parts = [int(p) for p in spec.split(":")]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        if step <= 0:
+            raise ValueError(f"Range step must be positive: {spec}")
+        return list(range(start, stop + 1, step))
+    return [int(p) for p in spec.split(",") if p.strip()]
+
+
+def grid(**ranges: Sequence[int]) -> List[Dict[str, int]]:
+    """Cartesian product of the given parameter ranges, in a stable order."""
+    names = [name for name in GRID_PARAMS if name in ranges]
+    return [dict(zip(names, values)) for values in itertools.product(*(ranges[n] for n in names))]
+
+
+def llm_identity() -> Dict[str, str]:
+    """The environment-configured model/provider settings that shape run results.
+
+    An unset ``WEAVER_MODEL`` stays empty: each agent's built-in default model is
+    then implied by the agent name. The API key itself is never included.
+    """
+    return {
+        "model": os.getenv("WEAVER_MODEL", ""),
+        "base_url": os.getenv("OPENAI_API_BASE") or os.getenv("OPENAI_BASE_URL") or "",
+        "provider": "openai" if os.getenv("OPENAI_API_KEY") else "offline",
+        "cache_mode": llm_cache_mode() or "",
+    }
+
+
+def config_hash(agent: str, cell_cfg: Dict[str, Any], llm: Optional[Dict[str, str]] = None) -> str:
+    """Content hash of everything that determines a cell's results.
+
+    ``llm`` defaults to the current `llm_identity`.
+    """
+    payload = {"agent": agent, "llm": llm if llm is not None else llm_identity(), **cell_cfg}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def run_cell(agent: str, cell_cfg: Dict[str, Any], concurrency: int = 1) -> Dict[str, Any]:
+    """Run every run of one grid cell and return its aggregate row."""
+    metrics = RunningMetrics()
+    for record in iter_runs(agent, cell_cfg, concurrency=concurrency):
+        metrics.update(record)
+    summary = metrics.as_dict()
+    return {
+        "agent": agent,
+        **{name: cell_cfg[name] for name in GRID_PARAMS},
+        "runs": summary["completed_runs"],
+        "task_success_rate": summary["task_success_rate"],
+        "information_leakage_rate": summary["information_leakage_rate"],
+        "negotiation_efficiency": summary["negotiation_efficiency"],
+        "config_hash": config_hash(agent, cell_cfg),
+    }
+
+
+def sweep(
+    agent: str,
+    cells: Sequence[Dict[str, int]],
+    out_dir: Path,
+    *,
+    runs: int,
+    seed: int = 0,
+    workers: int = 1,
+    concurrency: int = 1,
+) -> List[Dict[str, Any]]:
+    """Run all grid ``cells`` not memoized yet and return the full table (grid order).
+
+    Cells are scheduled across a process pool of ``workers``; each finished
+    cell is written to the memo directory right away, so an interrupted sweep
+    resumes where it stopped.
+    """
+    memo_dir = out_dir / "cells"
+    memo_dir.mkdir(parents=True, exist_ok=True)
+    configs = [{"runs": runs, "seed": seed, **cell} for cell in cells]
+    rows: Dict[str, Dict[str, Any]] = {}
+    todo: Dict[str, Dict[str, Any]] = {}
+    for cell_cfg in configs:
+        key = config_hash(agent, cell_cfg)
+        memo = memo_dir / f"{key}.json"
+        if memo.exists():
+            rows[key] = json.loads(memo.read_text("utf-8"))
+        else:
+            todo[key] = cell_cfg
+    logger.info("Sweep %s: %d cells memoized, %d to run", agent, len(rows), len(todo))
+
+    def _store(row: Dict[str, Any]) -> None:
+        memo = memo_dir / f"{row['config_hash']}.json"
+        tmp = memo.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(row, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(memo)
+        rows[row["config_hash"]] = row
+
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_cell, agent, cfg, concurrency) for cfg in todo.values()]
+            for future in as_completed(futures):
+                _store(future.result())
+    else:
+        for cell_cfg in todo.values():
+            _store(run_cell(agent, cell_cfg, concurrency))
+    return [rows[config_hash(agent, cfg)] for cfg in configs]
+
+
+def write_table(rows: List[Dict[str, Any]], out_dir: Path, agent: str) -> Path:
+    path = out_dir / f"sweep_{agent}.csv"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    (out_dir / f"sweep_{agent}.json").write_text(
+        json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--agent", choices=["weaver", "zero_shot", "broadcast"], default="weaver")
+    parser.add_argument("--buyer-max", required=True, help="buyer_max_budget range")
+    parser.add_argument("--seller-min", required=True, help="seller_min_price range")
+    parser.add_argument("--max-rounds", default="8", help="max_rounds range")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per grid cell")
+    parser.add_argument("--seed", type=int, default=0, help="Batch seed shared by all cells")
+    parser.add_argument("--out", default="experiments/out/sweep", help="Output directory")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (cells)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Async runs per cell")
+    args = parser.parse_args()
+    load_env()
+
+    cells = grid(
+        buyer_max_budget=parse_range(args.buyer_max),
+        seller_min_price=parse_range(args.seller_min),
+        max_rounds=parse_range(args.max_rounds),
+    )
+    out_dir = Path(args.out)
+    rows = sweep(
+        args.agent,
+        cells,
+        out_dir,
+        runs=args.runs,
+        seed=args.seed,
+        workers=args.workers,
+        concurrency=args.concurrency,
+    )
+    path = write_table(rows, out_dir, args.agent)
+    print(json.dumps({"agent": args.agent, "cells": len(rows), "table": str(path)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
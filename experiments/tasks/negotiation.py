@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import random
 
 from weaver.runtime.policy import MediationPolicy
@@ -18,11 +18,41 @@ class NegotiationConfig:
     max_rounds: int = 8
 
 
-def simulate_weaver_negotiation(cfg: NegotiationConfig) -> Dict[str, Any]:
-    policy = MediationPolicy.default()
-    runtime = WeaverRuntime(policy=policy)
-    space_id = f"neg_{random.randint(1,1_000_000)}"
+def simulate_weaver_negotiation(cfg: NegotiationConfig, seed: int | None = None) -> Dict[str, Any]:
+    """Run one negotiation through a fresh WeaverRuntime.
 
+    ``seed`` drives every random choice of the run (a private ``random.Random``),
+    so the same seed yields the same record regardless of run order or process.
+    """
+    runtime = WeaverRuntime(policy=MediationPolicy.default())
+    space_id = _space_id(seed)
+    events, history, agreement_price = _negotiation_script(cfg)
+    for event in events:
+        runtime.invoke(space_id, event)
+    return _result(cfg, history, agreement_price)
+
+
+async def asimulate_weaver_negotiation(
+    cfg: NegotiationConfig, seed: int | None = None
+) -> Dict[str, Any]:
+    """Async counterpart of `simulate_weaver_negotiation` (uses ``ainvoke``)."""
+    runtime = WeaverRuntime(policy=MediationPolicy.default())
+    space_id = _space_id(seed)
+    events, history, agreement_price = _negotiation_script(cfg)
+    for event in events:
+        await runtime.ainvoke(space_id, event)
+    return _result(cfg, history, agreement_price)
+
+
+def _space_id(seed: int | None) -> str:
+    return f"neg_{random.Random(seed).randint(1, 1_000_000)}"
+
+
+def _negotiation_script(
+    cfg: NegotiationConfig,
+) -> Tuple[List[UserMessageEvent], List[str], int | None]:
+    """Offers exchanged by both parties; returns (events, history, agreement_price)."""
+    events: List[UserMessageEvent] = []
     history: List[str] = []
     agreement_price: int | None = None
 
@@ -33,19 +63,13 @@ def simulate_weaver_negotiation(cfg: NegotiationConfig) -> Dict[str, Any]:
 
     for round_i in range(cfg.max_rounds):
         # Buyer turn
-        event_buyer = UserMessageEvent(
-            user_id="buyer",
-            content=f"我出价 {buyer_offer}，可以吗？",
-        )
-        runtime.invoke(space_id, event_buyer)
+        events.append(UserMessageEvent(user_id="buyer", content=f"我出价 {buyer_offer}，可以吗？"))
         history.append(f"buyer:{buyer_offer}")
 
         # Seller turn
-        event_seller = UserMessageEvent(
-            user_id="seller",
-            content=f"我希望 {seller_offer}，你能接受吗？",
+        events.append(
+            UserMessageEvent(user_id="seller", content=f"我希望 {seller_offer}，你能接受吗？")
         )
-        runtime.invoke(space_id, event_seller)
         history.append(f"seller:{seller_offer}")
 
         # Check overlap region -> agreement
@@ -60,6 +84,12 @@ def simulate_weaver_negotiation(cfg: NegotiationConfig) -> Dict[str, Any]:
         buyer_offer = max(cfg.seller_min_price, buyer_offer - 1)
         seller_offer = min(cfg.buyer_max_budget, seller_offer + 1)
 
+    return events, history, agreement_price
+
+
+def _result(
+    cfg: NegotiationConfig, history: List[str], agreement_price: int | None
+) -> Dict[str, Any]:
     success = agreement_price is not None
     return {
         "success": success,
@@ -72,4 +102,4 @@ def simulate_weaver_negotiation(cfg: NegotiationConfig) -> Dict[str, Any]:
     }
 
 
-__all__ = ["NegotiationConfig", "simulate_weaver_negotiation"]
+__all__ = ["NegotiationConfig", "simulate_weaver_negotiation", "asimulate_weaver_negotiation"]
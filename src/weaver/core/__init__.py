@@ -1,9 +1,63 @@
-from .graph import WeaverGraph, _should_continue_node
-from .chains import create_weaver_chain, create_state_adapter_runnable
+"""Core graph building blocks.
 
+Exports resolve lazily (PEP 562) so ``import weaver.core`` stays cheap; the
+submodule defining a name is imported on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chains import create_state_adapter_runnable, create_weaver_chain
+    from .graph import WeaverGraph, _should_continue_node
+    from .graph_cache import GraphCache, default_graph_cache
+    from .providers import HttpPoolConfig, ProviderRegistry, default_provider_registry
+    from .resilience import CircuitBreaker, HedgePolicy, ResilientLLM, RetryPolicy
+
+_EXPORTS: Dict[str, str] = {
+    "WeaverGraph": ".graph",
+    "_should_continue_node": ".graph",
+    "create_weaver_chain": ".chains",
+    "create_state_adapter_runnable": ".chains",
+    "GraphCache": ".graph_cache",
+    "default_graph_cache": ".graph_cache",
+    "HttpPoolConfig": ".providers",
+    "ProviderRegistry": ".providers",
+    "default_provider_registry": ".providers",
+    "ResilientLLM": ".resilience",
+    "RetryPolicy": ".resilience",
+    "HedgePolicy": ".resilience",
+    "CircuitBreaker": ".resilience",
+}
+
+# Spelled out (not ``list(_EXPORTS)``) so linters see the TYPE_CHECKING imports as used.
 __all__ = [
     "WeaverGraph",
     "_should_continue_node",
     "create_weaver_chain",
     "create_state_adapter_runnable",
+    "GraphCache",
+    "default_graph_cache",
+    "HttpPoolConfig",
+    "ProviderRegistry",
+    "default_provider_registry",
+    "ResilientLLM",
+    "RetryPolicy",
+    "HedgePolicy",
+    "CircuitBreaker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -15,6 +15,8 @@ from langchain_core.runnables import RunnableLambda
 from .graph import WeaverGraph
 from weaver.models.state import SpaceState
 
+_PASSTHROUGH_KEYS = ("max_steps", "deadline")
+
 
 def create_state_adapter_runnable() -> RunnableLambda:
     """Create a runnable that maps a public dict interface to SpaceState.
@@ -24,7 +26,9 @@ def create_state_adapter_runnable() -> RunnableLambda:
 
     Returns:
         RunnableLambda that when invoked returns a SpaceState dict with the
-        "input" key populated (other keys omitted until produced downstream).
+        "input" key populated. Invocation budget keys (``max_steps``,
+        ``deadline``) are passed through when present; other keys are omitted
+        until produced downstream.
     """
 
     def _map(payload: Dict[str, Any]) -> SpaceState:  # type: ignore[override]
@@ -36,7 +40,11 @@ def create_state_adapter_runnable() -> RunnableLambda:
                 "Adapter expected payload['input'] to be List[BaseMessage], got: "
                 f"{type(messages)}"
             )
-        return {"input": messages}  # type: ignore[return-value]
+        state: Dict[str, Any] = {"input": messages}
+        for key in _PASSTHROUGH_KEYS:
+            if payload.get(key) is not None:
+                state[key] = payload[key]
+        return state  # type: ignore[return-value]
 
     return RunnableLambda(_map)
 
@@ -9,22 +9,19 @@ from __future__ import annotations
 
 import os
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from langchain_openai import ChatOpenAI
-from langchain_core.language_models.fake import FakeListLLM
-from langchain_core.runnables import Runnable
-from langchain_core.messages import SystemMessage, AIMessage
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from langchain_core.tools import BaseTool
+from langchain_core.messages import SystemMessage, AIMessage, BaseMessage
 
 from weaver.models.state import SpaceState
-from dotenv import load_dotenv
 from weaver.building_blocks.tools import TOOLS
-from weaver.exceptions import ConfigurationError, ToolExecutionError
-
-# Load environment variables from a local .env file if present (Phase 2.2+ runtime convenience)
-load_dotenv()
+from weaver.core.llm_cache import llm_cache_mode, maybe_cache_llm
+from weaver.core.tool_executor import ConcurrentToolNode
+from weaver.exceptions import CircuitOpenError, ConfigurationError, ToolExecutionError
+from weaver.telemetry import record_llm_usage, telemetry_from_config
 
 logger = logging.getLogger(__name__)
 
@@ -35,82 +32,240 @@ DEFAULT_SYSTEM_PROMPT = (
     "balanced summaries to the shared space. Always be fair, factual, and "
     "emotionally intelligent."
 )
+# Run-config key for stored history that precedes the graph's own `input` messages
+# (set by checkpointed runtimes, which keep only the in-flight turn as graph state).
+HISTORY_CONFIG_KEY = "weaver_history"
 
 
 class WeaverGraph:
-    """Builds and compiles the LangGraph state machine for the agent."""
+    """Builds and compiles the LangGraph state machine for the agent.
+
+    The tool-bound LLM and the system message are built once and reused by every
+    agent step; assigning `system_prompt` or `tools` refreshes them. The LangGraph
+    app is compiled on first access to `app`, so LangGraph itself is only
+    imported once a graph actually runs; `compile` returns the app compiled with a
+    LangGraph checkpointer instead (see `weaver.runtime.checkpoint`). Tool calls
+    from one agent step run concurrently, each bounded by ``tool_timeout`` (or
+    its ``tool_timeouts`` override); failures come back as error tool messages.
+    """
 
-    def __init__(self, system_prompt: str | None = None, llm: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        system_prompt: str | None = None,
+        llm: Optional[Any] = None,
+        tools: Optional[Sequence[BaseTool]] = None,
+        tool_timeout: Optional[float] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+    ) -> None:
         # Allow injection (for tests) else configure from environment.
         if llm is None:
-            llm_model = os.getenv("WEAVER_MODEL", "gpt-5-mini")
-            api_key = os.getenv("OPENAI_API_KEY")  # rely on user environment
-            api_base = os.getenv("OPENAI_API_BASE") or os.getenv("OPENAI_BASE_URL")
-            if api_key:
-                try:
-                    extra_kwargs: Dict[str, Any] = {}
-                    if api_base:
-                        extra_kwargs["openai_api_base"] = api_base
-                    extra_kwargs["api_key"] = api_key
-                    llm = ChatOpenAI(model=llm_model, **extra_kwargs)
-                except Exception as e:  # pragma: no cover
-                    logger.warning(
-                        "Failed to initialize ChatOpenAI (%s); falling back to FakeListLLM",
-                        e,
-                    )
-                    llm = self._build_fallback_llm()
-            else:
+            llm = self.default_llm()
+        self._llm = llm  # type: ignore[assignment]
+        self._tools: List[BaseTool] = list(tools) if tools is not None else list(TOOLS)
+        self._tool_timeout = tool_timeout
+        self._tool_timeouts = dict(tool_timeouts or {})
+        self.system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
+        self._bound_llm = self._bind_tools()
+        self._app: Any = None
+        self._checkpointed: Dict[int, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def default_llm(cls) -> Any:
+        """Build the environment-configured LLM (ChatOpenAI, or the offline fallback).
+
+        When ``WEAVER_LLM_CACHE_DIR`` is set the client is wrapped in a response
+        cache; in replay mode no API key is needed at all. Only the process
+        environment is read: call `weaver.runtime.load_env` first to pick up a
+        ``.env`` file. Clients come from `default_provider_registry`, so graphs
+        configured alike share one client and its HTTP connection pool
+        (``langchain_openai`` is imported here, on first use). Calls are wrapped
+        with retries and a per-provider circuit breaker (`maybe_resilient_llm`).
+        """
+        llm_model = os.getenv("WEAVER_MODEL", "gpt-5-mini")
+        api_key = os.getenv("OPENAI_API_KEY")  # rely on user environment
+        api_base = os.getenv("OPENAI_API_BASE") or os.getenv("OPENAI_BASE_URL")
+        if api_key:
+            try:
+                from weaver.core.providers import default_provider_registry
+                from weaver.core.resilience import maybe_resilient_llm
+
+                llm = default_provider_registry.chat_model(
+                    llm_model, api_key=api_key, base_url=api_base
+                )
+                return maybe_cache_llm(maybe_resilient_llm(llm), llm_model)
+            except Exception as e:  # pragma: no cover
                 logger.warning(
-                    "OPENAI_API_KEY absent; using FakeListLLM fallback (set in .env or env vars to enable real LLM)."
+                    "Failed to initialize ChatOpenAI (%s); falling back to FakeListLLM",
+                    e,
                 )
-                llm = self._build_fallback_llm()
-        self._llm = llm  # type: ignore[assignment]
-        self._system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
-        self.app = self._build_graph()
+                return cls._build_fallback_llm()
+        if llm_cache_mode() == "replay":
+            # Recorded responses stand in for the real model; the fallback is never called.
+            return maybe_cache_llm(cls._build_fallback_llm(), llm_model)
+        logger.warning(
+            "OPENAI_API_KEY absent; using FakeListLLM fallback (set it in the environment, "
+            "or in .env loaded via weaver.runtime.load_env(), to enable the real LLM)."
+        )
+        return cls._build_fallback_llm()
+
+    @property
+    def llm(self) -> Any:
+        """The underlying (unbound) LLM, shared with auxiliary stages such as compaction."""
+        return self._llm
+
+    @property
+    def app(self) -> Any:
+        """The compiled LangGraph app (compiled lazily, recompiled when `tools` change)."""
+        if self._app is None:
+            self._app = self._build_graph()
+        return self._app
+
+    def compile(self, checkpointer: Optional[Any] = None) -> Any:
+        """The app compiled with ``checkpointer`` (cached per saver; `app` when None).
+
+        A checkpointed app persists graph state per ``configurable.thread_id``, so an
+        interrupted run can be resumed from its last completed step.
+        """
+        if checkpointer is None:
+            return self.app
+        entry = self._checkpointed.get(id(checkpointer))
+        if entry is None or entry[0] is not checkpointer:
+            entry = self._checkpointed[id(checkpointer)] = (
+                checkpointer,
+                self._build_graph(checkpointer),
+            )
+        return entry[1]
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system_prompt
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        self._system_prompt = value
+        self._system_message = SystemMessage(content=value)
+
+    @property
+    def tools(self) -> List[BaseTool]:
+        return list(self._tools)
+
+    @tools.setter
+    def tools(self, value: Sequence[BaseTool]) -> None:
+        # Tool schemas feed both the bound LLM and the ToolNode: rebind and recompile.
+        self._tools = list(value)
+        self._bound_llm = self._bind_tools()
+        self._app = None
+        self._checkpointed.clear()
+
+    def _bind_tools(self) -> Any:
+        try:
+            return self._llm.bind_tools(self._tools)
+        except Exception as e:
+            raise ConfigurationError(f"LLM does not support tool binding: {e}") from e
 
     # ---------------- Agent Node -----------------
-    def _agent_node(self, state: SpaceState) -> Dict[str, Any]:  # type: ignore[override]
+    def _agent_node(
+        self, state: SpaceState, config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:  # type: ignore[override]
         """Decide next action using the LLM bound with available tools.
 
         Returns a partial state update containing either a planned tool call(s)
-        or None signaling the loop should end.
+        or None signaling the loop should end. Once the invocation's step or time
+        budget is exhausted the LLM is called without tools to force a final answer.
         """
-        try:
-            bound_llm = self._llm.bind_tools(TOOLS)
-            messages = [SystemMessage(content=self._system_prompt)] + state.get("input", [])
-            response = bound_llm.invoke(messages)
-        except ConfigurationError:
-            raise
-        except Exception as e:  # pragma: no cover - defensive
-            logger.exception("LLM/tool invocation error")
-            raise ToolExecutionError(str(e)) from e
+        final = _budget_exhausted(state)
+        llm = self._llm if final else self._bound_llm
+        telemetry = telemetry_from_config(config)
+        history = _config_history(config)
+        with telemetry.span(
+            "agent", history_len=len(history) + len(state["input"]), final=final
+        ) as span:
+            try:
+                response = llm.invoke(self._agent_messages(state, final, history))
+            except (ConfigurationError, CircuitOpenError):
+                raise
+            except Exception as e:  # pragma: no cover - defensive
+                logger.exception("LLM/tool invocation error")
+                raise ToolExecutionError(str(e)) from e
+            if span.recording:
+                record_llm_usage(telemetry, span, response)
+        return self._agent_update(state, response, final)
+
+    async def _aagent_node(
+        self, state: SpaceState, config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """Async twin of `_agent_node`, used when the graph runs via ``ainvoke``."""
+        final = _budget_exhausted(state)
+        llm = self._llm if final else self._bound_llm
+        telemetry = telemetry_from_config(config)
+        history = _config_history(config)
+        with telemetry.span(
+            "agent", history_len=len(history) + len(state["input"]), final=final
+        ) as span:
+            try:
+                response = await llm.ainvoke(self._agent_messages(state, final, history))
+            except (ConfigurationError, CircuitOpenError):
+                raise
+            except Exception as e:  # pragma: no cover - defensive
+                logger.exception("LLM/tool invocation error")
+                raise ToolExecutionError(str(e)) from e
+            if span.recording:
+                record_llm_usage(telemetry, span, response)
+        return self._agent_update(state, response, final)
+
+    def _agent_messages(
+        self, state: SpaceState, final: bool = False, history: Sequence[BaseMessage] = ()
+    ) -> List[BaseMessage]:
+        messages = [self._system_message, *history, *state.get("input", [])]
+        if final:
+            messages.append(_FINAL_ANSWER_MESSAGE)
+        return messages
+
+    @staticmethod
+    def _agent_update(state: SpaceState, response: Any, final: bool = False) -> Dict[str, Any]:
         if not isinstance(response, AIMessage):
             logger.warning("Agent response not AIMessage: %s", type(response))
             tool_calls = None
+        elif final and response.tool_calls:
+            # Never leave unanswered tool calls in history when the loop is cut off.
+            response = AIMessage(content=response.content, id=response.id)
+            tool_calls = None
         else:
             tool_calls = response.tool_calls or None
         return {
             "input": [response],  # append AI message to history
             "action_to_execute": tool_calls,
+            "steps": state.get("steps", 0) + 1,
+            "budget_exhausted": final,
         }
 
     # --------------- Graph Construction ---------------
-    def _build_graph(self):
+    def _build_graph(self, checkpointer: Optional[Any] = None):
+        from langgraph.graph import END, StateGraph
+
         workflow = StateGraph(SpaceState)
-        workflow.add_node("agent", self._agent_node)
-        tool_node = ToolNode(TOOLS, messages_key="input")
-        workflow.add_node("tools", tool_node)
+        # Sync + async implementations so both ``invoke`` and ``ainvoke`` stay native.
+        workflow.add_node("agent", RunnableLambda(self._agent_node, afunc=self._aagent_node))
+        tool_node = ConcurrentToolNode(
+            self._tools,
+            messages_key="input",
+            default_timeout=self._tool_timeout,
+            timeouts=self._tool_timeouts,
+        )
+        workflow.add_node("tools", RunnableLambda(tool_node.invoke, afunc=tool_node.ainvoke))
 
         workflow.set_entry_point("agent")
         workflow.add_conditional_edges(
             "agent", _should_continue_node, {"tools": "tools", "end": END}
         )
         workflow.add_edge("tools", "agent")  # ReAct loop
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
 
     @staticmethod
     def _build_fallback_llm():
         """Construct a deterministic fallback LLM for offline / missing key scenarios."""
+        from langchain_core.language_models.fake import FakeListLLM
+
         base_fake = FakeListLLM(  # type: ignore[call-arg]
             responses=[
                 "(模拟) 我理解你在财务沟通上的压力。你可以进一步说明彼此的主要关切点吗？",
@@ -130,9 +285,35 @@ class WeaverGraph:
         return _WrappedFake()
 
 
+# --------------- Budget ---------------
+
+_FINAL_ANSWER_MESSAGE = SystemMessage(
+    content=(
+        "The step/time budget for this turn is exhausted. Do not call any tools; "
+        "reply to the user now with your best final answer."
+    )
+)
+
+
+def _budget_exhausted(state: SpaceState) -> bool:
+    """True if the upcoming agent step must be the last one of this invocation."""
+    max_steps = state.get("max_steps")
+    if max_steps is not None and state.get("steps", 0) + 1 >= max_steps:
+        return True
+    deadline = state.get("deadline")
+    return deadline is not None and time.time() >= deadline
+
+
 # --------------- Conditional Router ---------------
 
 
+def _config_history(config: Optional[RunnableConfig]) -> Sequence[BaseMessage]:
+    if not config:
+        return ()
+    history = (config.get("configurable") or {}).get(HISTORY_CONFIG_KEY)
+    return history if history is not None else ()
+
+
 def _should_continue_node(state: SpaceState) -> str:
     calls = state.get("action_to_execute")
     if calls:
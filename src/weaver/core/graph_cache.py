@@ -0,0 +1,100 @@
+"""Process-wide cache of compiled WeaverGraphs keyed by policy, tools and model.
+
+Compiling a `WeaverGraph` (tool binding, `StateGraph.compile()`) and creating an
+LLM client are the expensive parts of standing up a runtime. `GraphCache`
+shares one LLM client across graphs and returns the same compiled graph for the
+same ``(system prompt hash, tool set, model)`` so construction cost is paid once
+per distinct policy rather than once per space or experiment run.
+
+Compiled graphs are stateless between invocations (conversation state lives in
+`MemoryCoordinator`), which is what makes sharing them safe. Do not mutate
+``tools`` on a cached graph; request a graph with a different tool set instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Tuple
+
+from langchain_core.tools import BaseTool
+
+from weaver.building_blocks.tools import TOOLS
+from weaver.core.graph import WeaverGraph
+
+GraphKey = Tuple[str, Tuple[str, ...], str]
+
+
+def prompt_hash(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+
+
+def model_key(llm: Any) -> str:
+    """Identify an LLM client: its model name plus object identity."""
+    name = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    return f"{name}@{id(llm):x}"
+
+
+class GraphCache:
+    """LRU cache of compiled `WeaverGraph`s sharing a single LLM client.
+
+    Parameters:
+        llm: Shared LLM client; built lazily via `WeaverGraph.default_llm` if omitted.
+        maxsize: Maximum number of compiled graphs kept.
+    """
+
+    def __init__(self, llm: Optional[Any] = None, maxsize: int = 128) -> None:
+        self._llm = llm
+        self.maxsize = maxsize
+        self._graphs: "OrderedDict[GraphKey, WeaverGraph]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def llm(self) -> Any:
+        with self._lock:
+            if self._llm is None:
+                self._llm = WeaverGraph.default_llm()
+            return self._llm
+
+    def get(
+        self,
+        system_prompt: str,
+        tools: Optional[Sequence[BaseTool]] = None,
+        llm: Optional[Any] = None,
+    ) -> WeaverGraph:
+        """Return the compiled graph for this policy prompt / tool set / model."""
+        llm = llm if llm is not None else self.llm
+        tool_list = list(tools) if tools is not None else list(TOOLS)
+        key: GraphKey = (
+            prompt_hash(system_prompt),
+            tuple(t.name for t in tool_list),
+            model_key(llm),
+        )
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self.hits += 1
+                self._graphs.move_to_end(key)
+                return graph
+            self.misses += 1
+            graph = WeaverGraph(system_prompt=system_prompt, llm=llm, tools=tool_list)
+            self._graphs[key] = graph
+            if len(self._graphs) > self.maxsize:
+                self._graphs.popitem(last=False)
+            return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+
+default_graph_cache = GraphCache()
+
+
+__all__ = ["GraphCache", "default_graph_cache", "prompt_hash", "model_key"]
@@ -0,0 +1,237 @@
+"""Content-addressed LLM response cache with memory + disk tiers and replay mode.
+
+`CachingLLM` wraps any chat model exposing ``invoke`` / ``ainvoke`` /
+``bind_tools``. Responses are keyed by a SHA-256 over the model name, the full
+prompt (system prompt included) and the bound tool schemas. Volatile fields
+(message ids, response/usage metadata) are excluded so identical prompts hash
+identically across processes.
+
+Modes:
+    * ``read_write`` (default): serve hits, call the model and record misses.
+    * ``replay``: serve hits only; a miss raises `CacheMissError`, guaranteeing
+      fully offline, deterministic runs.
+
+Configure from the environment with `maybe_cache_llm` (``WEAVER_LLM_CACHE_DIR``,
+``WEAVER_LLM_CACHE_MODE``), or wrap explicitly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from weaver.exceptions import CacheMissError, ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("read_write", "replay")
+_VOLATILE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+
+def model_name(llm: Any) -> str:
+    return str(
+        getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    )
+
+
+def _stable_message(message: BaseMessage) -> Dict[str, Any]:
+    payload = message_to_dict(message)
+    payload["data"] = {k: v for k, v in payload["data"].items() if k not in _VOLATILE_FIELDS}
+    return payload
+
+
+def tool_schemas(tools: Sequence[Any]) -> List[Dict[str, Any]]:
+    """OpenAI tool schemas of ``tools``, as hashed into cache keys."""
+    return [convert_to_openai_tool(t) for t in tools]
+
+
+def cache_key(
+    model: str,
+    messages: Sequence[BaseMessage],
+    tools: Sequence[Any] = (),
+    *,
+    schemas: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """SHA-256 over (model, prompt messages, tool schemas).
+
+    Pass precomputed ``schemas`` (from `tool_schemas`) instead of ``tools`` to
+    skip converting the tools on every call.
+    """
+    material = {
+        "model": model,
+        "messages": [_stable_message(m) for m in messages],
+        "tools": schemas if schemas is not None else tool_schemas(tools),
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier store: in-memory LRU in front of an optional on-disk directory.
+
+    Entries live on disk as ``<dir>/<key[:2]>/<key>.json`` written atomically, so
+    several worker processes can share one cache directory.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = 1024) -> None:
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, path)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.directory is None:
+            return None
+        try:
+            return json.loads(self._path(key).read_text("utf-8"))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:  # pragma: no cover - torn write from a crashed writer
+            logger.warning("Ignoring corrupt LLM cache entry %s", key)
+            return None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+
+class CachingLLM(Runnable):
+    """Chat-model wrapper serving responses from an `LLMResponseCache`."""
+
+    def __init__(
+        self,
+        llm: Any,
+        cache: LLMResponseCache,
+        mode: str = "read_write",
+        tools: Sequence[Any] = (),
+        model: Optional[str] = None,
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ConfigurationError(f"Unknown LLM cache mode: {mode}")
+        self.llm = llm
+        self.cache = cache
+        self.mode = mode
+        self.tools = list(tools)
+        self.model = model or model_name(llm)
+        # Converted once per binding; keys are built on every agent step.
+        self._schemas = tool_schemas(self.tools)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "CachingLLM":
+        bound = self.llm.bind_tools(tools, **kwargs) if self.mode != "replay" else self.llm
+        return CachingLLM(bound, self.cache, self.mode, tools=tools, model=self.model)
+
+    def invoke(self, messages: List[BaseMessage], config=None, **kwargs: Any):  # type: ignore[override]
+        key = cache_key(self.model, messages, schemas=self._schemas)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = self.llm.invoke(messages, config, **kwargs)
+        self._record(key, response)
+        return response
+
+    async def ainvoke(self, messages: List[BaseMessage], config=None, **kwargs: Any):  # type: ignore[override]
+        key = cache_key(self.model, messages, schemas=self._schemas)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await self.llm.ainvoke(messages, config, **kwargs)
+        self._record(key, response)
+        return response
+
+    def _lookup(self, key: str) -> Optional[BaseMessage]:
+        entry = self.cache.get(key)
+        if entry is None:
+            if self.mode == "replay":
+                raise CacheMissError(f"No recorded LLM response for key {key[:12]} (replay mode)")
+            return None
+        # Fresh object without an id: message identity belongs to the conversation.
+        return messages_from_dict([entry])[0]
+
+    def _record(self, key: str, response: Any) -> None:
+        if isinstance(response, BaseMessage):
+            self.cache.put(key, _stable_message(response))
+
+
+def llm_cache_mode() -> Optional[str]:
+    """Return the configured cache mode, or None when caching is disabled."""
+    if not os.getenv("WEAVER_LLM_CACHE_DIR"):
+        return None
+    return os.getenv("WEAVER_LLM_CACHE_MODE", "read_write")
+
+
+def maybe_cache_llm(llm: Any, model: Optional[str] = None) -> Any:
+    """Wrap ``llm`` with a disk-backed `CachingLLM` if configured via environment.
+
+    ``WEAVER_LLM_CACHE_DIR`` enables caching; ``WEAVER_LLM_CACHE_MODE`` selects
+    ``read_write`` (default) or ``replay``. One cache instance is shared per
+    directory within the process. ``model`` overrides the name used in cache
+    keys (needed when replaying offline with a stand-in ``llm``).
+    """
+    mode = llm_cache_mode()
+    if mode is None:
+        return llm
+    directory = os.environ["WEAVER_LLM_CACHE_DIR"]
+    with _shared_lock:
+        cache = _shared_caches.get(directory)
+        if cache is None:
+            cache = _shared_caches[directory] = LLMResponseCache(directory)
+    return CachingLLM(llm, cache, mode=mode, model=model)
+
+
+_shared_caches: Dict[str, LLMResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+__all__ = [
+    "CachingLLM",
+    "LLMResponseCache",
+    "cache_key",
+    "tool_schemas",
+    "maybe_cache_llm",
+    "llm_cache_mode",
+]
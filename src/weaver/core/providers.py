@@ -0,0 +1,193 @@
+"""Process-wide registry of LLM provider clients sharing pooled HTTP connections.
+
+Creating a ``ChatOpenAI`` per graph, runtime or experiment run gives each its own
+connection pool, so every one pays fresh TCP/TLS handshakes. `ProviderRegistry`
+hands out one chat client per ``(base_url, api key, model)`` and backs all
+clients of a ``base_url`` with a single pair of httpx clients (sync and async)
+built from one `HttpPoolConfig`.
+
+Async connections cannot cross event loops, so the async client keeps one
+pooled transport per running loop; short-lived ``asyncio.run`` calls (as in the
+experiment runner) therefore work without sharing sockets between loops.
+
+The pool is configured explicitly or from the environment:
+``WEAVER_HTTP_MAX_CONNECTIONS``, ``WEAVER_HTTP_MAX_KEEPALIVE``,
+``WEAVER_HTTP_KEEPALIVE_EXPIRY`` (seconds) and ``WEAVER_HTTP_TIMEOUT`` (seconds).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from weaver.exceptions import ConfigurationError
+
+ProviderKey = Tuple[str, str, str]
+
+_ENV_FIELDS = {
+    "max_connections": ("WEAVER_HTTP_MAX_CONNECTIONS", int),
+    "max_keepalive_connections": ("WEAVER_HTTP_MAX_KEEPALIVE", int),
+    "keepalive_expiry": ("WEAVER_HTTP_KEEPALIVE_EXPIRY", float),
+    "timeout": ("WEAVER_HTTP_TIMEOUT", float),
+}
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """Connection pool / keep-alive settings shared by sync and async clients."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.max_connections < 1:
+            raise ConfigurationError("max_connections must be >= 1")
+        if self.max_keepalive_connections < 0 or self.keepalive_expiry < 0:
+            raise ConfigurationError("keep-alive settings must be >= 0")
+        if self.timeout <= 0:
+            raise ConfigurationError("timeout must be > 0")
+
+    @classmethod
+    def from_env(cls) -> "HttpPoolConfig":
+        values: Dict[str, Any] = {}
+        for field, (name, kind) in _ENV_FIELDS.items():
+            raw = os.getenv(name)
+            if raw is None or raw == "":
+                continue
+            try:
+                values[field] = kind(raw)
+            except ValueError as e:
+                raise ConfigurationError(f"Invalid {name}={raw!r}: {e}") from e
+        return cls(**values)
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per running event loop."""
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._transports: "weakref.WeakKeyDictionary[Any, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = self._transports[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class ProviderRegistry:
+    """Shared chat clients keyed by ``(base_url, api key, model)``.
+
+    Parameters:
+        pool: HTTP pool settings; read via `HttpPoolConfig.from_env` on first use if omitted.
+    """
+
+    def __init__(self, pool: Optional[HttpPoolConfig] = None) -> None:
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._models: Dict[ProviderKey, Any] = {}
+        self._http: Dict[str, Tuple[httpx.Client, httpx.AsyncClient]] = {}
+
+    @property
+    def pool(self) -> HttpPoolConfig:
+        with self._lock:
+            if self._pool is None:
+                self._pool = HttpPoolConfig.from_env()
+            return self._pool
+
+    def chat_model(self, model: str, *, api_key: str, base_url: Optional[str] = None) -> Any:
+        """Return the shared ``ChatOpenAI`` for this endpoint, key and model.
+
+        SDK-level retries are off; wrap the client with
+        `weaver.core.resilience.maybe_resilient_llm` for retries and circuit breaking.
+        """
+        key: ProviderKey = (base_url or "", _key_digest(api_key), model)
+        pool = self.pool
+        with self._lock:
+            client = self._models.get(key)
+            if client is None:
+                http_client, http_async_client = self._http_clients(base_url or "", pool)
+                client = self._models[key] = ChatOpenAI(
+                    model=model,
+                    api_key=api_key,
+                    base_url=base_url,
+                    timeout=pool.timeout,
+                    max_retries=0,  # retried by weaver.core.resilience, not the SDK
+                    http_client=http_client,
+                    http_async_client=http_async_client,
+                )
+            return client
+
+    def http_clients(
+        self, base_url: Optional[str] = None
+    ) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """The (sync, async) httpx clients shared by every model of ``base_url``."""
+        pool = self.pool
+        with self._lock:
+            return self._http_clients(base_url or "", pool)
+
+    def _http_clients(
+        self, base_url: str, pool: HttpPoolConfig
+    ) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        clients = self._http.get(base_url)
+        if clients is None:
+            limits = pool.limits()
+            clients = self._http[base_url] = (
+                httpx.Client(limits=limits, timeout=pool.timeout),
+                httpx.AsyncClient(transport=_LoopLocalTransport(limits), timeout=pool.timeout),
+            )
+        return clients
+
+    def close(self) -> None:
+        """Drop all clients and close the sync connection pools."""
+        with self._lock:
+            http = list(self._http.values())
+            self._http.clear()
+            self._models.clear()
+        for sync_client, _ in http:
+            sync_client.close()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+def _key_digest(api_key: str) -> str:
+    # Keys are only compared, never needed back: keep secrets out of the registry keys.
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+default_provider_registry = ProviderRegistry()
+
+
+__all__ = ["HttpPoolConfig", "ProviderRegistry", "default_provider_registry"]
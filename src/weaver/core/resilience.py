@@ -0,0 +1,481 @@
+"""Retries, hedged requests and circuit breaking around LLM calls.
+
+`ResilientLLM` wraps any chat model exposing ``invoke`` / ``ainvoke`` /
+``bind_tools`` so one slow or failed upstream call does not fail a turn:
+
+* `RetryPolicy`: transient errors (timeouts, connection errors, 408/409/429,
+  5xx) are retried with exponential backoff and full jitter; anything else,
+  e.g. a bug in local code, is raised at once.
+* `HedgePolicy` (optional): when a call is still running after the recent p95
+  latency, an identical second request is sent and the first to succeed wins.
+* `CircuitBreaker`: one per provider. After ``failure_threshold`` consecutive
+  provider failures (timeouts, connection errors, 408/429, 5xx) calls fail fast
+  with `CircuitOpenError`; after ``reset_timeout`` seconds a single trial call
+  decides whether the circuit closes again. Client errors (4xx, validation,
+  context length) say nothing about provider health and never open it; a trial
+  that ends that way, or is cancelled, just frees the slot for the next one.
+
+Configure from the environment with `maybe_resilient_llm`
+(``WEAVER_LLM_MAX_ATTEMPTS``, ``WEAVER_LLM_HEDGE``,
+``WEAVER_LLM_BREAKER_THRESHOLD``, ``WEAVER_LLM_BREAKER_RESET``), or wrap
+explicitly.
+
+Hedged duplicates run in a fresh context without the caller's callbacks, so a
+streaming consumer only ever sees tokens of the first request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+
+from weaver.core.llm_cache import model_name
+from weaver.exceptions import CircuitOpenError, ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUS = {408, 409, 429}
+_TRANSIENT_STATUS = {408, 429}
+# Status-less transport failures of the OpenAI SDK / httpx, matched by name so
+# neither needs importing here.
+_TRANSIENT_TYPES = {"APIConnectionError", "APITimeoutError", "TimeoutException", "TransportError"}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt ``n`` waits U(0, base * 2**(n-1))."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ConfigurationError("max_attempts must be >= 1")
+
+    def delay(self, failures: int, rng: random.Random) -> float:
+        return rng.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** (failures - 1)))
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to send a hedged second request.
+
+    The delay is the ``quantile`` of the last ``window`` successful latencies
+    (never below ``min_delay``); until ``min_samples`` are recorded
+    ``initial_delay`` is used.
+    """
+
+    quantile: float = 0.95
+    initial_delay: float = 1.0
+    min_delay: float = 0.01
+    min_samples: int = 20
+    window: int = 200
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed -> open -> half-open (one trial) -> closed."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ConfigurationError("failure_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._trial or self._clock() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def before_call(self, provider: str = "") -> None:
+        """Raise `CircuitOpenError` unless a call may go out now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial and self._clock() - self._opened_at >= self.reset_timeout:
+                self._trial = True  # half-open: let exactly one call probe the provider
+                return
+        raise CircuitOpenError(f"Circuit open for provider {provider or '?'}; failing fast")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def release_trial(self) -> None:
+        """End a trial call that said nothing about provider health (state unchanged)."""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._trial:
+                    logger.warning("Circuit breaker opened after %d failures", self._failures)
+                self._opened_at = self._clock()
+                self._trial = False
+
+
+class LatencyWindow:
+    """Sliding window of recent call latencies (seconds)."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class ResilienceStats:
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    fast_failures: int = 0
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transient errors: provider failures (see `is_provider_failure`) and 409 conflicts."""
+    return is_provider_failure(exc) or _status(exc) in _RETRYABLE_STATUS
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """Errors that count against the circuit breaker: timeouts, connection errors, 408/429, 5xx."""
+    if isinstance(exc, (ConfigurationError, CircuitOpenError)):
+        return False
+    status = _status(exc)
+    if status is not None:
+        return status in _TRANSIENT_STATUS or status >= 500
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in _TRANSIENT_TYPES for cls in type(exc).__mro__)
+
+
+class ResilientLLM(Runnable):
+    """Chat-model wrapper adding retries, optional hedging and a circuit breaker."""
+
+    def __init__(
+        self,
+        llm: Any,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        provider: Optional[str] = None,
+        seed: Optional[int] = None,
+        _latencies: Optional[LatencyWindow] = None,
+        _stats: Optional[ResilienceStats] = None,
+    ) -> None:
+        self.llm = llm
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.hedge = hedge
+        self.breaker = breaker
+        self.provider = provider or provider_name(llm)
+        self._rng = random.Random(seed)
+        self.latencies = (
+            _latencies
+            if _latencies is not None
+            else LatencyWindow(hedge.window if hedge is not None else 200)
+        )
+        self.stats = _stats if _stats is not None else ResilienceStats()
+
+    @property
+    def model_name(self) -> str:
+        return model_name(self.llm)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ResilientLLM":
+        # Bound and unbound views share breaker, latency window and stats.
+        return ResilientLLM(
+            self.llm.bind_tools(tools, **kwargs),
+            retry=self.retry,
+            hedge=self.hedge,
+            breaker=self.breaker,
+            provider=self.provider,
+            seed=self._rng.randrange(2**32),
+            _latencies=self.latencies,
+            _stats=self.stats,
+        )
+
+    def hedge_delay(self) -> float:
+        assert self.hedge is not None
+        if len(self.latencies) < self.hedge.min_samples:
+            return self.hedge.initial_delay
+        observed = self.latencies.quantile(self.hedge.quantile) or self.hedge.initial_delay
+        return max(self.hedge.min_delay, observed)
+
+    # ---------------- sync -----------------
+    def invoke(self, messages: List[BaseMessage], config=None, **kwargs: Any):  # type: ignore[override]
+        self.stats.calls += 1
+        failures = 0
+        while True:
+            self._before_attempt()
+            try:
+                response = self._attempt(messages, config, kwargs)
+            except Exception as e:
+                failures = self._after_failure(e, failures)
+                time.sleep(self.retry.delay(failures, self._rng))
+                continue
+            except BaseException:
+                self._after_interrupt()
+                raise
+            self._after_success()
+            return response
+
+    def _attempt(self, messages, config, kwargs) -> Any:
+        if self.hedge is None:
+            return self._timed(self.llm.invoke, messages, config, kwargs)
+        ctx = contextvars.copy_context()
+        primary = _executor().submit(
+            ctx.run, self._timed, self.llm.invoke, messages, config, kwargs
+        )
+        try:
+            return primary.result(timeout=self.hedge_delay())
+        except FutureTimeoutError:
+            pass
+        self.stats.hedges += 1
+        hedge = _executor().submit(
+            contextvars.Context().run, self._timed, self.llm.invoke, messages, config, kwargs
+        )
+        return self._first_success([primary, hedge])
+
+    def _first_success(self, futures: List["Future[Any]"]) -> Any:
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    if future is futures[-1]:
+                        self.stats.hedge_wins += 1
+                    return future.result()
+                error = error or exc
+        assert error is not None
+        raise error
+
+    # ---------------- async -----------------
+    async def ainvoke(self, messages: List[BaseMessage], config=None, **kwargs: Any):  # type: ignore[override]
+        self.stats.calls += 1
+        failures = 0
+        while True:
+            self._before_attempt()
+            try:
+                response = await self._aattempt(messages, config, kwargs)
+            except Exception as e:
+                failures = self._after_failure(e, failures)
+                await asyncio.sleep(self.retry.delay(failures, self._rng))
+                continue
+            except BaseException:  # cancelled (e.g. by wait_for) or interrupted
+                self._after_interrupt()
+                raise
+            self._after_success()
+            return response
+
+    async def _aattempt(self, messages, config, kwargs) -> Any:
+        if self.hedge is None:
+            return await self._atimed(messages, config, kwargs)
+        primary = asyncio.ensure_future(self._atimed(messages, config, kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done:
+                self.stats.hedges += 1
+                hedge = self._atimed(messages, config, kwargs)
+                loop = asyncio.get_running_loop()
+                tasks.append(loop.create_task(hedge, context=contextvars.Context()))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # ---------------- shared -----------------
+    def _before_attempt(self) -> None:
+        self.stats.attempts += 1
+        if self.breaker is not None:
+            try:
+                self.breaker.before_call(self.provider)
+            except CircuitOpenError:
+                self.stats.fast_failures += 1
+                raise
+
+    def _after_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def _after_interrupt(self) -> None:
+        # A cancelled attempt says nothing about the provider; never strand the trial.
+        if self.breaker is not None:
+            self.breaker.release_trial()
+
+    def _after_failure(self, exc: Exception, failures: int) -> int:
+        """Account a failed attempt; re-raise ``exc`` unless another attempt is due."""
+        if self.breaker is not None:
+            if is_provider_failure(exc):
+                self.breaker.record_failure()
+            else:
+                # A client or local error (e.g. a 400 for a bad prompt) is no health signal.
+                self.breaker.release_trial()
+        failures += 1
+        if failures >= self.retry.max_attempts or not is_retryable(exc):
+            raise exc
+        self.stats.retries += 1
+        logger.warning(
+            "LLM call to %s failed (%s); retry %d/%d",
+            self.provider,
+            type(exc).__name__,
+            failures,
+            self.retry.max_attempts - 1,
+        )
+        return failures
+
+    def _timed(self, call: Callable[..., Any], messages, config, kwargs) -> Any:
+        start = time.perf_counter()
+        response = call(messages, config, **kwargs)
+        self.latencies.record(time.perf_counter() - start)
+        return response
+
+    async def _atimed(self, messages, config, kwargs) -> Any:
+        start = time.perf_counter()
+        response = await self.llm.ainvoke(messages, config, **kwargs)
+        self.latencies.record(time.perf_counter() - start)
+        return response
+
+
+def provider_name(llm: Any) -> str:
+    """``<base url>/<model>`` for OpenAI-style clients, else the model name."""
+    base = getattr(llm, "openai_api_base", None)
+    return f"{base}/{model_name(llm)}" if base else model_name(llm)
+
+
+def breaker_for(
+    provider: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """The process-wide breaker of ``provider`` (created on first use)."""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = _breakers[provider] = CircuitBreaker(failure_threshold, reset_timeout)
+        return breaker
+
+
+def maybe_resilient_llm(llm: Any) -> Any:
+    """Wrap ``llm`` in a `ResilientLLM` configured from the environment.
+
+    ``WEAVER_LLM_MAX_ATTEMPTS`` (default 3), ``WEAVER_LLM_HEDGE`` (``1`` enables
+    hedging), ``WEAVER_LLM_BREAKER_THRESHOLD`` (default 5, ``0`` disables the
+    breaker) and ``WEAVER_LLM_BREAKER_RESET`` (seconds, default 30). With one
+    attempt, no hedging and no breaker ``llm`` is returned unchanged.
+    """
+    attempts = _env_number("WEAVER_LLM_MAX_ATTEMPTS", int, 3)
+    hedge = os.getenv("WEAVER_LLM_HEDGE", "").lower() in ("1", "true", "yes")
+    threshold = _env_number("WEAVER_LLM_BREAKER_THRESHOLD", int, 5)
+    reset = _env_number("WEAVER_LLM_BREAKER_RESET", float, 30.0)
+    if attempts <= 1 and not hedge and threshold <= 0:
+        return llm
+    provider = provider_name(llm)
+    return ResilientLLM(
+        llm,
+        retry=RetryPolicy(max_attempts=max(1, attempts)),
+        hedge=HedgePolicy() if hedge else None,
+        breaker=breaker_for(provider, threshold, reset) if threshold > 0 else None,
+        provider=provider,
+    )
+
+
+def _env_number(name: str, kind: Callable[[str], Any], default: Any) -> Any:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return kind(raw)
+    except ValueError as e:
+        raise ConfigurationError(f"Invalid {name}={raw!r}: {e}") from e
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _breakers_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="weaver-llm")
+        return _hedge_pool
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+
+
+__all__ = [
+    "ResilientLLM",
+    "RetryPolicy",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "ResilienceStats",
+    "breaker_for",
+    "is_provider_failure",
+    "is_retryable",
+    "maybe_resilient_llm",
+    "provider_name",
+]
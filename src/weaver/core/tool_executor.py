@@ -0,0 +1,190 @@
+"""Concurrent tool execution node with per-tool timeouts.
+
+Replaces LangGraph's prebuilt ``ToolNode`` in `WeaverGraph`. When the model
+emits several tool calls in one ``AIMessage`` (e.g. one ``reply_privately`` per
+participant plus a ``post_to_shared``) they run concurrently, so the turn waits
+for the slowest tool rather than the sum of all of them. Each call is bounded by
+its timeout; failures and timeouts become ``ToolMessage``s tagged with
+``ToolExecutionError`` (``status="error"``) so the agent can react instead of
+the whole turn aborting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+
+from weaver.exceptions import ToolExecutionError
+from weaver.telemetry import telemetry_from_config
+
+logger = logging.getLogger(__name__)
+
+
+def tool_error_message(call: Dict[str, Any], detail: str) -> ToolMessage:
+    """Build the error observation returned to the agent for a failed call."""
+    return ToolMessage(
+        content=f"{ToolExecutionError.__name__}: {detail}",
+        name=call.get("name"),
+        tool_call_id=call.get("id") or "",
+        status="error",
+        additional_kwargs={"error_type": ToolExecutionError.__name__},
+    )
+
+
+class ConcurrentToolNode:
+    """Execute all tool calls of the latest AI message concurrently.
+
+    Parameters:
+        tools: Tools available to the agent.
+        messages_key: State key holding the message list.
+        default_timeout: Seconds allowed per call (None = unbounded).
+        timeouts: Per-tool overrides keyed by tool name.
+        max_workers: Thread pool size for the synchronous path.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        messages_key: str = "input",
+        default_timeout: Optional[float] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self.tools_by_name = {t.name: t for t in tools}
+        self.messages_key = messages_key
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def timeout_for(self, name: str, deadline: Optional[float] = None) -> Optional[float]:
+        """Per-call timeout, clipped to the invocation ``deadline`` (epoch seconds)."""
+        timeout = self.timeouts.get(name, self.default_timeout)
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.time())
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+    # ---------------- Sync path -----------------
+    def invoke(
+        self, state: Dict[str, Any], config: Optional[RunnableConfig] = None
+    ) -> Dict[str, List[ToolMessage]]:
+        calls = self._tool_calls(state)
+        telemetry = telemetry_from_config(config)
+        with telemetry.span("tools", tool_calls=len(calls)) as span:
+            results = self._run_all(calls, state.get("deadline"))
+            if span.recording:
+                _record_tools(telemetry, span, calls, results)
+        return {self.messages_key: results}
+
+    def _run_all(self, calls: List[Dict[str, Any]], deadline: Optional[float]) -> List[ToolMessage]:
+        if len(calls) == 1 and self.timeout_for(calls[0].get("name", ""), deadline) is None:
+            return [self._run_one(calls[0])]
+        executor = self._pool()
+        started = time.monotonic()
+        futures: List[Future] = [
+            executor.submit(copy_context().run, self._run_one, call) for call in calls
+        ]
+        results: List[ToolMessage] = []
+        for call, future in zip(calls, futures):
+            timeout = self.timeout_for(call.get("name", ""), deadline)
+            remaining = None if timeout is None else max(0.0, started + timeout - time.monotonic())
+            try:
+                results.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()  # threads cannot be interrupted; the result is discarded
+                results.append(self._timed_out(call, timeout))
+        return results
+
+    # ---------------- Async path -----------------
+    async def ainvoke(
+        self, state: Dict[str, Any], config: Optional[RunnableConfig] = None
+    ) -> Dict[str, List[ToolMessage]]:
+        calls = self._tool_calls(state)
+        deadline = state.get("deadline")
+        telemetry = telemetry_from_config(config)
+        with telemetry.span("tools", tool_calls=len(calls)) as span:
+            results = list(
+                await asyncio.gather(*(self._arun_one(call, deadline) for call in calls))
+            )
+            if span.recording:
+                _record_tools(telemetry, span, calls, results)
+        return {self.messages_key: results}
+
+    async def _arun_one(self, call: Dict[str, Any], deadline: Optional[float]) -> ToolMessage:
+        tool = self.tools_by_name.get(call.get("name", ""))
+        if tool is None:
+            return self._unknown(call)
+        timeout = self.timeout_for(tool.name, deadline)
+        try:
+            return await asyncio.wait_for(tool.ainvoke(self._as_tool_call(call)), timeout)
+        except asyncio.TimeoutError:
+            return self._timed_out(call, timeout)
+        except Exception as e:
+            return self._failed(call, e)
+
+    # ---------------- Helpers -----------------
+    def _run_one(self, call: Dict[str, Any]) -> ToolMessage:
+        tool = self.tools_by_name.get(call.get("name", ""))
+        if tool is None:
+            return self._unknown(call)
+        try:
+            return tool.invoke(self._as_tool_call(call))
+        except Exception as e:
+            return self._failed(call, e)
+
+    def _tool_calls(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        messages = state.get(self.messages_key) or []
+        last = messages[-1] if messages else None
+        if not isinstance(last, AIMessage):
+            return []
+        return list(last.tool_calls)
+
+    @staticmethod
+    def _as_tool_call(call: Dict[str, Any]) -> Dict[str, Any]:
+        # Invoking a tool with a ToolCall dict makes it return a ToolMessage.
+        return {**call, "type": "tool_call"}
+
+    @staticmethod
+    def _failed(call: Dict[str, Any], error: Exception) -> ToolMessage:
+        logger.warning("Tool %s failed: %s", call.get("name"), error)
+        return tool_error_message(call, f"{type(error).__name__}: {error}")
+
+    @staticmethod
+    def _timed_out(call: Dict[str, Any], timeout: Optional[float]) -> ToolMessage:
+        logger.warning("Tool %s timed out after %ss", call.get("name"), timeout)
+        return tool_error_message(call, f"timed out after {timeout}s")
+
+    @staticmethod
+    def _unknown(call: Dict[str, Any]) -> ToolMessage:
+        return tool_error_message(call, f"unknown tool {call.get('name')!r}")
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="weaver-tools"
+            )
+        return self._executor
+
+
+def _record_tools(telemetry, span, calls: List[Dict[str, Any]], results: List[ToolMessage]):
+    errors = 0
+    for call, result in zip(calls, results):
+        name = call.get("name", "")
+        telemetry.inc("weaver_tool_calls_total", tool=name)
+        if result.status == "error":
+            errors += 1
+            telemetry.inc("weaver_tool_errors_total", tool=name)
+    span.set(tool_errors=errors, tools=[call.get("name") for call in calls])
+
+
+__all__ = ["ConcurrentToolNode", "tool_error_message"]
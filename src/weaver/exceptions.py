@@ -30,10 +30,25 @@ class ToolExecutionError(WeaverError):
     """Raised when an underlying tool raises an exception."""
 
 
+class CacheMissError(ConfigurationError):
+    """Raised in replay-only LLM cache mode when a prompt has no recorded response."""
+
+
+class BackpressureError(WeaverError):
+    """Raised when an event is rejected or dropped because a space inbox is full."""
+
+
+class CircuitOpenError(WeaverError):
+    """Raised without calling the LLM while a provider's circuit breaker is open."""
+
+
 __all__ = [
     "WeaverError",
     "ConfigurationError",
     "PolicyError",
     "RuntimeInvocationError",
     "ToolExecutionError",
+    "BackpressureError",
+    "CacheMissError",
+    "CircuitOpenError",
 ]
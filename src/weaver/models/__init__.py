@@ -1,6 +1,13 @@
 from .events import UserMessageEvent
 from .actions import ReplyPrivateAction, PostToSharedAction, ActionUnion
 from .state import SpaceState
+from .stream import (
+    TokenDeltaEvent,
+    ToolCallEvent,
+    DeliveryEvent,
+    FinalResultEvent,
+    StreamEvent,
+)
 
 __all__ = [
     "UserMessageEvent",
@@ -8,4 +15,9 @@ __all__ = [
     "PostToSharedAction",
     "ActionUnion",
     "SpaceState",
+    "TokenDeltaEvent",
+    "ToolCallEvent",
+    "DeliveryEvent",
+    "FinalResultEvent",
+    "StreamEvent",
 ]
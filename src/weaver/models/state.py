@@ -17,11 +17,19 @@ class SpaceState(TypedDict, total=False):
         input: The running list of messages (User + AI + Tool) forming context.
         action_to_execute: Parsed tool calls chosen by the agent (or None).
         tool_output: Last tool invocation raw output returned to the agent.
+        steps: Agent (LLM) steps taken so far in this invocation.
+        max_steps: Optional cap on agent steps; the last one is forced tool-free.
+        deadline: Optional wall-clock deadline (``time.time()`` seconds).
+        budget_exhausted: Whether the final step was forced by the budget.
     """
 
     input: Annotated[List[BaseMessage], add]
     action_to_execute: Optional[Any]
     tool_output: Optional[str]
+    steps: int
+    max_steps: Optional[int]
+    deadline: Optional[float]
+    budget_exhausted: bool
 
 
 __all__ = ["SpaceState"]
@@ -0,0 +1,61 @@
+"""Typed events yielded by `WeaverRuntime.stream` / `astream`.
+
+Events are emitted as soon as they happen inside the ReAct loop so a front end
+can render partial output before the whole multi-step turn completes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TokenDeltaEvent(BaseModel):
+    """A fragment of assistant text produced by the LLM (streamed token delta).
+
+    Models that do not stream emit a single delta carrying the whole message.
+    """
+
+    type: Literal["token"] = Field(default="token", description="Event discriminator.")
+    content: str = Field(description="Text fragment to append to the current assistant message.")
+    message_id: Optional[str] = Field(default=None, description="Id of the message being built.")
+
+
+class ToolCallEvent(BaseModel):
+    """The agent decided to call a tool (emitted before the tool runs)."""
+
+    type: Literal["tool_call"] = Field(default="tool_call", description="Event discriminator.")
+    name: str = Field(description="Tool name, e.g. reply_privately / post_to_shared.")
+    args: Dict[str, Any] = Field(default_factory=dict, description="Arguments chosen by the model.")
+    call_id: Optional[str] = Field(default=None, description="Tool call identifier.")
+
+
+class DeliveryEvent(BaseModel):
+    """A message was delivered by ``reply_privately`` or ``post_to_shared``."""
+
+    type: Literal["delivery"] = Field(default="delivery", description="Event discriminator.")
+    channel: Literal["private", "shared"] = Field(description="Visibility of the delivery.")
+    recipient: Optional[str] = Field(
+        default=None, description="Target user for private deliveries (None when shared)."
+    )
+    content: str = Field(description="Delivered message body.")
+    call_id: Optional[str] = Field(default=None, description="Originating tool call identifier.")
+
+
+class FinalResultEvent(BaseModel):
+    """Terminal event carrying the same payload `WeaverRuntime.invoke` returns."""
+
+    type: Literal["final"] = Field(default="final", description="Event discriminator.")
+    result: Dict[str, Any] = Field(description="Invoke-compatible result dictionary.")
+
+
+StreamEvent = TokenDeltaEvent | ToolCallEvent | DeliveryEvent | FinalResultEvent
+
+__all__ = [
+    "TokenDeltaEvent",
+    "ToolCallEvent",
+    "DeliveryEvent",
+    "FinalResultEvent",
+    "StreamEvent",
+]
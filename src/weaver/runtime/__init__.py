@@ -1,11 +1,81 @@
-from .runtime import WeaverRuntime, configure_logging
-from .policy import BasePolicy, MediationPolicy
-from .coordinator import MemoryCoordinator
+"""Runtime facade, policies, memory and scheduling.
 
+Exports resolve lazily (PEP 562) so ``import weaver.runtime`` stays cheap; the
+submodule defining a name is imported on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import CacheStats, ResidentSpaceCache
+    from .checkpoint import memory_checkpointer, sqlite_checkpointer
+    from .compaction import HistoryCompactor, SummaryCheckpoint
+    from .context import ContextWindow, approximate_token_count
+    from .coordinator import MemoryCoordinator
+    from .policy import BasePolicy, MediationPolicy
+    from .runtime import WeaverRuntime, configure_logging, load_env
+    from .scheduler import OverflowPolicy, SpaceScheduler, SpaceStats
+    from .store import InMemoryStore, MemoryStore, SQLiteMemoryStore
+
+_EXPORTS: Dict[str, str] = {
+    "WeaverRuntime": ".runtime",
+    "configure_logging": ".runtime",
+    "load_env": ".runtime",
+    "BasePolicy": ".policy",
+    "MediationPolicy": ".policy",
+    "MemoryCoordinator": ".coordinator",
+    "ContextWindow": ".context",
+    "approximate_token_count": ".context",
+    "HistoryCompactor": ".compaction",
+    "SummaryCheckpoint": ".compaction",
+    "MemoryStore": ".store",
+    "InMemoryStore": ".store",
+    "SQLiteMemoryStore": ".store",
+    "ResidentSpaceCache": ".cache",
+    "CacheStats": ".cache",
+    "SpaceScheduler": ".scheduler",
+    "SpaceStats": ".scheduler",
+    "OverflowPolicy": ".scheduler",
+    "memory_checkpointer": ".checkpoint",
+    "sqlite_checkpointer": ".checkpoint",
+}
+
+# Spelled out (not ``list(_EXPORTS)``) so linters see the TYPE_CHECKING imports as used.
 __all__ = [
     "WeaverRuntime",
     "configure_logging",
+    "load_env",
     "BasePolicy",
     "MediationPolicy",
     "MemoryCoordinator",
+    "ContextWindow",
+    "approximate_token_count",
+    "HistoryCompactor",
+    "SummaryCheckpoint",
+    "MemoryStore",
+    "InMemoryStore",
+    "SQLiteMemoryStore",
+    "ResidentSpaceCache",
+    "CacheStats",
+    "SpaceScheduler",
+    "SpaceStats",
+    "OverflowPolicy",
+    "memory_checkpointer",
+    "sqlite_checkpointer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
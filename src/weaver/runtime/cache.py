@@ -0,0 +1,179 @@
+"""Resident-space cache bounding how many space histories stay in RAM.
+
+`ResidentSpaceCache` is a drop-in mapping for ``MemoryCoordinator``'s
+``space_histories``. It keeps spaces in LRU order and evicts the least recently
+used ones once a cap on the number of spaces and/or approximate bytes is
+exceeded (optionally also spaces idle for longer than ``ttl`` seconds). An
+``on_evict`` callback lets the owner write back dirty state before the history
+is dropped; it is reloaded from the store on next access.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from weaver.exceptions import ConfigurationError
+
+EvictionCallback = Callable[[str, List[BaseMessage]], None]
+
+# Rough fixed cost of a message object (pydantic model + dicts) beyond its text.
+MESSAGE_OVERHEAD_BYTES = 512
+
+
+def approximate_message_bytes(message: BaseMessage) -> int:
+    """Cheap estimate of the resident size of one message."""
+    size = MESSAGE_OVERHEAD_BYTES + sys.getsizeof(message.content)
+    if isinstance(message, AIMessage) and message.tool_calls:
+        size += len(json.dumps(message.tool_calls, default=str))
+    return size
+
+
+@dataclass
+class CacheStats:
+    """Counters for sizing workers (bytes are approximate)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident_spaces: int = 0
+    resident_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResidentSpaceCache(MutableMapping):
+    """LRU (+ optional TTL) mapping ``space_id -> history`` with a memory cap.
+
+    Parameters:
+        max_spaces: Maximum number of resident spaces.
+        max_bytes: Maximum approximate bytes across resident histories.
+        ttl: Evict spaces not accessed for this many seconds.
+        on_evict: Called as ``on_evict(space_id, history)`` before dropping a space.
+
+    Histories are append-only lists mutated in place by the coordinator; their
+    size is re-measured incrementally (only new tail messages) on each access.
+    """
+
+    def __init__(
+        self,
+        max_spaces: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        on_evict: Optional[EvictionCallback] = None,
+    ) -> None:
+        if max_spaces is None and max_bytes is None and ttl is None:
+            raise ConfigurationError("ResidentSpaceCache needs max_spaces, max_bytes or ttl")
+        if (max_spaces is not None and max_spaces < 1) or (max_bytes is not None and max_bytes < 1):
+            raise ConfigurationError("ResidentSpaceCache caps must be positive")
+        self.max_spaces = max_spaces
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[str, List[BaseMessage]]" = OrderedDict()
+        self._measured: Dict[str, Tuple[int, int]] = {}  # space -> (messages measured, bytes)
+        self._last_access: Dict[str, float] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ---------------- Mapping protocol -----------------
+    def __getitem__(self, space_id: str) -> List[BaseMessage]:
+        try:
+            history = self._data[space_id]
+        except KeyError:
+            self._misses += 1
+            raise
+        self._hits += 1
+        self._touch(space_id, history)
+        self._enforce(keep=space_id)
+        return history
+
+    def __setitem__(self, space_id: str, history: List[BaseMessage]) -> None:
+        if space_id in self._data:
+            self._forget(space_id)
+        self._data[space_id] = history
+        self._touch(space_id, history)
+        self._enforce(keep=space_id)
+
+    def __delitem__(self, space_id: str) -> None:
+        self._forget(space_id)
+        del self._data[space_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, space_id: object) -> bool:  # no hit/miss accounting
+        return space_id in self._data
+
+    # ---------------- Public helpers -----------------
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            resident_spaces=len(self._data),
+            resident_bytes=self._bytes,
+        )
+
+    def evict(self, space_id: str) -> None:
+        """Explicitly evict one space (invoking ``on_evict``)."""
+        history = self._data.get(space_id)
+        if history is None:
+            return
+        if self.on_evict is not None:
+            self.on_evict(space_id, history)
+        self._forget(space_id)
+        del self._data[space_id]
+        self._evictions += 1
+
+    # ---------------- Internals -----------------
+    def _touch(self, space_id: str, history: List[BaseMessage]) -> None:
+        self._data.move_to_end(space_id)
+        self._last_access[space_id] = time.monotonic()
+        measured, size = self._measured.get(space_id, (0, 0))
+        if measured < len(history):
+            grown = sum(approximate_message_bytes(m) for m in history[measured:])
+            self._measured[space_id] = (len(history), size + grown)
+            self._bytes += grown
+
+    def _forget(self, space_id: str) -> None:
+        _, size = self._measured.pop(space_id, (0, 0))
+        self._bytes -= size
+        self._last_access.pop(space_id, None)
+
+    def _enforce(self, keep: str) -> None:
+        if self.ttl is not None:
+            cutoff = time.monotonic() - self.ttl
+            for space_id in list(self._data):
+                if space_id == keep or self._last_access.get(space_id, 0) >= cutoff:
+                    break  # LRU order: the rest were accessed more recently
+                self.evict(space_id)
+        while len(self._data) > 1 and self._over_cap():
+            oldest = next(iter(self._data))
+            if oldest == keep:
+                break
+            self.evict(oldest)
+
+    def _over_cap(self) -> bool:
+        if self.max_spaces is not None and len(self._data) > self.max_spaces:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+
+__all__ = ["ResidentSpaceCache", "CacheStats", "approximate_message_bytes"]
@@ -0,0 +1,54 @@
+"""LangGraph checkpointers for `WeaverRuntime` (``checkpointer=...``).
+
+A checkpointed runtime keeps only the in-flight turn as graph state, in one
+LangGraph thread per space (``thread_id = space_id``). Stored history reaches
+the agent through the run config, and the thread is deleted once the turn is
+appended to memory. Checkpoint storage is therefore bounded by the size of one
+turn, not by the conversation, and a turn interrupted by an error can be
+finished with `WeaverRuntime.resume`.
+
+* `memory_checkpointer`: LangGraph's ``InMemorySaver`` (process-local).
+* `sqlite_checkpointer`: the maintained ``SqliteSaver`` of the optional
+  ``langgraph-checkpoint-sqlite`` package (``pip install "weaver-ai[checkpoint]"``),
+  so interrupted turns survive a restart.
+
+This module imports LangGraph; it is only loaded when checkpointing is used.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Union
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+from weaver.exceptions import ConfigurationError
+
+
+def memory_checkpointer() -> InMemorySaver:
+    """Process-local checkpointer (state is lost when the process exits)."""
+    return InMemorySaver()
+
+
+def sqlite_checkpointer(path: Union[str, Path]) -> BaseCheckpointSaver:
+    """Durable checkpointer in the SQLite file at ``path`` (WAL mode).
+
+    Wraps LangGraph's ``SqliteSaver`` so it also serves the runtime's async
+    paths: its blocking calls run in a worker thread instead of on the event loop.
+
+    Raises:
+        ConfigurationError: ``langgraph-checkpoint-sqlite`` is not installed.
+    """
+    try:
+        from weaver.runtime._sqlite_saver import ThreadedSqliteSaver
+    except ImportError as e:
+        raise ConfigurationError(
+            "sqlite_checkpointer needs langgraph-checkpoint-sqlite; "
+            'install it with pip install "weaver-ai[checkpoint]"'
+        ) from e
+    return ThreadedSqliteSaver(sqlite3.connect(str(path), check_same_thread=False))
+
+
+__all__ = ["memory_checkpointer", "sqlite_checkpointer"]
@@ -0,0 +1,206 @@
+"""Rolling hierarchical compaction of long space histories.
+
+Once the un-summarized part of a space history grows beyond ``threshold``
+messages, `HistoryCompactor` folds the oldest turns (everything except the
+``keep_recent`` tail) into a level-0 summary checkpoint. When ``fanout``
+checkpoints accumulate at one level they are folded again into a single
+checkpoint one level up, so the summary preamble itself stays bounded.
+
+Compaction runs on a background worker thread, never on the request path. The
+raw history is left untouched; `context` simply serves
+``[summary] + recent tail`` to `MemoryCoordinator.prepare_context`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from weaver.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY_PROMPT = (
+    "You compress a mediation conversation into a faithful running summary. "
+    "Preserve each participant's stated positions, concerns, commitments and open "
+    "questions, and note which information was shared privately versus publicly. "
+    "Do not invent facts. Answer with the summary only."
+)
+
+
+@dataclass
+class SummaryCheckpoint:
+    """A summary covering history messages up to ``covers_until`` (exclusive)."""
+
+    level: int
+    content: str
+    covers_until: int
+
+
+class HistoryCompactor:
+    """Background summarizer producing hierarchical checkpoints per space.
+
+    Parameters:
+        llm: Chat model with the same ``invoke(messages) -> AIMessage`` interface
+            used by `WeaverGraph` (the runtime injects the graph LLM if omitted).
+        threshold: Un-summarized message count that triggers a compaction.
+        keep_recent: Number of newest messages always left verbatim.
+        fanout: Checkpoints per level before they are folded one level up.
+        summary_prompt: System instruction for the summarization call.
+    """
+
+    def __init__(
+        self,
+        llm: Optional[Any] = None,
+        *,
+        threshold: int = 200,
+        keep_recent: int = 40,
+        fanout: int = 4,
+        summary_prompt: str = DEFAULT_SUMMARY_PROMPT,
+    ) -> None:
+        if keep_recent < 0 or threshold <= keep_recent or fanout < 2:
+            raise ConfigurationError(
+                "HistoryCompactor requires threshold > keep_recent >= 0 and fanout >= 2"
+            )
+        self.llm = llm
+        self.threshold = threshold
+        self.keep_recent = keep_recent
+        self.fanout = fanout
+        self.summary_prompt = summary_prompt
+        self._checkpoints: Dict[str, List[SummaryCheckpoint]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weaver-compactor")
+
+    # ---------------- Read path -----------------
+    def context(self, space_id: str, history: List[BaseMessage]) -> List[BaseMessage]:
+        """Return ``[summary preamble] + un-summarized tail`` for ``space_id``."""
+        with self._lock:
+            checkpoints = list(self._checkpoints.get(space_id, ()))
+        if not checkpoints:
+            return history
+        covered = checkpoints[-1].covers_until
+        preamble = SystemMessage(
+            content="Conversation summary so far:\n\n"
+            + "\n\n".join(cp.content for cp in checkpoints),
+            id=f"summary:{space_id}:{covered}:{len(checkpoints)}",
+            additional_kwargs={"weaver_summary": True},
+        )
+        return [preamble] + history[covered:]
+
+    def checkpoints(self, space_id: str) -> List[SummaryCheckpoint]:
+        with self._lock:
+            return list(self._checkpoints.get(space_id, ()))
+
+    # ---------------- Write path -----------------
+    def maybe_schedule(self, space_id: str, history: List[BaseMessage]) -> Optional[Future]:
+        """Schedule a background compaction if ``space_id`` crossed the threshold."""
+        with self._lock:
+            if space_id in self._pending:
+                return None
+            if len(history) - self._covered(space_id) <= self.threshold:
+                return None
+            future = self._executor.submit(self._compact_safely, space_id, history)
+            self._pending[space_id] = future
+        return future
+
+    def compact(self, space_id: str, history: List[BaseMessage]) -> bool:
+        """Synchronously fold old turns into a checkpoint; returns True if it did."""
+        if self.llm is None:
+            raise ConfigurationError("HistoryCompactor has no LLM configured")
+        covered = self._covered(space_id)
+        cut = self._cut_point(history, covered)
+        if cut <= covered:
+            return False
+        chunk = history[covered:cut]
+        text = self._summarize(self._transcript(chunk))
+        with self._lock:
+            levels = self._checkpoints.setdefault(space_id, [])
+            levels.append(SummaryCheckpoint(level=0, content=text, covers_until=cut))
+        self._fold(space_id)
+        return True
+
+    def wait_idle(self, timeout: Optional[float] = None) -> None:
+        """Block until all scheduled compactions have finished (tests, shutdown)."""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result(timeout=timeout)
+
+    def drop(self, space_id: str) -> None:
+        """Forget checkpoints for a space (e.g. evicted from memory)."""
+        with self._lock:
+            self._checkpoints.pop(space_id, None)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    # ---------------- Internals -----------------
+    def _compact_safely(self, space_id: str, history: List[BaseMessage]) -> bool:
+        try:
+            return self.compact(space_id, history)
+        except Exception:
+            logger.exception("History compaction failed space=%s", space_id)
+            return False
+        finally:
+            with self._lock:
+                self._pending.pop(space_id, None)
+
+    def _covered(self, space_id: str) -> int:
+        levels = self._checkpoints.get(space_id)
+        return levels[-1].covers_until if levels else 0
+
+    def _cut_point(self, history: List[BaseMessage], covered: int) -> int:
+        cut = len(history) - self.keep_recent
+        # Never start the verbatim tail with tool results detached from their AI call.
+        while covered < cut < len(history) and isinstance(history[cut], ToolMessage):
+            cut += 1
+        return cut
+
+    def _fold(self, space_id: str) -> None:
+        """Merge ``fanout`` same-level checkpoints into one at the next level."""
+        while True:
+            with self._lock:
+                levels = self._checkpoints[space_id]
+                if len(levels) < self.fanout:
+                    return
+                group = levels[-self.fanout :]
+                if any(cp.level != group[0].level for cp in group):
+                    return
+            merged = self._summarize(
+                "\n\n".join(f"[Summary part {i + 1}]\n{cp.content}" for i, cp in enumerate(group))
+            )
+            with self._lock:
+                levels = self._checkpoints[space_id]
+                del levels[-self.fanout :]
+                levels.append(
+                    SummaryCheckpoint(
+                        level=group[0].level + 1,
+                        content=merged,
+                        covers_until=group[-1].covers_until,
+                    )
+                )
+
+    def _summarize(self, transcript: str) -> str:
+        response = self.llm.invoke(
+            [SystemMessage(content=self.summary_prompt), HumanMessage(content=transcript)]
+        )
+        return str(getattr(response, "content", response))
+
+    @staticmethod
+    def _transcript(messages: List[BaseMessage]) -> str:
+        lines = []
+        for m in messages:
+            speaker = m.additional_kwargs.get("user_id") or m.type
+            if m.type == "tool":
+                speaker = f"tool:{getattr(m, 'name', None) or 'result'}"
+            lines.append(f"{speaker}: {m.content}")
+        return "\n".join(lines)
+
+
+__all__ = ["HistoryCompactor", "SummaryCheckpoint", "DEFAULT_SUMMARY_PROMPT"]
@@ -0,0 +1,140 @@
+"""Token-budgeted context window used by MemoryCoordinator.prepare_context.
+
+The window keeps the most recent slice of a space history that fits within a
+token budget, while honouring a few invariants the agent relies on:
+
+* leading ``SystemMessage``s in the history (e.g. summaries) are always kept;
+* the latest ``HumanMessage`` is always kept;
+* an ``AIMessage`` carrying tool calls is never separated from its
+  ``ToolMessage`` results (they are selected or dropped as one block).
+
+Token counts are cached per message id, so a turn only counts messages that
+were not seen before and selection walks back from the tail only as far as the
+budget allows.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from weaver.exceptions import ConfigurationError
+
+TokenCounter = Callable[[BaseMessage], int]
+
+# Rough per-message framing overhead (role, separators) in chat-completion APIs.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def approximate_token_count(message: BaseMessage) -> int:
+    """Cheap, dependency-free token estimate for a single message.
+
+    ASCII text is estimated at ~4 characters per token; other characters (e.g.
+    CJK) are counted as one token each. Tool call arguments are included.
+    """
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    if isinstance(message, AIMessage) and message.tool_calls:
+        content += json.dumps([tc.get("args", {}) for tc in message.tool_calls], ensure_ascii=False)
+    ascii_chars = sum(1 for ch in content if ord(ch) < 128)
+    return MESSAGE_OVERHEAD_TOKENS + (ascii_chars + 3) // 4 + (len(content) - ascii_chars)
+
+
+class ContextWindow:
+    """Select the newest messages of a history that fit in ``max_tokens``.
+
+    Parameters:
+        max_tokens: Total prompt budget for one agent step.
+        token_counter: Callable returning the token count of one message
+            (defaults to `approximate_token_count`).
+        reserved_tokens: Budget held back for content outside the history,
+            e.g. the incoming user message or completion headroom.
+        cache_size: Maximum number of per-message token counts kept.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        token_counter: Optional[TokenCounter] = None,
+        reserved_tokens: int = 0,
+        cache_size: int = 100_000,
+    ) -> None:
+        if max_tokens <= 0:
+            raise ConfigurationError("ContextWindow.max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.reserved_tokens = reserved_tokens
+        self._counter = token_counter or approximate_token_count
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._cache_size = cache_size
+        self._system_prompt_tokens = 0
+
+    def reserve_system_prompt(self, system_prompt: str) -> None:
+        """Account for the policy system prompt the graph prepends on every step."""
+        self._system_prompt_tokens = self._counter(SystemMessage(content=system_prompt))
+
+    @property
+    def budget(self) -> int:
+        """Tokens available to history messages."""
+        return self.max_tokens - self.reserved_tokens - self._system_prompt_tokens
+
+    def count(self, message: BaseMessage) -> int:
+        """Token count for ``message``, cached by message id."""
+        if not message.id:
+            return self._counter(message)
+        cached = self._cache.get(message.id)
+        if cached is None:
+            cached = self._counter(message)
+            self._cache[message.id] = cached
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return cached
+
+    def select(self, history: List[BaseMessage]) -> List[BaseMessage]:
+        """Return the subset of ``history`` (in order) that fits the budget."""
+        head = 0
+        remaining = self.budget
+        while head < len(history) and isinstance(history[head], SystemMessage):
+            remaining -= self.count(history[head])
+            head += 1
+        pinned = history[:head]
+
+        last_human = None
+        for idx in range(len(history) - 1, head - 1, -1):
+            if isinstance(history[idx], HumanMessage):
+                last_human = idx
+                break
+
+        tail_start = len(history)
+        end = len(history)
+        while end > head:
+            start = self._block_start(history, head, end)
+            cost = sum(self.count(m) for m in history[start:end])
+            forced = last_human is not None and start <= last_human < end
+            if cost > remaining and not forced:
+                break
+            remaining -= cost
+            tail_start = start
+            end = start
+        if last_human is not None and last_human < tail_start:
+            # Over budget before reaching it: keep the latest user message anyway.
+            return pinned + [history[last_human]] + history[tail_start:]
+        return pinned + history[tail_start:]
+
+    @staticmethod
+    def _block_start(history: List[BaseMessage], floor: int, end: int) -> int:
+        """Start index of the atomic block ending at ``end`` (exclusive)."""
+        start = end - 1
+        if not isinstance(history[start], ToolMessage):
+            return start
+        while start > floor and isinstance(history[start], ToolMessage):
+            start -= 1
+        owner = history[start]
+        if isinstance(owner, ToolMessage) or (isinstance(owner, AIMessage) and owner.tool_calls):
+            return start
+        # Tool results without a tool-calling owner: treat them as their own block.
+        return start + 1
+
+
+__all__ = ["ContextWindow", "TokenCounter", "approximate_token_count"]
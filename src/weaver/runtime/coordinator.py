@@ -2,37 +2,167 @@
 
 Phase 2.1 keeps logic minimal: gather history for a given space and optionally
 merge across participants if policy implies a "god view" (future flag).
+
+Every persisted message carries a stable ``id`` (assigned on append when the
+producer did not set one) so that re-submitting already known messages is a
+no-op instead of duplicating history.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, MutableMapping, Optional, Set
+from uuid import uuid4
+
 from langchain_core.messages import BaseMessage
 
+from weaver.exceptions import ConfigurationError
+from weaver.runtime.cache import ResidentSpaceCache
+from weaver.runtime.compaction import HistoryCompactor
+from weaver.runtime.context import ContextWindow
+from weaver.runtime.perspective import PerspectiveIndex
+from weaver.runtime.store import MemoryStore
+
+
+def new_message_id() -> str:
+    """Return a fresh, globally unique message identifier."""
+    return uuid4().hex
+
+
+def ensure_message_id(message: BaseMessage) -> str:
+    """Assign a stable id to ``message`` if it has none and return it."""
+    if not message.id:
+        message.id = new_message_id()
+    return message.id
+
 
 class MemoryCoordinator:
     """Coordinates retrieval/assembly of contextual message history.
 
     For v0.1 we assume a single shared history per space. Future versions can
     maintain per-user private threads and perform selective projection.
+
+    When a `ContextWindow` is configured, `prepare_context` returns only the
+    newest messages fitting its token budget; with a `HistoryCompactor`, older
+    turns are replaced by summary checkpoints. The full history is always kept.
+
+    A `PerspectiveIndex` is maintained alongside the history so `project` can
+    answer "what may user X see" without scanning the space.
+
+    With a `MemoryStore`, spaces are loaded lazily on first access (optionally
+    only the newest ``load_recent`` messages) and each appended batch is written
+    to the store in one transaction. With ``write_back=True`` batches are instead
+    buffered per space and written on `flush` or when a `ResidentSpaceCache`
+    evicts the space.
     """
 
-    def __init__(self, space_histories: Dict[str, List[BaseMessage]]):
+    def __init__(
+        self,
+        space_histories: MutableMapping[str, List[BaseMessage]],
+        context_window: Optional[ContextWindow] = None,
+        compactor: Optional[HistoryCompactor] = None,
+        store: Optional[MemoryStore] = None,
+        load_recent: Optional[int] = None,
+        write_back: bool = False,
+    ):
+        if store is None and (write_back or isinstance(space_histories, ResidentSpaceCache)):
+            raise ConfigurationError("Evicting or write-back memory requires a MemoryStore")
         self._space_histories = space_histories
+        self.store = store
+        self.load_recent = load_recent
+        self.write_back = write_back
+        self._dirty: Dict[str, List[BaseMessage]] = {}
+        if isinstance(space_histories, ResidentSpaceCache):
+            space_histories.on_evict = self._on_evict
+        self.context_window = context_window
+        self.compactor = compactor
+        self.perspectives = PerspectiveIndex()
+        # Lazily built per-space index of persisted message ids (dedupe on append).
+        self._space_ids: Dict[str, Set[str]] = {}
 
     def prepare_context(self, space_id: str, current_user_id: str) -> List[BaseMessage]:
         """Return the message list used as context for the next invocation.
 
         Parameters:
             space_id: Logical identifier for the collaborative space.
-            current_user_id: The user sending the new event (reserved for future use,
-                e.g. perspective filtering).
+            current_user_id: The user sending the new event. The agent mediates with
+                a full view, so this does not filter; see `project` for user views.
         """
-        return self._space_histories.setdefault(space_id, [])
+        history = self._history(space_id)
+        if self.compactor is not None:
+            history = self.compactor.context(space_id, history)
+        if self.context_window is None:
+            return history
+        return self.context_window.select(history)
+
+    def append(self, space_id: str, messages: Iterable[BaseMessage]) -> int:
+        """Persist ``messages`` for a space, skipping ones already stored.
+
+        Messages without an id are assigned one. Returns the number of messages
+        actually appended.
+        """
+        history = self._history(space_id)
+        known = self._known_ids(space_id, history)
+        fresh: List[BaseMessage] = []
+        for msg in messages:
+            msg_id = ensure_message_id(msg)
+            if msg_id in known:
+                continue
+            known.add(msg_id)
+            history.append(msg)
+            fresh.append(msg)
+        if fresh:
+            if self.write_back:
+                self._dirty.setdefault(space_id, []).extend(fresh)
+            elif self.store is not None:
+                self.store.append(space_id, fresh)
+            self.perspectives.observe(space_id, fresh)
+            if self.compactor is not None:
+                self.compactor.maybe_schedule(space_id, history)
+        return len(fresh)
+
+    def project(self, space_id: str, user_id: str) -> List[BaseMessage]:
+        """Return the messages ``user_id`` may see in ``space_id`` (history order).
+
+        Served from the incrementally maintained `PerspectiveIndex` in
+        O(view size); private replies to other participants are excluded.
+        """
+        history = self._history(space_id)
+        self._known_ids(space_id, history)
+        return self.perspectives.view(space_id, user_id)
+
+    def flush(self, space_id: Optional[str] = None) -> None:
+        """Write buffered (write-back) messages to the store."""
+        space_ids = [space_id] if space_id is not None else list(self._dirty)
+        for sid in space_ids:
+            pending = self._dirty.pop(sid, None)
+            if pending:
+                self.store.append(sid, pending)
+
+    def _on_evict(self, space_id: str, history: List[BaseMessage]) -> None:
+        # Write back, then drop every derived per-space structure; all of it is
+        # rebuilt from the store on next access.
+        self.flush(space_id)
+        self._space_ids.pop(space_id, None)
+        self.perspectives.drop(space_id)
+        if self.compactor is not None:
+            self.compactor.drop(space_id)
+
+    def _history(self, space_id: str) -> List[BaseMessage]:
+        history = self._space_histories.get(space_id)
+        if history is None:
+            # Lazy space loading: hit the store only on first access.
+            history = self.store.load(space_id, self.load_recent) if self.store else []
+            self._space_histories[space_id] = history
+        return history
 
-    def append(self, space_id: str, messages: List[BaseMessage]) -> None:
-        history = self._space_histories.setdefault(space_id, [])
-        history.extend(messages)
+    def _known_ids(self, space_id: str, history: List[BaseMessage]) -> Set[str]:
+        known = self._space_ids.get(space_id)
+        if known is None:
+            # Histories handed in pre-populated are indexed once, on first access.
+            known = {ensure_message_id(m) for m in history}
+            self._space_ids[space_id] = known
+            self.perspectives.observe(space_id, history)
+        return known
 
 
-__all__ = ["MemoryCoordinator"]
+__all__ = ["MemoryCoordinator", "new_message_id", "ensure_message_id"]
@@ -0,0 +1,129 @@
+"""Per-(space, user) perspective views for private/shared projection.
+
+Visibility rules (the audience of each message):
+
+* ``HumanMessage``: the sender only, unless ``additional_kwargs["visibility"]``
+  is ``"shared"`` or an explicit list of user ids;
+* ``AIMessage`` with tool calls: agent-internal (no participant sees it);
+* ``AIMessage`` without tool calls: the participant whose message started the turn;
+* ``ToolMessage`` from ``reply_privately``: the ``recipient`` of that call;
+* ``ToolMessage`` from ``post_to_shared``: everyone in the space;
+* everything else (system messages, other tools): agent-internal.
+
+`PerspectiveIndex` applies these rules incrementally: appending a message only
+touches the views of its audience, so projecting "what user X may see" costs
+O(view size) instead of a scan over the whole history.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+# Sentinel audiences
+EVERYONE: Optional[FrozenSet[str]] = None
+NOBODY: FrozenSet[str] = frozenset()
+
+
+@dataclass
+class _SpaceProjection:
+    """Incremental classification state for one space."""
+
+    shared: List[BaseMessage] = field(default_factory=list)
+    views: Dict[str, List[BaseMessage]] = field(default_factory=dict)
+    turn_owner: Optional[str] = None
+    pending_calls: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def audience(self, message: BaseMessage) -> Optional[FrozenSet[str]]:
+        if isinstance(message, HumanMessage):
+            sender = message.additional_kwargs.get("user_id")
+            self.turn_owner = sender
+            visibility = message.additional_kwargs.get("visibility")
+            if visibility == "shared":
+                return EVERYONE
+            if isinstance(visibility, (list, tuple, set, frozenset)):
+                return frozenset(visibility) | ({sender} if sender else set())
+            return frozenset({sender}) if sender else NOBODY
+        if isinstance(message, AIMessage):
+            if message.tool_calls:
+                for call in message.tool_calls:
+                    if call.get("id"):
+                        self.pending_calls[call["id"]] = call
+                return NOBODY
+            return frozenset({self.turn_owner}) if self.turn_owner else NOBODY
+        if isinstance(message, ToolMessage):
+            call = self.pending_calls.pop(message.tool_call_id, None) or {}
+            name = message.name or call.get("name")
+            if name == "post_to_shared":
+                return EVERYONE
+            if name == "reply_privately":
+                recipient = call.get("args", {}).get("recipient")
+                return frozenset({recipient}) if recipient else NOBODY
+        return NOBODY
+
+    def view(self, user_id: str) -> List[BaseMessage]:
+        view = self.views.get(user_id)
+        if view is None:
+            # A participant first seen now starts with the shared backlog.
+            view = self.views[user_id] = list(self.shared)
+        return view
+
+    def add(self, message: BaseMessage) -> None:
+        audience = self.audience(message)
+        if audience is EVERYONE:
+            self.shared.append(message)
+            for view in self.views.values():
+                view.append(message)
+            return
+        for user_id in audience:
+            self.view(user_id).append(message)
+
+
+class PerspectiveIndex:
+    """Incrementally maintained per-(space, user) visibility index."""
+
+    def __init__(self) -> None:
+        self._spaces: Dict[str, _SpaceProjection] = {}
+
+    def __contains__(self, space_id: str) -> bool:
+        return space_id in self._spaces
+
+    def observe(self, space_id: str, messages: Iterable[BaseMessage]) -> None:
+        """Route newly persisted ``messages`` (in history order) into the views."""
+        space = self._spaces.setdefault(space_id, _SpaceProjection())
+        for message in messages:
+            space.add(message)
+
+    def view(self, space_id: str, user_id: str) -> List[BaseMessage]:
+        """Messages ``user_id`` may see in ``space_id``, in history order."""
+        space = self._spaces.get(space_id)
+        if space is None:
+            return []
+        view = space.views.get(user_id)
+        return list(view if view is not None else space.shared)
+
+    def participants(self, space_id: str) -> List[str]:
+        space = self._spaces.get(space_id)
+        return list(space.views) if space else []
+
+    def drop(self, space_id: str) -> None:
+        self._spaces.pop(space_id, None)
+
+
+def project_history(history: Iterable[BaseMessage], user_id: str) -> List[BaseMessage]:
+    """Reference (naive) projection: classify the whole history for one user.
+
+    O(history) per call; `PerspectiveIndex.view` must return the same result.
+    """
+    space = _SpaceProjection()
+    visible: List[BaseMessage] = []
+    for message in history:
+        audience = space.audience(message)
+        if audience is EVERYONE or user_id in audience:
+            visible.append(message)
+    return visible
+
+
+__all__ = ["PerspectiveIndex", "project_history"]
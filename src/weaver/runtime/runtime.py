@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import asyncio
 import logging
+import time
 
 from langchain_core.messages import HumanMessage, BaseMessage
 
-from weaver.core.graph import WeaverGraph
+from weaver.core.graph import HISTORY_CONFIG_KEY, WeaverGraph
 from weaver.core.chains import create_state_adapter_runnable
+from weaver.core.graph_cache import GraphCache, default_graph_cache
 from weaver.models.events import UserMessageEvent
+from weaver.models.stream import FinalResultEvent, StreamEvent
 from weaver.runtime.policy import BasePolicy
-from weaver.runtime.coordinator import MemoryCoordinator
-from weaver.exceptions import RuntimeInvocationError, PolicyError
+from weaver.runtime.cache import ResidentSpaceCache
+from weaver.runtime.compaction import HistoryCompactor
+from weaver.runtime.context import ContextWindow
+from weaver.runtime.coordinator import MemoryCoordinator, new_message_id
+from weaver.runtime.store import MemoryStore
+from weaver.runtime.streaming import STREAM_MODES, StreamTranslator
+from weaver.exceptions import ConfigurationError, RuntimeInvocationError, PolicyError
+from weaver.telemetry import CONFIG_KEY as TELEMETRY_CONFIG_KEY
+from weaver.telemetry import NoopTelemetry, Telemetry, get_telemetry
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_RECURSION_LIMIT = 25
+
 
 def configure_logging(level: int = logging.INFO) -> None:
     """Configure a basic logging setup if not already configured.
@@ -32,6 +56,19 @@ def configure_logging(level: int = logging.INFO) -> None:
     )
 
 
+def load_env(path: Optional[str] = None, override: bool = False) -> bool:
+    """Load ``KEY=value`` pairs from a ``.env`` file into ``os.environ``.
+
+    Importing Weaver never reads ``.env`` on its own; applications, CLIs and
+    examples call this once at startup, before building graphs or runtimes.
+    Without ``path`` the nearest ``.env`` (searching upwards from the current
+    directory) is used. Returns True if any variable was set.
+    """
+    from dotenv import find_dotenv, load_dotenv
+
+    return load_dotenv(path or find_dotenv(usecwd=True), override=override)
+
+
 class WeaverRuntime:
     """High-level runtime facade exposing a simple invoke API.
 
@@ -39,57 +76,619 @@ class WeaverRuntime:
         1. Prepare context via MemoryCoordinator.
         2. Build or reuse a WeaverGraph bound with policy-derived system prompt.
         3. Execute graph (ReAct loop) with current + historical messages.
-        4. Append outputs back into memory.
+        4. Append only this turn's messages (user message + graph output) back into memory.
+
+    ``invoke`` is synchronous; ``ainvoke`` / ``abatch`` use the graph's async path
+    and serialize events per space. ``stream`` / ``astream`` yield typed events
+    (token deltas, tool calls, deliveries, final result) while the loop runs.
+
+    Graphs come from a shared `GraphCache` (the process-wide default unless one
+    is given), so runtimes and spaces with the same policy reuse one compiled
+    graph and LLM client. `set_policy` assigns a different policy to one space.
+
+    Each turn may carry a budget: ``max_steps`` caps agent (LLM) steps and
+    ``timeout`` (seconds) sets a wall-clock deadline. Both default to the values
+    given at construction and can be overridden per call. When the budget runs
+    out the agent is asked for a final answer without tools; the result reports
+    ``steps_used``, ``steps_remaining``, ``time_remaining`` and ``budget_exhausted``.
+
+    ``telemetry`` enables per-phase spans and metrics for this runtime (see
+    `weaver.telemetry`); without it the process-wide setting applies (off by default).
+
+    With a LangGraph ``checkpointer`` (see `weaver.runtime.checkpoint`) each turn
+    runs as the graph thread ``thread_id = space_id``. The thread holds only the
+    turn's own messages; stored history is handed to the agent through the run
+    config, and the thread is deleted once the turn is in memory. A turn
+    interrupted by an error can be finished with `resume`.
     """
 
-    def __init__(self, policy: BasePolicy, graph: WeaverGraph | None = None):
+    def __init__(
+        self,
+        policy: BasePolicy,
+        graph: WeaverGraph | None = None,
+        *,
+        context_window: ContextWindow | None = None,
+        compactor: HistoryCompactor | None = None,
+        store: MemoryStore | None = None,
+        residency: ResidentSpaceCache | None = None,
+        graph_cache: GraphCache | None = None,
+        max_steps: int | None = None,
+        timeout: float | None = None,
+        telemetry: Telemetry | None = None,
+        checkpointer: Any | None = None,
+    ):
         self.policy = policy
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.telemetry = telemetry
+        self.checkpointer = checkpointer
+        system_prompt = self._format_prompt(policy)
+        self._graph_cache = graph_cache if graph_cache is not None else default_graph_cache
+        self.graph = graph or self._graph_cache.get(system_prompt)
+        self._space_policies: Dict[str, Tuple[BasePolicy, WeaverGraph]] = {}
+        self._histories: MutableMapping[str, List[BaseMessage]] = (
+            residency if residency is not None else {}
+        )
+        if context_window is not None:
+            context_window.reserve_system_prompt(system_prompt)
+        if compactor is not None and compactor.llm is None:
+            compactor.llm = self.graph.llm  # summarize with the same model as the agent
+        self.memory = MemoryCoordinator(
+            self._histories, context_window=context_window, compactor=compactor, store=store
+        )
+        self._adapter = create_state_adapter_runnable()
+        self._chains: Dict[int, Tuple[Any, Any]] = {}
+        self._space_locks = _SpaceLocks()
+
+    # --------------- Policies ---------------
+    def set_policy(self, space_id: str, policy: BasePolicy) -> WeaverGraph:
+        """Serve ``space_id`` with ``policy`` instead of the runtime default.
+
+        The compiled graph comes from the shared cache and reuses this runtime's
+        LLM client, so many spaces/policies cost one compile per distinct policy.
+        """
+        graph = self._graph_cache.get(self._format_prompt(policy), llm=self.graph.llm)
+        self._space_policies[space_id] = (policy, graph)
+        return graph
+
+    def clear_policy(self, space_id: str) -> None:
+        self._space_policies.pop(space_id, None)
+
+    def policy_for(self, space_id: str) -> BasePolicy:
+        entry = self._space_policies.get(space_id)
+        return entry[0] if entry else self.policy
+
+    def graph_for(self, space_id: str) -> WeaverGraph:
+        entry = self._space_policies.get(space_id)
+        return entry[1] if entry else self.graph
+
+    @staticmethod
+    def _format_prompt(policy: BasePolicy) -> str:
         try:
-            system_prompt = policy.format_system_prompt()
+            return policy.format_system_prompt()
         except Exception as e:  # pragma: no cover - defensive
             raise PolicyError(f"Failed to format system prompt: {e}") from e
-        self.graph = graph or WeaverGraph(system_prompt=system_prompt)
-        self._histories: Dict[str, List[BaseMessage]] = {}
-        self.memory = MemoryCoordinator(self._histories)
-        # Compose adapter -> graph for convenience (mirrors Phase 1.3 chain factory)
-        adapter = create_state_adapter_runnable()
-        self._chain = adapter | self.graph.app
-
-    def invoke(self, space_id: str, event: UserMessageEvent):
+
+    def _app_for(self, space_id: str):
+        return self.graph_for(space_id).compile(self.checkpointer)
+
+    def _chain_for(self, space_id: str):
+        # Compose adapter -> graph (mirrors Phase 1.3 chain factory) once per compiled
+        # app; recomposed only when a graph recompiles, e.g. after its tool set changed.
+        app = self._app_for(space_id)
+        entry = self._chains.get(id(app))
+        if entry is None or entry[0] is not app:
+            entry = self._chains[id(app)] = (app, self._adapter | app)
+        return entry[1]
+
+    def invoke(
+        self,
+        space_id: str,
+        event: UserMessageEvent,
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        return self.invoke_many(space_id, [event], max_steps=max_steps, timeout=timeout)
+
+    def invoke_many(
+        self,
+        space_id: str,
+        events: Sequence[UserMessageEvent],
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Run one turn that sees every event in ``events`` as a new human message.
+
+        Used to coalesce near-simultaneous messages of a space into a single agent
+        turn; the result is shared by all senders (``user_id`` is the last one's).
+        """
+        self._log_invoke(space_id, events)
+        budget = self._budget(max_steps, timeout, space_id)
+        with self._turn_span(space_id, events):
+            try:
+                stored, state_input = self._prepare_turn(space_id, events, budget)
+                self._clear_thread(space_id, interrupted_only=True)
+                result_state = self._chain_for(space_id).invoke(
+                    {"input": state_input, **budget.state}, config=budget.config
+                )
+                result = self._complete_turn(space_id, events, stored, result_state, budget)
+                self._clear_thread(space_id)
+                return result
+            except PolicyError:  # allow upstream to handle
+                raise
+            except Exception as e:
+                logger.exception(
+                    "Runtime invocation failed space=%s user=%s", space_id, events[-1].user_id
+                )
+                raise RuntimeInvocationError(str(e)) from e
+
+    async def ainvoke(
+        self,
+        space_id: str,
+        event: UserMessageEvent,
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Async counterpart of `invoke` running the graph on its native async path.
+
+        Invocations for the same space are serialized (FIFO) behind a per-space
+        lock so history stays consistent; different spaces run concurrently. The
+        ``timeout`` clock starts when the turn acquires its space lock.
+        """
+        return await self._ainvoke_guarded(
+            space_id, [event], limiter=None, max_steps=max_steps, timeout=timeout
+        )
+
+    async def ainvoke_many(
+        self,
+        space_id: str,
+        events: Sequence[UserMessageEvent],
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Async counterpart of `invoke_many`, serialized with other turns of the space."""
+        return await self._ainvoke_guarded(
+            space_id, events, limiter=None, max_steps=max_steps, timeout=timeout
+        )
+
+    async def abatch(
+        self,
+        items: Sequence[Tuple[str, UserMessageEvent]],
+        *,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Run many ``(space_id, event)`` pairs concurrently.
+
+        Events targeting the same space execute in submission order; results are
+        returned in input order. ``max_concurrency`` caps the number of graph
+        executions in flight (queued same-space events do not hold a slot).
+        ``max_steps`` / ``timeout`` apply to each turn individually.
+        """
+        limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        return await asyncio.gather(
+            *(
+                self._ainvoke_guarded(space_id, [event], limiter, max_steps, timeout)
+                for space_id, event in items
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def _ainvoke_guarded(
+        self,
+        space_id: str,
+        events: Sequence[UserMessageEvent],
+        limiter: Optional[asyncio.Semaphore],
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        # No await may precede lock acquisition: FIFO order per space relies on it.
+        async with self._space_locks.hold(space_id):
+            if limiter is None:
+                return await self._ainvoke_unlocked(space_id, events, max_steps, timeout)
+            async with limiter:
+                return await self._ainvoke_unlocked(space_id, events, max_steps, timeout)
+
+    async def _ainvoke_unlocked(
+        self,
+        space_id: str,
+        events: Sequence[UserMessageEvent],
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._log_invoke(space_id, events)
+        budget = self._budget(max_steps, timeout, space_id)
+        with self._turn_span(space_id, events):
+            try:
+                stored, state_input = self._prepare_turn(space_id, events, budget)
+                await self._aclear_thread(space_id, interrupted_only=True)
+                result_state = await self._chain_for(space_id).ainvoke(
+                    {"input": state_input, **budget.state}, config=budget.config
+                )
+                result = self._complete_turn(space_id, events, stored, result_state, budget)
+                await self._aclear_thread(space_id)
+                return result
+            except PolicyError:  # allow upstream to handle
+                raise
+            except Exception as e:
+                logger.exception(
+                    "Runtime invocation failed space=%s user=%s", space_id, events[-1].user_id
+                )
+                raise RuntimeInvocationError(str(e)) from e
+
+    # --------------- Streaming ---------------
+    def stream(
+        self,
+        space_id: str,
+        event: UserMessageEvent,
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[StreamEvent]:
+        """Run one turn, yielding typed events as they happen.
+
+        Yields `TokenDeltaEvent`s while the LLM generates, a `ToolCallEvent` per
+        tool decision, a `DeliveryEvent` per ``reply_privately`` /
+        ``post_to_shared`` delivery, and finally a `FinalResultEvent` carrying the
+        `invoke` payload. Memory is persisted once, after the loop finishes.
+        """
+        self._log_invoke(space_id, [event])
+        budget = self._budget(max_steps, timeout, space_id)
+        with self._turn_span(space_id, [event]):
+            try:
+                stored, state_input = self._prepare_turn(space_id, [event], budget)
+                self._clear_thread(space_id, interrupted_only=True)
+                app_input = self._adapter.invoke({"input": state_input, **budget.state})
+                translator = StreamTranslator()
+                for mode, chunk in self._app_for(space_id).stream(
+                    app_input, config=budget.config, stream_mode=STREAM_MODES
+                ):
+                    yield from translator.feed(mode, chunk)
+                result = self._complete_turn(
+                    space_id, [event], stored, translator.result_state(state_input), budget
+                )
+                self._clear_thread(space_id)
+            except PolicyError:  # allow upstream to handle
+                raise
+            except Exception as e:
+                logger.exception("Runtime stream failed space=%s user=%s", space_id, event.user_id)
+                raise RuntimeInvocationError(str(e)) from e
+        yield FinalResultEvent(result=result)
+
+    async def astream(
+        self,
+        space_id: str,
+        event: UserMessageEvent,
+        *,
+        max_steps: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Async counterpart of `stream`; holds the space lock until the turn ends."""
+        async with self._space_locks.hold(space_id):
+            self._log_invoke(space_id, [event])
+            budget = self._budget(max_steps, timeout, space_id)
+            with self._turn_span(space_id, [event]):
+                try:
+                    stored, state_input = self._prepare_turn(space_id, [event], budget)
+                    await self._aclear_thread(space_id, interrupted_only=True)
+                    app_input = self._adapter.invoke({"input": state_input, **budget.state})
+                    translator = StreamTranslator()
+                    async for mode, chunk in self._app_for(space_id).astream(
+                        app_input, config=budget.config, stream_mode=STREAM_MODES
+                    ):
+                        for stream_event in translator.feed(mode, chunk):
+                            yield stream_event
+                    result = self._complete_turn(
+                        space_id,
+                        [event],
+                        stored,
+                        translator.result_state(state_input),
+                        budget,
+                    )
+                    await self._aclear_thread(space_id)
+                except PolicyError:  # allow upstream to handle
+                    raise
+                except Exception as e:
+                    logger.exception(
+                        "Runtime stream failed space=%s user=%s", space_id, event.user_id
+                    )
+                    raise RuntimeInvocationError(str(e)) from e
+            yield FinalResultEvent(result=result)
+
+    # --------------- Checkpoints ---------------
+    def resume(self, space_id: str) -> Optional[Dict[str, Any]]:
+        """Finish a turn of ``space_id`` that was interrupted by an error.
+
+        Needs a ``checkpointer``: the graph continues from the turn's last
+        checkpoint, so completed agent/tool steps are not repeated, and the turn
+        keeps its original step/time budget. Returns the `invoke` payload, or None
+        when the space has no interrupted turn. A new turn submitted instead
+        discards the interrupted one.
+        """
+        app = self._checkpointed_app(space_id)
+        snapshot = app.get_state(_thread_config(space_id))
+        turn = self._interrupted_turn(space_id, snapshot)
+        if turn is None:
+            return None
+        events, budget = turn
+        with self._turn_span(space_id, events):
+            try:
+                result_state = snapshot.values
+                if snapshot.next:
+                    result_state = app.invoke(None, config=budget.config)
+                result = self._complete_turn(space_id, events, 0, result_state, budget)
+                self._clear_thread(space_id)
+                return result
+            except Exception as e:
+                logger.exception("Runtime resume failed space=%s", space_id)
+                raise RuntimeInvocationError(str(e)) from e
+
+    async def aresume(self, space_id: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of `resume`, serialized with other turns of the space."""
+        async with self._space_locks.hold(space_id):
+            app = self._checkpointed_app(space_id)
+            snapshot = await app.aget_state(_thread_config(space_id))
+            turn = self._interrupted_turn(space_id, snapshot)
+            if turn is None:
+                return None
+            events, budget = turn
+            with self._turn_span(space_id, events):
+                try:
+                    result_state = snapshot.values
+                    if snapshot.next:
+                        result_state = await app.ainvoke(None, config=budget.config)
+                    result = self._complete_turn(space_id, events, 0, result_state, budget)
+                    await self._aclear_thread(space_id)
+                    return result
+                except Exception as e:
+                    logger.exception("Runtime resume failed space=%s", space_id)
+                    raise RuntimeInvocationError(str(e)) from e
+
+    def _checkpointed_app(self, space_id: str):
+        if self.checkpointer is None:
+            raise ConfigurationError("resume needs a runtime created with a checkpointer")
+        return self._app_for(space_id)
+
+    def _interrupted_turn(
+        self, space_id: str, snapshot: Any
+    ) -> Optional[Tuple[List[UserMessageEvent], "_TurnBudget"]]:
+        # The thread holds exactly the interrupted turn: its human messages are the events.
+        state = snapshot.values
+        events = [
+            UserMessageEvent(user_id=m.additional_kwargs.get("user_id", ""), content=str(m.content))
+            for m in state.get("input", [])
+            if isinstance(m, HumanMessage)
+        ]
+        if not events:
+            return None
+        budget = _TurnBudget(
+            max_steps=state.get("max_steps"),
+            deadline=state.get("deadline"),
+            telemetry=self.telemetry,
+            thread_id=space_id,
+        )
+        budget.history = self.memory.prepare_context(space_id, events[-1].user_id)
+        return events, budget
+
+    def _clear_thread(self, space_id: str, *, interrupted_only: bool = False) -> None:
+        # A thread only ever holds the in-flight turn: it is deleted once the turn is
+        # in memory, and a leftover (interrupted) turn is dropped when a new one starts.
+        if self.checkpointer is None:
+            return
+        if interrupted_only and self.checkpointer.get_tuple(_thread_config(space_id)) is None:
+            return
+        self.checkpointer.delete_thread(space_id)
+
+    async def _aclear_thread(self, space_id: str, *, interrupted_only: bool = False) -> None:
+        if self.checkpointer is None:
+            return
+        if interrupted_only:
+            if await self.checkpointer.aget_tuple(_thread_config(space_id)) is None:
+                return
+        await self.checkpointer.adelete_thread(space_id)
+
+    # --------------- Turn helpers (shared by sync + async paths) ---------------
+    @staticmethod
+    def _log_invoke(space_id: str, events: Sequence[UserMessageEvent]) -> None:
         logger.debug(
-            "Invoke called space=%s user=%s content_len=%d",
+            "Invoke called space=%s user=%s events=%d content_len=%d",
             space_id,
-            event.user_id,
-            len(event.content),
+            events[-1].user_id,
+            len(events),
+            sum(len(event.content) for event in events),
         )
-        try:
-            # 1. Retrieve context
-            context_msgs = self.memory.prepare_context(space_id, event.user_id)
-            # 2. Add current user message
-            user_msg = HumanMessage(
-                content=event.content, additional_kwargs={"user_id": event.user_id}
+
+    def _budget(
+        self, max_steps: Optional[int], timeout: Optional[float], space_id: str
+    ) -> "_TurnBudget":
+        max_steps = max_steps if max_steps is not None else self.max_steps
+        timeout = timeout if timeout is not None else self.timeout
+        if max_steps is not None and max_steps < 1:
+            raise ConfigurationError("max_steps must be >= 1")
+        deadline = time.time() + timeout if timeout is not None else None
+        return _TurnBudget(
+            max_steps=max_steps,
+            deadline=deadline,
+            telemetry=self.telemetry,
+            thread_id=space_id if self.checkpointer is not None else None,
+        )
+
+    def _telemetry(self) -> NoopTelemetry | Telemetry:
+        return self.telemetry if self.telemetry is not None else get_telemetry()
+
+    def _turn_span(self, space_id: str, events: Sequence[UserMessageEvent]):
+        telemetry = self._telemetry()
+        if not telemetry.enabled:
+            return telemetry.span("turn")
+        return _counted_turn(telemetry, space_id, events)
+
+    def _prepare_turn(
+        self, space_id: str, events: Sequence[UserMessageEvent], budget: "_TurnBudget"
+    ) -> Tuple[int, List[BaseMessage]]:
+        """The graph input of a turn, after the ``stored`` messages it starts with."""
+        if not events:
+            raise RuntimeInvocationError("A turn needs at least one event")
+        # 1. Retrieve context
+        telemetry = self._telemetry()
+        with telemetry.span("context_prep", space_id=space_id) as span:
+            context_msgs = self.memory.prepare_context(space_id, events[-1].user_id)
+            if span.recording:
+                span.set(history_len=len(context_msgs))
+                telemetry.observe("weaver_history_messages", len(context_msgs))
+        # 2. Add the current user message(s), in arrival order
+        user_msgs = [
+            HumanMessage(
+                content=event.content,
+                additional_kwargs={"user_id": event.user_id},
+                id=new_message_id(),
             )
-            state_input = context_msgs + [user_msg]
-            # 3. Run chain
-            result_state = self._chain.invoke({"input": state_input})
-            # 4. Persist new messages (state['input'] contains appended AI/tool messages)
-            new_msgs = result_state.get("input", [])
-            self.memory.append(space_id, new_msgs)
-            # 5. Return the last AI message content (basic v0 response shape)
-            ai_msgs = [m for m in new_msgs if getattr(m, "type", "") == "ai"]
-            response_text = ai_msgs[-1].content if ai_msgs else ""
-            logger.debug("Runtime invoke complete space=%s user=%s", space_id, event.user_id)
-            return {
-                "space_id": space_id,
-                "user_id": event.user_id,
-                "response": response_text,
-                "messages_appended": len(new_msgs),
-            }
-        except PolicyError:  # allow upstream to handle
+            for event in events
+        ]
+        if budget.thread_id is None:
+            return len(context_msgs), context_msgs + user_msgs
+        # Checkpointed: the thread gets only this turn; history rides in the run config.
+        budget.history = context_msgs
+        return 0, user_msgs
+
+    def _complete_turn(
+        self,
+        space_id: str,
+        events: Sequence[UserMessageEvent],
+        stored: int,
+        result_state: Dict[str, Any],
+        budget: "_TurnBudget",
+    ) -> Dict[str, Any]:
+        # Persist the delta only: state['input'] echoes the graph input back
+        # (``add`` reducer), so its first ``stored`` messages are already in memory.
+        new_msgs = result_state.get("input", [])[stored:]
+        telemetry = self._telemetry()
+        with telemetry.span("memory_append", space_id=space_id) as span:
+            appended = self.memory.append(space_id, new_msgs)
+            if span.recording:
+                span.set(messages=len(new_msgs), appended=appended)
+                telemetry.inc("weaver_messages_appended_total", appended)
+        # Return the last AI message content (basic v0 response shape)
+        ai_msgs = [m for m in new_msgs if getattr(m, "type", "") == "ai"]
+        response_text = ai_msgs[-1].content if ai_msgs else ""
+        logger.debug("Runtime invoke complete space=%s user=%s", space_id, events[-1].user_id)
+        return {
+            "space_id": space_id,
+            "user_id": events[-1].user_id,
+            "events_merged": len(events),
+            "response": response_text,
+            "messages_appended": appended,
+            **budget.report(result_state),
+        }
+
+
+@contextmanager
+def _counted_turn(telemetry: Telemetry, space_id: str, events: Sequence[UserMessageEvent]):
+    with telemetry.span(
+        "turn", space_id=space_id, user_id=events[-1].user_id, events=len(events)
+    ) as span:
+        try:
+            yield span
+        except BaseException:
+            telemetry.inc("weaver_turns_total", status="error")
             raise
-        except Exception as e:
-            logger.exception("Runtime invocation failed space=%s user=%s", space_id, event.user_id)
-            raise RuntimeInvocationError(str(e)) from e
+        telemetry.inc("weaver_turns_total", status="ok")
+
+
+def _thread_config(space_id: str) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": space_id}}
+
+
+class _TurnBudget:
+    """Step/time budget of one turn: graph input keys plus the run config.
+
+    The run config also carries the runtime's telemetry (if any) to graph nodes
+    and, for checkpointed turns, the thread id and the stored history.
+    """
+
+    __slots__ = ("max_steps", "deadline", "telemetry", "thread_id", "history")
+
+    def __init__(
+        self,
+        max_steps: Optional[int],
+        deadline: Optional[float],
+        telemetry: Telemetry | None = None,
+        thread_id: Optional[str] = None,
+    ) -> None:
+        self.max_steps = max_steps
+        self.deadline = deadline
+        self.telemetry = telemetry
+        self.thread_id = thread_id
+        self.history: Optional[List[BaseMessage]] = None
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {"max_steps": self.max_steps, "deadline": self.deadline}
+
+    @property
+    def config(self) -> Optional[Dict[str, Any]]:
+        config: Dict[str, Any] = {}
+        if self.max_steps is not None:
+            # max_steps agent steps + (max_steps - 1) tool steps, plus headroom; the
+            # default LangGraph limit would otherwise cut long budgets short.
+            config["recursion_limit"] = max(_DEFAULT_RECURSION_LIMIT, 2 * self.max_steps + 2)
+        configurable: Dict[str, Any] = {}
+        if self.telemetry is not None:
+            configurable[TELEMETRY_CONFIG_KEY] = self.telemetry
+        if self.thread_id is not None:
+            configurable["thread_id"] = self.thread_id
+            configurable[HISTORY_CONFIG_KEY] = self.history
+        if configurable:
+            config["configurable"] = configurable
+        return config or None
+
+    def report(self, result_state: Dict[str, Any]) -> Dict[str, Any]:
+        steps = result_state.get("steps", 0)
+        return {
+            "steps_used": steps,
+            "steps_remaining": (
+                max(0, self.max_steps - steps) if self.max_steps is not None else None
+            ),
+            "time_remaining": (
+                max(0.0, self.deadline - time.time()) if self.deadline is not None else None
+            ),
+            "budget_exhausted": bool(result_state.get("budget_exhausted", False)),
+        }
+
+
+class _SpaceLocks:
+    """Reference-counted per-space asyncio locks.
+
+    Locks are created on demand and dropped once no coroutine holds or waits on
+    them, so idle spaces do not accumulate lock objects.
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+    @asynccontextmanager
+    async def hold(self, space_id: str):
+        lock, users = self._locks.get(space_id, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[space_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[space_id]
+            if users <= 1:
+                del self._locks[space_id]
+            else:
+                self._locks[space_id] = (lock, users - 1)
+
+    def __len__(self) -> int:
+        return len(self._locks)
 
 
 __all__ = ["WeaverRuntime"]
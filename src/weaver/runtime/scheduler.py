@@ -0,0 +1,285 @@
+"""SpaceScheduler: per-space actors with bounded inboxes in front of WeaverRuntime.
+
+Each space gets an actor owning a bounded FIFO inbox of `UserMessageEvent`s.
+Actors drain their inbox one event at a time (preserving per-space order) and
+compete for a global pool of worker slots, so one hot space can occupy at most
+one slot while every other space keeps making progress. When an inbox is full
+the configured `OverflowPolicy` applies backpressure.
+
+With a coalescing window, an actor waits until its oldest queued event is that
+old and then runs everything in the inbox as one agent turn
+(`WeaverRuntime.ainvoke_many`); every merged caller receives the shared result.
+
+Actors exist only while a space has queued or running events: an idle actor is
+dropped and its counters are folded into `SpaceScheduler.totals`, so memory
+stays bounded by the number of active spaces.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from weaver.exceptions import BackpressureError, ConfigurationError
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.runtime import WeaverRuntime
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What `SpaceScheduler.enqueue` does when a space inbox is full."""
+
+    REJECT = "reject"  # raise BackpressureError for the new event
+    DROP_OLDEST = "drop_oldest"  # fail the oldest queued event, accept the new one
+    BLOCK = "block"  # wait until the actor frees an inbox slot
+
+
+@dataclass
+class SpaceStats:
+    """Observable counters for a single space actor (wait times in seconds)."""
+
+    queue_depth: int = 0
+    in_flight: int = 0
+    processed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    turns: int = 0
+    coalesced: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        started = self.processed + self.failed
+        return self.total_wait / started if started else 0.0
+
+    def merge(self, other: "SpaceStats") -> None:
+        """Add the cumulative counters of ``other`` (gauges are left untouched)."""
+        self.processed += other.processed
+        self.failed += other.failed
+        self.rejected += other.rejected
+        self.dropped += other.dropped
+        self.turns += other.turns
+        self.coalesced += other.coalesced
+        self.total_wait += other.total_wait
+        self.max_wait = max(self.max_wait, other.max_wait)
+
+
+@dataclass
+class _SpaceActor:
+    inbox: Deque[Tuple[UserMessageEvent, asyncio.Future, float]] = field(default_factory=deque)
+    stats: SpaceStats = field(default_factory=SpaceStats)
+    slot_freed: Optional[asyncio.Condition] = None
+    task: Optional[asyncio.Task] = None
+
+
+class SpaceScheduler:
+    """Fair, bounded, observable execution of events across spaces.
+
+    Parameters:
+        runtime: The runtime executing events (via ``ainvoke``).
+        max_workers: Size of the global worker pool (concurrent graph executions).
+        inbox_size: Maximum queued (not yet running) events per space.
+        overflow: Backpressure policy applied when an inbox is full.
+        coalesce_ms: Default coalescing window in milliseconds (0 disables);
+            override per space with `set_coalesce_window`.
+        max_coalesce: Upper bound on events merged into one turn (None = inbox).
+    """
+
+    def __init__(
+        self,
+        runtime: WeaverRuntime,
+        *,
+        max_workers: int = 8,
+        inbox_size: int = 32,
+        overflow: OverflowPolicy | str = OverflowPolicy.REJECT,
+        coalesce_ms: float = 0.0,
+        max_coalesce: Optional[int] = None,
+    ) -> None:
+        if max_workers < 1 or inbox_size < 1:
+            raise ConfigurationError("max_workers and inbox_size must be >= 1")
+        if coalesce_ms < 0 or (max_coalesce is not None and max_coalesce < 1):
+            raise ConfigurationError("coalesce_ms must be >= 0 and max_coalesce >= 1")
+        self.runtime = runtime
+        self.max_workers = max_workers
+        self.inbox_size = inbox_size
+        self.overflow = OverflowPolicy(overflow)
+        self.coalesce_window = coalesce_ms / 1000.0
+        self.max_coalesce = max_coalesce
+        self._actors: Dict[str, _SpaceActor] = {}
+        self._windows: Dict[str, float] = {}  # per-space coalescing overrides (seconds)
+        self._retired = SpaceStats()  # counters of actors dropped while idle
+        self._workers: Optional[asyncio.Semaphore] = None
+
+    # ---------------- Submission -----------------
+    async def submit(self, space_id: str, event: UserMessageEvent) -> Dict[str, Any]:
+        """Enqueue ``event`` and wait for its runtime result."""
+        return await (await self.enqueue(space_id, event))
+
+    async def enqueue(self, space_id: str, event: UserMessageEvent) -> asyncio.Future:
+        """Place ``event`` in the space inbox and return a future for its result.
+
+        Raises:
+            BackpressureError: inbox full under ``OverflowPolicy.REJECT``.
+        """
+        actor = self._actor(space_id)
+        while len(actor.inbox) >= self.inbox_size:
+            if self.overflow is OverflowPolicy.REJECT:
+                actor.stats.rejected += 1
+                raise BackpressureError(f"Inbox full for space={space_id}")
+            if self.overflow is OverflowPolicy.DROP_OLDEST:
+                _, dropped, _ = actor.inbox.popleft()
+                actor.stats.dropped += 1
+                if not dropped.done():
+                    dropped.set_exception(
+                        BackpressureError(f"Dropped oldest queued event for space={space_id}")
+                    )
+                break
+            full = actor
+            async with full.slot_freed:
+                await full.slot_freed.wait_for(lambda: len(full.inbox) < self.inbox_size)
+            # The actor may have drained and been dropped meanwhile.
+            actor = self._actor(space_id)
+        future = asyncio.get_running_loop().create_future()
+        actor.inbox.append((event, future, time.perf_counter()))
+        actor.stats.queue_depth = len(actor.inbox)
+        if actor.task is None or actor.task.done():
+            actor.task = asyncio.create_task(self._drain(space_id, actor))
+        return future
+
+    def set_coalesce_window(self, space_id: str, ms: Optional[float]) -> None:
+        """Coalesce events of ``space_id`` within ``ms`` milliseconds (0 disables).
+
+        ``None`` restores the scheduler-wide default.
+        """
+        if ms is not None and ms < 0:
+            raise ConfigurationError("coalesce window must be >= 0")
+        if ms is None:
+            self._windows.pop(space_id, None)
+        else:
+            self._windows[space_id] = ms / 1000.0
+
+    # ---------------- Observability -----------------
+    def stats(self, space_id: str) -> SpaceStats:
+        """Return the live counters for ``space_id`` (zeros if it has no active actor)."""
+        actor = self._actors.get(space_id)
+        return actor.stats if actor else SpaceStats()
+
+    def snapshot(self) -> Dict[str, SpaceStats]:
+        """Return counters for every space with queued or running events."""
+        return {space_id: actor.stats for space_id, actor in self._actors.items()}
+
+    @property
+    def totals(self) -> SpaceStats:
+        """Counters aggregated over all spaces, including ones whose actor was dropped."""
+        totals = SpaceStats()
+        totals.merge(self._retired)
+        for actor in self._actors.values():
+            totals.merge(actor.stats)
+            totals.queue_depth += actor.stats.queue_depth
+            totals.in_flight += actor.stats.in_flight
+        return totals
+
+    def __len__(self) -> int:
+        """Number of live space actors."""
+        return len(self._actors)
+
+    @property
+    def busy_workers(self) -> int:
+        return sum(actor.stats.in_flight for actor in self._actors.values())
+
+    async def join(self) -> None:
+        """Wait until every inbox has been drained."""
+        tasks = [a.task for a in self._actors.values() if a.task and not a.task.done()]
+        while tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [a.task for a in self._actors.values() if a.task and not a.task.done()]
+
+    # ---------------- Actor loop -----------------
+    def _actor(self, space_id: str) -> _SpaceActor:
+        if self._workers is None:
+            # Created lazily so the scheduler binds to the loop it is used from.
+            self._workers = asyncio.Semaphore(self.max_workers)
+        actor = self._actors.get(space_id)
+        if actor is None:
+            actor = self._actors[space_id] = _SpaceActor(slot_freed=asyncio.Condition())
+        return actor
+
+    def _window(self, space_id: str) -> float:
+        return self._windows.get(space_id, self.coalesce_window)
+
+    def _take(
+        self, actor: _SpaceActor, window: float
+    ) -> List[Tuple[UserMessageEvent, asyncio.Future, float]]:
+        limit = 1 if not window else (self.max_coalesce or len(actor.inbox))
+        batch = []
+        while actor.inbox and len(batch) < limit:
+            batch.append(actor.inbox.popleft())
+        # Drop-oldest may already have failed some of these futures.
+        return [item for item in batch if not item[1].done()]
+
+    async def _drain(self, space_id: str, actor: _SpaceActor) -> None:
+        while actor.inbox:
+            window = self._window(space_id)
+            if window:
+                # Hold the batch open (without a worker slot) until the oldest
+                # event has waited ``window``; later arrivals join the same turn.
+                delay = actor.inbox[0][2] + window - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with self._workers:
+                batch = self._take(actor, window)
+                await self._notify_slot_freed(actor)
+                if not batch:
+                    continue
+                stats = actor.stats
+                stats.queue_depth = len(actor.inbox)
+                now = time.perf_counter()
+                for _, _, enqueued_at in batch:
+                    wait = now - enqueued_at
+                    stats.last_wait = wait
+                    stats.total_wait += wait
+                    stats.max_wait = max(stats.max_wait, wait)
+                stats.in_flight += 1
+                events = [event for event, _, _ in batch]
+                try:
+                    if len(events) == 1:
+                        result = await self.runtime.ainvoke(space_id, events[0])
+                    else:
+                        result = await self.runtime.ainvoke_many(space_id, events)
+                except Exception as e:
+                    stats.failed += len(batch)
+                    for _, future, _ in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    stats.processed += len(batch)
+                    for event, future, _ in batch:
+                        if not future.done():
+                            # Shared turn result, addressed to each caller.
+                            future.set_result({**result, "user_id": event.user_id})
+                finally:
+                    stats.in_flight -= 1
+                    stats.turns += 1
+                    stats.coalesced += len(batch) - 1
+        actor.stats.queue_depth = 0
+        # Inbox drained and this task is finishing: drop the idle actor.
+        if self._actors.get(space_id) is actor:
+            del self._actors[space_id]
+            self._retired.merge(actor.stats)
+
+    @staticmethod
+    async def _notify_slot_freed(actor: _SpaceActor) -> None:
+        async with actor.slot_freed:
+            actor.slot_freed.notify_all()
+
+
+__all__ = ["SpaceScheduler", "SpaceStats", "OverflowPolicy"]
@@ -0,0 +1,173 @@
+"""Pluggable message stores backing MemoryCoordinator.
+
+`MemoryStore` is the persistence contract: an append-only, per-space message
+log addressed by a monotonically increasing sequence number. Two backends ship:
+
+* `InMemoryStore`: process-local, mainly for tests and ephemeral runtimes.
+* `SQLiteMemoryStore`: durable log in a single SQLite file (WAL mode), one
+  transaction per appended batch, recent-message reads via the
+  ``(space_id, seq)`` primary key.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.messages import (
+    BaseMessage,
+    ToolMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+
+from weaver.exceptions import ConfigurationError
+
+
+class MemoryStore(ABC):
+    """Append-only per-space message log."""
+
+    @abstractmethod
+    def load(self, space_id: str, limit: Optional[int] = None) -> List[BaseMessage]:
+        """Return the space log in order; only the newest ``limit`` if given.
+
+        A limited window never starts with tool results whose tool-calling
+        ``AIMessage`` fell outside it (providers reject such orphans), so it may
+        hold fewer than ``limit`` messages.
+        """
+
+    @abstractmethod
+    def append(self, space_id: str, messages: Sequence[BaseMessage]) -> None:
+        """Durably append ``messages`` as one batch (messages must carry ids)."""
+
+    def recent(self, space_id: str, limit: int) -> List[BaseMessage]:
+        """Return the newest ``limit`` messages of a space, oldest first."""
+        return self.load(space_id, limit=limit)
+
+    def close(self) -> None:  # pragma: no cover - optional hook
+        """Release backend resources."""
+
+
+class InMemoryStore(MemoryStore):
+    """Process-local store (no durability)."""
+
+    def __init__(self) -> None:
+        self._logs: Dict[str, List[BaseMessage]] = {}
+
+    def load(self, space_id: str, limit: Optional[int] = None) -> List[BaseMessage]:
+        log = self._logs.get(space_id, [])
+        return _drop_orphan_tool_results(log[-limit:]) if limit else list(log)
+
+    def append(self, space_id: str, messages: Sequence[BaseMessage]) -> None:
+        self._logs.setdefault(space_id, []).extend(messages)
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """Durable append-only message log in SQLite.
+
+    Several store instances (or processes) may share one database file: sequence
+    numbers are allocated inside the appending write transaction.
+
+    Parameters:
+        path: Database file path (use a temp file in tests; ``":memory:"`` works
+            but is not durable).
+        synchronous: SQLite ``synchronous`` pragma; ``NORMAL`` is durable across
+            application crashes under WAL and much faster than ``FULL``.
+    """
+
+    _SCHEMA = (
+        (
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " space_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " message_id TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " PRIMARY KEY (space_id, seq)"
+            ") WITHOUT ROWID"
+        ),
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_messages_message_id ON messages (space_id, message_id)",
+    )
+
+    def __init__(self, path: str | Path, synchronous: str = "NORMAL") -> None:
+        if synchronous.upper() not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            raise ConfigurationError(f"Invalid SQLite synchronous mode: {synchronous}")
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+
+    def load(self, space_id: str, limit: Optional[int] = None) -> List[BaseMessage]:
+        with self._lock:
+            if limit:
+                rows = self._conn.execute(
+                    "SELECT payload FROM messages WHERE space_id = ? ORDER BY seq DESC LIMIT ?",
+                    (space_id, limit),
+                ).fetchall()
+                rows.reverse()
+            else:
+                rows = self._conn.execute(
+                    "SELECT payload FROM messages WHERE space_id = ? ORDER BY seq", (space_id,)
+                ).fetchall()
+        messages = messages_from_dict([json.loads(payload) for (payload,) in rows])
+        return _drop_orphan_tool_results(messages) if limit else messages
+
+    def append(self, space_id: str, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        payloads = []
+        for message in messages:
+            if not message.id:
+                raise ValueError("SQLiteMemoryStore.append requires messages with ids")
+            payloads.append((message.id, json.dumps(message_to_dict(message), ensure_ascii=False)))
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so the high-water mark read
+            # below cannot be raced by another connection appending to this space.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (seq,) = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq) + 1, 0) FROM messages WHERE space_id = ?",
+                    (space_id,),
+                ).fetchone()
+                # Already-stored messages are skipped (gaps in seq are harmless); a
+                # (space_id, seq) conflict still raises instead of dropping a row.
+                self._conn.executemany(
+                    "INSERT INTO messages (space_id, seq, message_id, payload)"
+                    " VALUES (?, ?, ?, ?) ON CONFLICT (space_id, message_id) DO NOTHING",
+                    [
+                        (space_id, seq + offset, message_id, payload)
+                        for offset, (message_id, payload) in enumerate(payloads)
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def count(self, space_id: str) -> int:
+        with self._lock:
+            (n,) = self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE space_id = ?", (space_id,)
+            ).fetchone()
+        return n
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _drop_orphan_tool_results(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    # A window cut between a tool-calling AIMessage and its results starts with them.
+    start = 0
+    while start < len(messages) and isinstance(messages[start], ToolMessage):
+        start += 1
+    return list(messages[start:])
+
+
+__all__ = ["MemoryStore", "InMemoryStore", "SQLiteMemoryStore"]
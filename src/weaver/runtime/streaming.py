@@ -0,0 +1,85 @@
+"""Translate LangGraph stream chunks into typed Weaver stream events."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from weaver.models.stream import DeliveryEvent, StreamEvent, TokenDeltaEvent, ToolCallEvent
+
+# "messages" carries LLM token deltas, "updates" the per-node state deltas.
+STREAM_MODES = ["messages", "updates"]
+
+
+class StreamTranslator:
+    """Stateful adapter fed with ``(mode, chunk)`` pairs from ``app.stream``.
+
+    Besides yielding events it accumulates the messages produced by the graph
+    (``produced``) and the latest non-message state keys (``state``, e.g. the
+    step counter) so the runtime can persist and report the turn at the end.
+    """
+
+    def __init__(self) -> None:
+        self.produced: List[BaseMessage] = []
+        self.state: Dict[str, Any] = {}
+        self._calls: Dict[str, Dict[str, Any]] = {}
+
+    def feed(self, mode: str, chunk: Any) -> Iterator[StreamEvent]:
+        if mode == "messages":
+            yield from self._on_message(*chunk)
+        elif mode == "updates":
+            yield from self._on_updates(chunk)
+
+    def _on_message(self, message: BaseMessage, metadata: Dict[str, Any]) -> Iterator[StreamEvent]:
+        if metadata.get("langgraph_node") != "agent" or not isinstance(message, AIMessage):
+            return
+        text = message.content if isinstance(message.content, str) else ""
+        if text:
+            yield TokenDeltaEvent(content=text, message_id=message.id)
+
+    def _on_updates(self, updates: Dict[str, Any]) -> Iterator[StreamEvent]:
+        for node_update in updates.values():
+            if not isinstance(node_update, dict):
+                continue
+            self.state.update((k, v) for k, v in node_update.items() if k != "input")
+            for message in node_update.get("input") or []:
+                self.produced.append(message)
+                if isinstance(message, AIMessage):
+                    for call in message.tool_calls:
+                        self._calls[call.get("id")] = call
+                        yield ToolCallEvent(
+                            name=call["name"], args=call.get("args", {}), call_id=call.get("id")
+                        )
+                elif isinstance(message, ToolMessage):
+                    delivery = self._delivery(message)
+                    if delivery is not None:
+                        yield delivery
+
+    def result_state(self, state_input: List[BaseMessage]) -> Dict[str, Any]:
+        """Final graph state equivalent for a run started with ``state_input``."""
+        return {**self.state, "input": state_input + self.produced}
+
+    def _delivery(self, message: ToolMessage) -> DeliveryEvent | None:
+        call = self._calls.pop(message.tool_call_id, {})
+        name = message.name or call.get("name")
+        args = call.get("args", {})
+        if message.status == "error":
+            return None
+        if name == "reply_privately":
+            return DeliveryEvent(
+                channel="private",
+                recipient=args.get("recipient"),
+                content=args.get("content", str(message.content)),
+                call_id=message.tool_call_id,
+            )
+        if name == "post_to_shared":
+            return DeliveryEvent(
+                channel="shared",
+                content=args.get("content", str(message.content)),
+                call_id=message.tool_call_id,
+            )
+        return None
+
+
+__all__ = ["StreamTranslator", "STREAM_MODES"]
@@ -0,0 +1,366 @@
+"""Spans and metrics for the runtime and graph.
+
+`Telemetry` records a span per phase of a turn (``turn``, ``context_prep``,
+``agent``, ``tools``, ``memory_append``) plus counters, and exports them to an
+in-process Prometheus-style `MetricsRegistry` and optionally a `JsonlSpanSink`.
+
+Instrumentation is off by default: the process-wide telemetry is `NOOP`, whose
+spans are a shared do-nothing context manager. Enable it globally with
+`set_telemetry` or per runtime (``WeaverRuntime(..., telemetry=...)``).
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Key under ``config["configurable"]`` carrying a runtime's telemetry into graph nodes.
+CONFIG_KEY = "weaver_telemetry"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self._help: Dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str, buckets: Sequence[float] | None = None) -> None:
+        self._help[name] = help_text
+        if buckets is not None:
+            self._buckets[name] = tuple(sorted(buckets))
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self._buckets.get(name, DEFAULT_BUCKETS))
+            histogram.observe(value)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def histogram_count(self, name: str, **labels: Any) -> int:
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_label_key(labels))
+            return histogram.count if histogram else 0
+
+    def render(self) -> str:
+        """Prometheus text exposition (version 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._header(lines, name, "counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                self._header(lines, name, "histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        le = key + (("le", _format_value(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(le)} {cumulative}")
+                    inf = key + (("le", "+Inf"),)
+                    lines.append(f"{name}_bucket{_format_labels(inf)} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+class JsonlSpanSink:
+    """Appends one JSON object per finished span to a local file."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def export(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Span:
+    """A timed phase; set attributes while it is open with `set`."""
+
+    __slots__ = (
+        "_telemetry",
+        "name",
+        "attrs",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "_start",
+        "_token",
+    )
+    _ids = itertools.count(1)
+
+    recording = True
+
+    def __init__(self, telemetry: "Telemetry", name: str, attrs: Dict[str, Any]) -> None:
+        self._telemetry = telemetry
+        self.name = name
+        self.attrs = attrs
+        self.span_id = next(self._ids)
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self._start = 0.0
+        self._token = None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._start
+        try:
+            _current_span.reset(self._token)
+        except ValueError:  # exited from another context (e.g. a re-scheduled generator)
+            _current_span.set(None)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._telemetry._finish(self, duration)
+
+
+class _NoopSpan:
+    __slots__ = ()
+    recording = False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class NoopTelemetry:
+    """Disabled telemetry: every call is a constant-time no-op."""
+
+    enabled = False
+
+    def span(self, name: str, **attrs: Any) -> _NoopSpan:
+        return _NOOP_SPAN
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        pass
+
+
+NOOP = NoopTelemetry()
+
+
+class Telemetry:
+    """Enabled telemetry exporting spans to a registry and optional JSONL sink.
+
+    Every span feeds ``weaver_span_duration_seconds{span=...}``; instrumented
+    code adds counters such as ``weaver_llm_prompt_tokens_total`` and
+    ``weaver_tool_calls_total{tool=...}``.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        sink: JsonlSpanSink | str | os.PathLike[str] | None = None,
+    ) -> None:
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.sink = JsonlSpanSink(sink) if isinstance(sink, (str, os.PathLike)) else sink
+        _describe_defaults(self.registry)
+
+    def span(self, name: str, **attrs: Any) -> Span:
+        return Span(self, name, attrs)
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        self.registry.inc(name, value, **labels)
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        self.registry.observe(name, value, **labels)
+
+    def _finish(self, span: Span, duration: float) -> None:
+        self.registry.observe("weaver_span_duration_seconds", duration, span=span.name)
+        if self.sink is not None:
+            self.sink.export(
+                {
+                    "name": span.name,
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "ts": time.time() - duration,
+                    "duration_ms": duration * 1e3,
+                    **span.attrs,
+                }
+            )
+
+    def close(self) -> None:
+        if self.sink is not None:
+            self.sink.close()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("weaver_current_span", default=None)
+_default: NoopTelemetry | Telemetry = NOOP
+
+
+def get_telemetry() -> NoopTelemetry | Telemetry:
+    """Process-wide telemetry (`NOOP` unless `set_telemetry` was called)."""
+    return _default
+
+
+def set_telemetry(telemetry: NoopTelemetry | Telemetry | None) -> None:
+    """Install process-wide telemetry; ``None`` disables it again."""
+    global _default
+    _default = telemetry if telemetry is not None else NOOP
+
+
+def telemetry_from_config(config: Optional[Dict[str, Any]]) -> NoopTelemetry | Telemetry:
+    """Telemetry carried in a LangChain run config, else the process-wide one."""
+    if config:
+        telemetry = (config.get("configurable") or {}).get(CONFIG_KEY)
+        if telemetry is not None:
+            return telemetry
+    return _default
+
+
+def record_llm_usage(telemetry: Telemetry, span: Span, response: Any) -> None:
+    """Copy token usage / tool-call counts of an LLM response onto ``span`` and counters."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    prompt = usage.get("input_tokens", 0)
+    completion = usage.get("output_tokens", 0)
+    tool_calls = len(getattr(response, "tool_calls", None) or [])
+    span.set(prompt_tokens=prompt, completion_tokens=completion, tool_calls=tool_calls)
+    telemetry.inc("weaver_llm_calls_total")
+    if prompt:
+        telemetry.inc("weaver_llm_prompt_tokens_total", prompt)
+    if completion:
+        telemetry.inc("weaver_llm_completion_tokens_total", completion)
+
+
+def _describe_defaults(registry: MetricsRegistry) -> None:
+    registry.describe("weaver_span_duration_seconds", "Duration of runtime/graph phases.")
+    registry.describe(
+        "weaver_history_messages",
+        "History length (messages) used as turn context.",
+        buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+    )
+    registry.describe("weaver_turns_total", "Turns processed, by status.")
+    registry.describe("weaver_llm_calls_total", "Agent LLM calls.")
+    registry.describe("weaver_llm_prompt_tokens_total", "Prompt tokens reported by the LLM.")
+    registry.describe(
+        "weaver_llm_completion_tokens_total", "Completion tokens reported by the LLM."
+    )
+    registry.describe("weaver_tool_calls_total", "Tool calls executed, by tool.")
+    registry.describe("weaver_tool_errors_total", "Tool calls that failed or timed out, by tool.")
+    registry.describe("weaver_messages_appended_total", "Messages persisted to memory.")
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: Iterable[Tuple[str, str]]) -> str:
+    items = [f'{k}="{_escape(v)}"' for k, v in key]
+    return "{" + ",".join(items) + "}" if items else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+__all__ = [
+    "Telemetry",
+    "NoopTelemetry",
+    "NOOP",
+    "Span",
+    "MetricsRegistry",
+    "JsonlSpanSink",
+    "get_telemetry",
+    "set_telemetry",
+    "telemetry_from_config",
+    "record_llm_usage",
+    "CONFIG_KEY",
+]
@@ -0,0 +1,51 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_time import BUDGETS, DEFERRED, check
+
+
+def _env():
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+
+@pytest.mark.parametrize(
+    "module", ["weaver", "weaver.runtime", "weaver.core.graph", "weaver.runtime.runtime"]
+)
+def test_heavy_dependencies_load_on_first_use(module):
+    # Which modules load is deterministic; timings stay in benchmarks/import_time.py.
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        f"loaded = sorted(p for p in {DEFERRED!r} if p in sys.modules)\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=_env())
+
+
+def test_check_reports_overruns_and_eager_imports():
+    result = {"module": "weaver.core", "total_ms": 10_000.0, "deferred_loaded": ["langgraph"]}
+    problems = check([result], BUDGETS)
+    assert len(problems) == 2 and "langgraph" in problems[1]
+
+
+def test_langgraph_loads_on_first_graph_use():
+    code = (
+        "import sys\n"
+        "from weaver.core.graph import WeaverGraph\n"
+        "from tests.conftest import ScriptedLLM\n"
+        "graph = WeaverGraph(llm=ScriptedLLM())\n"
+        "assert 'langgraph' not in sys.modules\n"
+        "graph.app\n"
+        "assert 'langgraph' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=_env())
+
+
+@pytest.mark.parametrize("package", ["weaver.core", "weaver.runtime"])
+def test_all_lists_every_lazy_export(package):
+    module = importlib.import_module(package)
+    assert module.__all__ == list(module._EXPORTS)
@@ -0,0 +1,24 @@
+from benchmarks.runtime_latency import BASE_SCENARIO, compare, run_scenario, scenarios
+
+
+def test_run_scenario_reports_metrics():
+    scenario = {**BASE_SCENARIO, "history": 20, "spaces": 2, "tool_calls": 2}
+    result = run_scenario(scenario, requests=6, warmup=1)
+    assert result["tool_calls"] == 2 and result["requests"] == 6
+    assert 0 < result["p50_ms"] <= result["p99_ms"]
+    assert result["throughput_rps"] > 0 and result["alloc_kib_per_invoke"] > 0
+
+
+def test_scenarios_vary_one_axis_at_a_time():
+    grid = scenarios({"history": [0, 100], "tool_calls": [1, 3]}, BASE_SCENARIO)
+    assert len(grid) == 3  # base scenario appears once
+    assert all(sum(s[k] != BASE_SCENARIO[k] for k in s) <= 1 for s in grid)
+
+
+def test_compare_flags_regressions_only():
+    base = {**BASE_SCENARIO, "mode": "sync", "llm_latency_ms": 0.0}
+    old = [{**base, "p50_ms": 10.0, "p99_ms": 20.0, "throughput_rps": 100.0}]
+    new = [{**base, "p50_ms": 9.0, "p99_ms": 30.0, "throughput_rps": 70.0}]
+    regressions = compare(new, old, tolerance=0.2)
+    assert sorted(r["metric"] for r in regressions) == ["p99_ms", "throughput_rps"]
+    assert compare(new, old, tolerance=0.6) == []
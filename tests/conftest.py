@@ -0,0 +1,73 @@
+"""Shared test doubles for runtime-level tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+
+from weaver.core.graph import WeaverGraph
+from weaver.runtime.policy import MediationPolicy
+from weaver.runtime.runtime import WeaverRuntime
+
+
+class ScriptedLLM(Runnable):
+    """Deterministic chat-model stand-in supporting ``bind_tools``.
+
+    Returns the scripted ``AIMessage`` responses in order, then falls back to a
+    plain (tool-free) answer once the script is exhausted.
+    """
+
+    def __init__(self, responses: Optional[List[AIMessage]] = None, delay: float = 0.0):
+        self.responses = list(responses or [])
+        self.delay = delay
+        self.calls = 0
+        self.bound_tools = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.seen: List[list] = []
+
+    def bind_tools(self, tools):
+        self.bound_tools = tools
+        return self
+
+    def invoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        self.calls += 1
+        self.seen.append(list(messages))
+        if self.responses:
+            return self.responses.pop(0)
+        return AIMessage(content=f"(fake) reply #{self.calls}")
+
+    async def ainvoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return self.invoke(messages, config)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def scripted_llm():
+    return ScriptedLLM
+
+
+@pytest.fixture
+def make_runtime():
+    """Factory for a `WeaverRuntime` over the default policy with an injected LLM.
+
+    ``tools`` overrides the graph's tool set; other keyword arguments go to
+    `WeaverRuntime` (``store``, ``telemetry``, ``checkpointer``, budgets, ...).
+    """
+
+    def make(llm, *, tools=None, **kwargs) -> WeaverRuntime:
+        policy = MediationPolicy.default()
+        graph = WeaverGraph(system_prompt=policy.format_system_prompt(), llm=llm, tools=tools)
+        return WeaverRuntime(policy, graph=graph, **kwargs)
+
+    return make
@@ -30,3 +30,35 @@ def test_graph_invoke_with_fake_llm():
     assert any(getattr(m, "type", "") == "ai" for m in msgs)
     # No tool call produced by fake
     assert result.get("action_to_execute") in (None, [])
+
+
+class _CountingFake(_DeterministicFake):
+    def __init__(self):
+        super().__init__()
+        self._binds = []
+
+    def bind_tools(self, tools):
+        self._binds.append([t.name for t in tools])
+        return self
+
+
+def test_tools_bound_once_and_system_message_reused():
+    fake = _CountingFake()
+    graph = WeaverGraph(system_prompt="SYSTEM", llm=fake)
+    state: SpaceState = {"input": [HumanMessage(content="hi")]}
+    first = graph._agent_messages(state)[0]
+    for _ in range(3):
+        graph.app.invoke(state)
+    assert fake._binds == [["reply_privately", "post_to_shared"]]
+    assert graph._agent_messages(state)[0] is first
+
+
+def test_rebind_only_when_prompt_or_tools_change():
+    fake = _CountingFake()
+    graph = WeaverGraph(system_prompt="SYSTEM", llm=fake)
+    graph.system_prompt = "NEW"
+    assert graph._agent_messages({"input": []})[0].content == "NEW"
+    assert len(fake._binds) == 1
+    graph.tools = graph.tools[:1]
+    assert fake._binds[-1] == ["reply_privately"]
+    assert graph.app.invoke({"input": [HumanMessage(content="hi")]})["input"][-1].type == "ai"
@@ -0,0 +1,39 @@
+from weaver.building_blocks.tools import post_to_shared
+from weaver.core.graph_cache import GraphCache
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.policy import BasePolicy, MediationPolicy
+from weaver.runtime.runtime import WeaverRuntime
+
+
+def test_same_policy_tools_and_model_reuse_compiled_graph(scripted_llm):
+    cache = GraphCache(llm=scripted_llm())
+    first = cache.get("PROMPT")
+    assert cache.get("PROMPT") is first
+    assert cache.get("OTHER") is not first
+    assert cache.get("PROMPT", tools=[post_to_shared]) is not first
+    assert cache.get("PROMPT", llm=scripted_llm()) is not first
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_runtimes_share_graph_and_llm_client(scripted_llm):
+    cache = GraphCache(llm=scripted_llm())
+    runtimes = [WeaverRuntime(MediationPolicy.default(), graph_cache=cache) for _ in range(5)]
+    assert len({id(rt.graph) for rt in runtimes}) == 1
+    assert len(cache) == 1
+
+
+def test_one_runtime_serves_spaces_with_different_policies(scripted_llm):
+    llm = scripted_llm()
+    cache = GraphCache(llm=llm)
+    runtime = WeaverRuntime(MediationPolicy.default(), graph_cache=cache)
+    coach = BasePolicy(role="You are a negotiation coach.", principles=["Be brief"])
+    graph = runtime.set_policy("neg", coach)
+    assert runtime.set_policy("neg2", coach) is graph
+    assert graph.llm is runtime.graph.llm
+
+    runtime.invoke("neg", UserMessageEvent(user_id="u", content="hi"))
+    assert llm.seen[-1][0].content.startswith("You are a negotiation coach.")
+    runtime.invoke("counsel", UserMessageEvent(user_id="u", content="hi"))
+    assert llm.seen[-1][0].content == MediationPolicy.default().format_system_prompt()
+    assert runtime.policy_for("neg") is coach
+    assert len(cache) == 2
@@ -0,0 +1,63 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from weaver.core import llm_cache
+from weaver.core.llm_cache import CachingLLM, LLMResponseCache, cache_key, tool_schemas
+from weaver.exceptions import CacheMissError
+from weaver.models.events import UserMessageEvent
+from weaver.building_blocks.tools import TOOLS
+
+
+def test_key_ignores_message_ids_but_not_prompt_or_tools():
+    a = [SystemMessage(content="S"), HumanMessage(content="hi", id="1")]
+    b = [SystemMessage(content="S"), HumanMessage(content="hi", id="2")]
+    assert cache_key("m", a) == cache_key("m", b)
+    assert cache_key("m", a) != cache_key("m", [SystemMessage(content="S2"), a[1]])
+    assert cache_key("m", a) != cache_key("m", a, TOOLS)
+    assert cache_key("m", a) != cache_key("other", a)
+    assert cache_key("m", a, TOOLS) == cache_key("m", a, schemas=tool_schemas(TOOLS))
+
+
+def test_tool_schemas_converted_once_per_binding(scripted_llm, monkeypatch):
+    conversions = []
+    convert = llm_cache.convert_to_openai_tool
+    monkeypatch.setattr(
+        llm_cache, "convert_to_openai_tool", lambda t: conversions.append(t) or convert(t)
+    )
+    bound = CachingLLM(scripted_llm(), LLMResponseCache()).bind_tools(TOOLS)
+    for i in range(5):
+        bound.invoke([HumanMessage(content=f"q{i}")])
+    assert len(conversions) == len(TOOLS)
+
+
+def test_disk_tier_survives_new_process_and_replay_is_strict(tmp_path, scripted_llm):
+    inner = scripted_llm([AIMessage(content="recorded")])
+    recorder = CachingLLM(inner, LLMResponseCache(tmp_path)).bind_tools(TOOLS)
+    prompt = [HumanMessage(content="hello")]
+    assert recorder.invoke(prompt).content == "recorded"
+    assert recorder.invoke(prompt).content == "recorded"
+    assert inner.calls == 1
+
+    fresh_inner = scripted_llm()
+    replay = CachingLLM(fresh_inner, LLMResponseCache(tmp_path), mode="replay").bind_tools(TOOLS)
+    replayed = replay.invoke(prompt)
+    assert replayed.content == "recorded" and replayed.id is None
+    assert fresh_inner.calls == 0
+    with pytest.raises(CacheMissError):
+        replay.invoke([HumanMessage(content="never seen")])
+
+
+def test_repeated_runtime_runs_are_served_from_cache(tmp_path, scripted_llm, make_runtime):
+    def run(llm, mode="read_write"):
+        cached = CachingLLM(llm, LLMResponseCache(tmp_path), mode=mode, model="fake")
+        runtime = make_runtime(cached)
+        return [
+            runtime.invoke("s", UserMessageEvent(user_id="u", content=f"m{i}"))["response"]
+            for i in range(3)
+        ]
+
+    first_llm = scripted_llm()
+    first = run(first_llm)
+    second_llm = scripted_llm()
+    assert run(second_llm, mode="replay") == first
+    assert (first_llm.calls, second_llm.calls) == (3, 0)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_openai import FakeOpenAIServer
+from weaver.core.graph import WeaverGraph
+from weaver.core.providers import HttpPoolConfig, ProviderRegistry
+from weaver.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def server():
+    with FakeOpenAIServer() as srv:
+        yield srv
+
+
+def test_clients_shared_per_endpoint_key_and_model(server):
+    registry = ProviderRegistry(HttpPoolConfig())
+    a = registry.chat_model("m1", api_key="sk-a", base_url=server.url)
+    assert registry.chat_model("m1", api_key="sk-a", base_url=server.url) is a
+    b = registry.chat_model("m2", api_key="sk-a", base_url=server.url)
+    c = registry.chat_model("m1", api_key="sk-b", base_url=server.url)
+    assert len({id(a), id(b), id(c)}) == 3 and len(registry) == 3
+    # every model of one endpoint rides on the same sync/async pools
+    assert a.root_client._client is b.root_client._client is c.root_client._client
+    registry.close()
+
+
+def test_connections_reused_across_models_and_event_loops(server):
+    registry = ProviderRegistry(HttpPoolConfig())
+    models = [registry.chat_model(f"m{i}", api_key="sk-a", base_url=server.url) for i in range(3)]
+    for llm in models * 2:
+        assert llm.invoke("hi").content == "ok"
+    assert server.requests == 6 and server.connections == 1
+
+    async def burst():
+        return await asyncio.gather(*(llm.ainvoke("hi") for llm in models))
+
+    for _ in range(2):  # a fresh loop each time, like asyncio.run per experiment batch
+        assert [m.content for m in asyncio.run(burst())] == ["ok"] * 3
+    assert server.requests == 12 and server.connections <= 1 + 2 * 3
+    registry.close()
+
+
+def test_pool_config_is_applied(server):
+    registry = ProviderRegistry(HttpPoolConfig(max_keepalive_connections=0))
+    llm = registry.chat_model("m1", api_key="sk-a", base_url=server.url)
+    for _ in range(3):
+        llm.invoke("hi")
+    assert server.connections == 3  # no keep-alive: one connection per request
+    registry.close()
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("WEAVER_HTTP_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("WEAVER_HTTP_KEEPALIVE_EXPIRY", "2.5")
+    config = HttpPoolConfig.from_env()
+    assert config.max_connections == 8 and config.keepalive_expiry == 2.5
+    monkeypatch.setenv("WEAVER_HTTP_MAX_KEEPALIVE", "many")
+    with pytest.raises(ConfigurationError):
+        HttpPoolConfig.from_env()
+
+
+def test_default_llm_shared_between_graphs(server, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-local")
+    monkeypatch.setenv("OPENAI_API_BASE", server.url)
+    monkeypatch.setenv("WEAVER_MODEL", "stand-in")
+    monkeypatch.delenv("WEAVER_LLM_CACHE_DIR", raising=False)
+    first, second = WeaverGraph.default_llm(), WeaverGraph.default_llm()
+    assert first.llm is second.llm  # resilience wrappers around one shared client
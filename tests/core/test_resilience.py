@@ -0,0 +1,181 @@
+import asyncio
+import random
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from benchmarks.fake_openai import FakeOpenAIServer
+from weaver.core.providers import HttpPoolConfig, ProviderRegistry
+from weaver.core.resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    ResilientLLM,
+    RetryPolicy,
+    is_provider_failure,
+)
+from weaver.exceptions import CircuitOpenError, RuntimeInvocationError
+from weaver.models.events import UserMessageEvent
+
+NO_WAIT = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FlakyLLM:
+    """Raises the scripted errors first, then answers; ``delays`` stall individual calls."""
+
+    def __init__(self, errors=(), delays=()):
+        self.errors = list(errors)
+        self.delays = list(delays)
+        self.calls = 0
+
+    def bind_tools(self, tools):
+        return self
+
+    def _next(self):
+        self.calls += 1
+        delay = self.delays.pop(0) if self.delays else 0.0
+        if self.errors:
+            raise self.errors.pop(0)
+        return delay, AIMessage(content=f"answer {self.calls}")
+
+    def invoke(self, messages, config=None, **kwargs):
+        delay, response = self._next()
+        time.sleep(delay)
+        return response
+
+    async def ainvoke(self, messages, config=None, **kwargs):
+        delay, response = self._next()
+        await asyncio.sleep(delay)
+        return response
+
+
+def test_transient_errors_retried_with_backoff():
+    llm = ResilientLLM(FlakyLLM(errors=[ConnectionError("reset"), HTTPError(503)]), retry=NO_WAIT)
+    assert llm.invoke([HumanMessage(content="hi")]).content == "answer 3"
+    assert llm.stats.retries == 2 and llm.stats.attempts == 3
+    delays = [RetryPolicy(base_delay=1.0).delay(n, random.Random(0)) for n in (1, 5)]
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 8.0
+
+
+def test_client_errors_and_exhausted_attempts_raise():
+    llm = ResilientLLM(FlakyLLM(errors=[HTTPError(400), KeyError("bug")]), retry=NO_WAIT)
+    with pytest.raises(HTTPError):
+        llm.invoke([HumanMessage(content="hi")])
+    with pytest.raises(KeyError):
+        llm.invoke([HumanMessage(content="hi")])
+    assert llm.stats.attempts == 2 and llm.stats.retries == 0
+    llm = ResilientLLM(FlakyLLM(errors=[HTTPError(429)] * 3), retry=NO_WAIT)
+    with pytest.raises(HTTPError):
+        asyncio.run(llm.ainvoke([HumanMessage(content="hi")]))
+    assert llm.stats.attempts == 3
+
+
+def test_circuit_breaker_fails_fast_then_probes():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=lambda: now[0])
+    flaky = FlakyLLM(errors=[HTTPError(500)] * 3)
+    llm = ResilientLLM(flaky, retry=RetryPolicy(max_attempts=1), breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            llm.invoke([HumanMessage(content="hi")])
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        llm.invoke([HumanMessage(content="hi")])
+    assert flaky.calls == 2 and llm.stats.fast_failures == 1
+    now[0] = 11.0  # half-open: one failing trial re-opens the circuit
+    with pytest.raises(HTTPError):
+        llm.invoke([HumanMessage(content="hi")])
+    assert breaker.state == "open"
+    now[0] = 22.0  # next trial succeeds and closes it
+    assert llm.invoke([HumanMessage(content="hi")]).content == "answer 4"
+    assert breaker.state == "closed"
+
+
+def test_client_errors_leave_shared_breaker_closed():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    errors = [HTTPError(400), HTTPError(401), HTTPError(404), ValueError("context length")] * 2
+    llm = ResilientLLM(FlakyLLM(errors=errors), retry=RetryPolicy(max_attempts=1), breaker=breaker)
+    for _ in errors:
+        with pytest.raises((HTTPError, ValueError)):
+            llm.invoke([HumanMessage(content="bad prompt")])
+    assert breaker.state == "closed"
+    assert llm.invoke([HumanMessage(content="hi")]).content.startswith("answer")
+    assert [is_provider_failure(e) for e in (TimeoutError(), HTTPError(429), HTTPError(503))] == [
+        True,
+        True,
+        True,
+    ]
+
+
+def test_interrupted_probe_does_not_strand_half_open_circuit():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 11.0
+    llm = ResilientLLM(FlakyLLM(delays=[1.0]), retry=NO_WAIT, breaker=breaker)
+
+    async def cancelled_probe():
+        await asyncio.wait_for(llm.ainvoke([HumanMessage(content="hi")]), timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(cancelled_probe())
+    # a local error during the next probe neither closes nor strands the circuit
+    llm.llm.errors = [TypeError("bug")]
+    with pytest.raises(TypeError):
+        llm.invoke([HumanMessage(content="hi")])
+    assert breaker.state == "half_open"
+    assert llm.invoke([HumanMessage(content="hi")]).content.startswith("answer")
+    assert breaker.state == "closed"
+
+
+def test_hedged_request_beats_slow_primary():
+    hedge = HedgePolicy(initial_delay=0.05)
+    llm = ResilientLLM(FlakyLLM(delays=[1.0, 0.0]), hedge=hedge)
+    start = time.perf_counter()
+    assert llm.invoke([HumanMessage(content="hi")]).content == "answer 2"
+    assert time.perf_counter() - start < 0.5
+
+    allm = ResilientLLM(FlakyLLM(delays=[1.0, 0.0]), hedge=hedge)
+    start = time.perf_counter()
+    assert asyncio.run(allm.ainvoke([HumanMessage(content="hi")])).content == "answer 2"
+    assert time.perf_counter() - start < 0.5
+    assert llm.stats.hedge_wins == allm.stats.hedge_wins == 1
+
+
+def test_runtime_turn_survives_transient_failure_and_reports_open_circuit(make_runtime):
+    flaky = FlakyLLM(errors=[HTTPError(502)])
+    runtime = make_runtime(ResilientLLM(flaky, retry=NO_WAIT))
+    assert runtime.invoke("s", UserMessageEvent(user_id="u", content="hi"))["response"]
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    down = ResilientLLM(FlakyLLM(errors=[HTTPError(500)] * 5), retry=NO_WAIT, breaker=breaker)
+    runtime = make_runtime(down)
+    with pytest.raises(RuntimeInvocationError) as info:
+        runtime.invoke("s", UserMessageEvent(user_id="u", content="hi"))
+    assert isinstance(info.value.__cause__, CircuitOpenError)
+
+
+def test_tail_latency_and_errors_against_faulty_provider():
+    with FakeOpenAIServer(error_rate=0.15, slow_rate=0.1, slow_latency=0.6, seed=3) as server:
+        registry = ProviderRegistry(HttpPoolConfig())
+        chat = registry.chat_model("stand-in", api_key="sk-local", base_url=server.url)
+        llm = ResilientLLM(
+            chat,
+            retry=RetryPolicy(max_attempts=4, base_delay=0.005),
+            hedge=HedgePolicy(initial_delay=0.05, min_samples=10),
+            seed=0,
+        )
+        latencies = []
+        for _ in range(40):
+            start = time.perf_counter()
+            assert llm.invoke([HumanMessage(content="hi")]).content == "ok"
+            latencies.append(time.perf_counter() - start)
+        registry.close()
+    assert server.errors > 0 and llm.stats.retries > 0 and llm.stats.hedges > 0
+    assert sorted(latencies)[-2] < 0.6  # p95-ish stays below the injected stall
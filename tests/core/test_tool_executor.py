@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from weaver.core.graph import WeaverGraph
+from weaver.core.tool_executor import ConcurrentToolNode
+
+
+@tool
+def slow_notify(recipient: str) -> str:
+    """Pretend to send a slow notification."""
+    time.sleep(0.2)
+    return f"notified {recipient}"
+
+
+@tool
+def hang(seconds: float) -> str:
+    """Block for a long time."""
+    time.sleep(seconds)
+    return "finished"
+
+
+@tool
+def broken(reason: str) -> str:
+    """Always fail."""
+    raise RuntimeError(reason)
+
+
+def _state(*calls):
+    tool_calls = [{"name": n, "args": a, "id": f"c{i}"} for i, (n, a) in enumerate(calls)]
+    return {"input": [AIMessage(content="", tool_calls=tool_calls)]}
+
+
+def test_calls_run_concurrently_and_keep_order():
+    node = ConcurrentToolNode([slow_notify])
+    state = _state(*[("slow_notify", {"recipient": f"u{i}"}) for i in range(4)])
+    start = time.perf_counter()
+    out = node.invoke(state)["input"]
+    assert time.perf_counter() - start < 0.6  # serial would take 0.8s
+    assert [m.content for m in out] == [f"notified u{i}" for i in range(4)]
+    assert [m.tool_call_id for m in out] == ["c0", "c1", "c2", "c3"]
+
+
+def test_timeouts_and_failures_become_tagged_tool_messages():
+    node = ConcurrentToolNode([slow_notify, hang, broken], timeouts={"hang": 0.05})
+    state = _state(
+        ("hang", {"seconds": 0.5}),
+        ("broken", {"reason": "smtp down"}),
+        ("slow_notify", {"recipient": "bob"}),
+        ("missing", {}),
+    )
+    for out in (node.invoke(state)["input"], asyncio.run(node.ainvoke(state))["input"]):
+        assert [m.status for m in out] == ["error", "error", "success", "error"]
+        assert "timed out" in out[0].content
+        assert "smtp down" in out[1].content
+        assert all(
+            m.additional_kwargs.get("error_type") == "ToolExecutionError"
+            for m in out
+            if m.status == "error"
+        )
+
+
+def test_failed_tool_does_not_abort_turn(scripted_llm):
+    call = AIMessage(
+        content="", tool_calls=[{"name": "broken", "args": {"reason": "x"}, "id": "c"}]
+    )
+    llm = scripted_llm([call])
+    graph = WeaverGraph(system_prompt="SYSTEM", llm=llm, tools=[broken])
+    result = graph.app.invoke({"input": [HumanMessage(content="hi")]})
+    types = [m.type for m in result["input"]]
+    assert types == ["human", "ai", "tool", "ai"]
+    # the agent saw the error observation on its next step
+    assert "ToolExecutionError" in llm.seen[-1][-1].content
@@ -0,0 +1,4 @@
+import importlib.util
+
+# The columnar analysis needs the optional ``experiments`` extra (numpy).
+collect_ignore = [] if importlib.util.find_spec("numpy") else ["test_columnar.py"]
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from experiments.columnar import RunTable
+from experiments.metrics import (
+    information_leakage_rate,
+    negotiation_efficiency,
+    task_success_rate,
+)
+
+
+def _records():
+    rng = np.random.default_rng(1)
+    return [
+        {
+            "success": bool(rng.random() < 0.6),
+            "leakage": int(rng.random() < 0.2),
+            "turns": int(rng.integers(2, 12)),
+            "buyer_max": int(rng.choice([100, 120])),
+            "seller_min": 80,
+            "history": ["ignored"],
+        }
+        for _ in range(500)
+    ]
+
+
+def test_summary_matches_list_metrics():
+    records = _records()
+    summary = RunTable.from_records(records).summary(n_boot=500)
+    assert summary["runs"] == 500
+    assert summary["task_success_rate"] == pytest.approx(task_success_rate(records))
+    assert summary["information_leakage_rate"] == pytest.approx(information_leakage_rate(records))
+    assert summary["negotiation_efficiency"] == pytest.approx(negotiation_efficiency(records))
+    won = [r["turns"] for r in records if r["success"]]
+    assert summary["turns_p50"] == pytest.approx(np.percentile(won, 50))
+    low, high = summary["task_success_rate_ci"]
+    assert low < summary["task_success_rate"] < high
+    low, high = summary["negotiation_efficiency_ci"]
+    assert low < summary["negotiation_efficiency"] < high
+
+
+def test_bootstrap_is_seeded():
+    table = RunTable.from_records(_records())
+    assert table.summary(seed=4) == table.summary(seed=4)
+
+
+def test_group_by_config_params():
+    records = _records()
+    groups = RunTable.from_records(records).group_by("buyer_max_budget", "seller_min_price")
+    assert [g["buyer_max_budget"] for g in groups] == [100, 120]
+    for group in groups:
+        subset = [r for r in records if r["buyer_max"] == group["buyer_max_budget"]]
+        assert group["runs"] == len(subset)
+        assert group["task_success_rate"] == pytest.approx(task_success_rate(subset))
+
+
+def test_no_successes():
+    summary = RunTable.from_records([{"success": False, "turns": 3}]).summary()
+    assert summary["negotiation_efficiency"] == 0.0
+    assert summary["turns_p99"] is None
+    assert summary["negotiation_efficiency_ci"] == [None, None]
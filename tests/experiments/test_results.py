@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from experiments.metrics import (
+    RunningMetrics,
+    information_leakage_rate,
+    negotiation_efficiency,
+    task_success_rate,
+)
+from experiments.runner import stream_and_write
+
+CFG = {"runs": 5, "buyer_max_budget": 120, "seller_min_price": 80, "max_rounds": 3}
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("WEAVER_LLM_CACHE_DIR", raising=False)
+
+
+def test_running_metrics_match_list_functions():
+    runs = [
+        {"success": True, "turns": 2, "leakage": 0},
+        {"success": False, "turns": 6, "leakage": 1},
+        {"success": True, "turns": 4},
+    ]
+    running = RunningMetrics()
+    for run in runs:
+        running.update(run)
+    assert running.task_success_rate == task_success_rate(runs)
+    assert running.information_leakage_rate == information_leakage_rate(runs)
+    assert running.negotiation_efficiency == negotiation_efficiency(runs)
+    assert RunningMetrics().as_dict()["task_success_rate"] == 0.0
+
+
+def test_records_streamed_and_resume_skips_completed(tmp_path):
+    full = stream_and_write("zero_shot", CFG, tmp_path / "full")
+
+    out = tmp_path / "crashed"
+    stream_and_write("zero_shot", CFG, out)
+    log = out / "results_zero_shot.jsonl"
+    lines = log.read_text("utf-8").splitlines()
+    assert len(lines) == 5
+    # simulate a crash after two runs, mid-way through writing the third
+    log.write_text("\n".join(lines[:2]) + "\n" + lines[2][:10], encoding="utf-8")
+
+    resumed = stream_and_write("zero_shot", CFG, out, resume=True)
+    records = [json.loads(line) for line in log.read_text("utf-8").splitlines()]
+    assert sorted(r["run_index"] for r in records) == list(range(5))
+    assert resumed == full
+
+
+def test_resume_rejects_different_config(tmp_path):
+    stream_and_write("broadcast", CFG, tmp_path)
+    with pytest.raises(SystemExit):
+        stream_and_write("broadcast", {**CFG, "seller_min_price": 90}, tmp_path, resume=True)
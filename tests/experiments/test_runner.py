@@ -0,0 +1,25 @@
+import pytest
+
+from experiments.runner import derive_seed, run_batch
+
+CFG = {"runs": 6, "buyer_max_budget": 120, "seller_min_price": 80, "max_rounds": 4, "seed": 3}
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("WEAVER_LLM_CACHE_DIR", raising=False)
+
+
+def test_derive_seed_is_stable_and_distinct():
+    assert derive_seed(3, 0) == derive_seed(3, 0)
+    assert len({derive_seed(3, i) for i in range(100)}) == 100
+    assert derive_seed(3, 0) != derive_seed(4, 0)
+
+
+@pytest.mark.parametrize("agent", ["weaver", "zero_shot", "broadcast"])
+def test_results_independent_of_parallelism(agent):
+    serial = run_batch(agent, CFG)
+    assert [r["run_index"] for r in serial] == list(range(6))
+    assert run_batch(agent, CFG, concurrency=4) == serial
+    assert run_batch(agent, CFG, workers=2, concurrency=2) == serial
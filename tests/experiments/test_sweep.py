@@ -0,0 +1,70 @@
+import pytest
+
+from experiments import sweep as sweep_mod
+from experiments.sweep import config_hash, grid, llm_identity, parse_range, sweep, write_table
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("WEAVER_LLM_CACHE_DIR", raising=False)
+
+
+def test_parse_range_and_grid():
+    assert parse_range("100:120:10") == [100, 110, 120]
+    assert parse_range("60,80") == [60, 80]
+    cells = grid(buyer_max_budget=[100, 120], seller_min_price=[80], max_rounds=[2, 4])
+    assert cells[0] == {"buyer_max_budget": 100, "seller_min_price": 80, "max_rounds": 2}
+    assert len(cells) == 4
+
+
+def test_config_hash_is_order_independent():
+    a = {"runs": 2, "buyer_max_budget": 100, "seller_min_price": 80}
+    b = dict(reversed(list(a.items())))
+    assert config_hash("weaver", a) == config_hash("weaver", b)
+    assert config_hash("weaver", a) != config_hash("broadcast", a)
+
+
+def test_config_hash_covers_model_and_provider(monkeypatch):
+    cell = {"runs": 2, "buyer_max_budget": 100, "seller_min_price": 80}
+    for name in ("OPENAI_API_KEY", "OPENAI_API_BASE", "OPENAI_BASE_URL", "WEAVER_LLM_CACHE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("WEAVER_MODEL", "model-a")
+    hashes = {config_hash("weaver", cell)}
+    monkeypatch.setenv("WEAVER_MODEL", "model-b")
+    hashes.add(config_hash("weaver", cell))
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://localhost:8000/v1")
+    hashes.add(config_hash("weaver", cell))
+    assert len(hashes) == 3
+    assert llm_identity()["provider"] == "offline"
+
+
+def test_extending_grid_runs_only_new_cells(tmp_path, monkeypatch):
+    calls = []
+    real_run_cell = sweep_mod.run_cell
+
+    def counting_run_cell(agent, cell_cfg, concurrency=1):
+        calls.append(cell_cfg)
+        return real_run_cell(agent, cell_cfg, concurrency)
+
+    monkeypatch.setattr(sweep_mod, "run_cell", counting_run_cell)
+    small = grid(buyer_max_budget=[100, 120], seller_min_price=[80], max_rounds=[2])
+    rows = sweep("weaver", small, tmp_path, runs=2)
+    assert len(calls) == 2 and [r["buyer_max_budget"] for r in rows] == [100, 120]
+
+    larger = grid(buyer_max_budget=[100, 120], seller_min_price=[80, 110], max_rounds=[2])
+    rows = sweep("weaver", larger, tmp_path, runs=2)
+    assert len(calls) == 4  # only the two seller_min_price=110 cells ran
+    assert [(r["buyer_max_budget"], r["seller_min_price"]) for r in rows] == [
+        (100, 80),
+        (100, 110),
+        (120, 80),
+        (120, 110),
+    ]
+    by_cell = {(r["buyer_max_budget"], r["seller_min_price"]): r for r in rows}
+    assert by_cell[(100, 110)]["task_success_rate"] == 0.0
+    assert by_cell[(120, 80)]["task_success_rate"] == 1.0
+
+    table = write_table(rows, tmp_path, "weaver").read_text("utf-8").splitlines()
+    assert table[0].startswith("agent,buyer_max_budget,seller_min_price,max_rounds")
+    assert len(table) == 5
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import tool
+
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.streaming import StreamTranslator
+
+
+class LoopingLLM(Runnable):
+    """Calls a tool on every tool-bound step; answers plainly only without tools."""
+
+    def __init__(self, tools_bound: bool = False, parent: "LoopingLLM | None" = None):
+        self.tools_bound = tools_bound
+        self.parent = parent
+        self.calls = 0
+        self.seen: list = []
+
+    def bind_tools(self, tools):
+        return LoopingLLM(tools_bound=True, parent=self)
+
+    def invoke(self, messages, config=None, **kwargs):  # type: ignore[override]
+        root = self.parent or self
+        root.calls += 1
+        root.seen.append(list(messages))
+        if not self.tools_bound:
+            return AIMessage(content=f"final after {root.calls}")
+        n = root.calls
+        return AIMessage(content="", tool_calls=[{"name": "slow", "args": {"n": n}, "id": f"c{n}"}])
+
+
+def _slow_tool(delay=0.0):
+    @tool
+    def slow(n: int) -> str:
+        """Slow lookup."""
+        time.sleep(delay)
+        return f"result {n}"
+
+    return slow
+
+
+def test_max_steps_forces_final_answer(make_runtime):
+    llm = LoopingLLM()
+    runtime = make_runtime(llm, tools=[_slow_tool()])
+    out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content="go"), max_steps=3)
+    assert out["response"] == "final after 3"
+    assert out["steps_used"] == 3
+    assert out["steps_remaining"] == 0
+    assert out["budget_exhausted"] is True
+    history = runtime._histories["s1"]
+    assert [m.type for m in history] == ["human", "ai", "tool", "ai", "tool", "ai"]
+    assert not history[-1].tool_calls
+    # the forced step tells the model to stop calling tools
+    assert "budget" in llm.seen[-1][-1].content
+
+
+def test_budget_not_exhausted_reports_remaining(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm(), tools=[_slow_tool()], max_steps=5, timeout=30)
+    out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content="hi"))
+    assert out["steps_used"] == 1
+    assert out["steps_remaining"] == 4
+    assert 0 < out["time_remaining"] <= 30
+    assert out["budget_exhausted"] is False
+
+
+def test_no_budget_reports_steps_only(scripted_llm, make_runtime):
+    out = make_runtime(scripted_llm(), tools=[_slow_tool()]).invoke(
+        "s1", UserMessageEvent(user_id="u1", content="hi")
+    )
+    assert out["steps_used"] == 1
+    assert out["steps_remaining"] is None and out["time_remaining"] is None
+
+
+def test_large_max_steps_raises_recursion_limit(make_runtime):
+    runtime = make_runtime(LoopingLLM(), tools=[_slow_tool()])
+    out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content="go"), max_steps=20)
+    assert out["steps_used"] == 20 and out["budget_exhausted"] is True
+
+
+def test_deadline_stops_loop_and_clips_tools(make_runtime):
+    llm = LoopingLLM()
+    runtime = make_runtime(llm, tools=[_slow_tool(0.2)])
+    started = time.monotonic()
+    out = asyncio.run(
+        runtime.ainvoke("s1", UserMessageEvent(user_id="u1", content="go"), timeout=0.3)
+    )
+    assert time.monotonic() - started < 1.5
+    assert out["budget_exhausted"] is True
+    assert out["time_remaining"] == 0.0
+    assert out["response"].startswith("final after")
+
+
+def test_stream_reports_budget(make_runtime):
+    runtime = make_runtime(LoopingLLM(), tools=[_slow_tool()])
+    events = list(runtime.stream("s1", UserMessageEvent(user_id="u1", content="go"), max_steps=2))
+    result = events[-1].result
+    assert result["steps_used"] == 2 and result["budget_exhausted"] is True
+
+
+def test_translator_tracks_state_keys():
+    translator = StreamTranslator()
+    list(translator.feed("updates", {"agent": {"input": [], "steps": 2}}))
+    assert translator.result_state([])["steps"] == 2
@@ -0,0 +1,64 @@
+import pytest
+from langchain_core.messages import HumanMessage
+
+from weaver.exceptions import ConfigurationError
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.cache import ResidentSpaceCache
+from weaver.runtime.coordinator import MemoryCoordinator
+from weaver.runtime.store import InMemoryStore
+
+
+def _msgs(space, n):
+    return [
+        HumanMessage(content=f"{space}-{i}", additional_kwargs={"user_id": "u"}) for i in range(n)
+    ]
+
+
+def test_lru_eviction_by_space_count_with_counters():
+    evicted = []
+    cache = ResidentSpaceCache(max_spaces=2, on_evict=lambda sid, h: evicted.append(sid))
+    cache["a"], cache["b"] = [], []
+    assert cache.get("a") == []  # hit, refreshes "a"
+    cache["c"] = []
+    assert evicted == ["b"]
+    assert cache.get("b") is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.resident_spaces) == (1, 1, 1, 2)
+
+
+def test_eviction_by_approximate_bytes():
+    cache = ResidentSpaceCache(max_bytes=20_000)
+    for i in range(10):
+        cache[f"s{i}"] = _msgs(f"s{i}", 10)
+    assert 0 < cache.stats.resident_bytes <= 20_000
+    assert len(cache) < 10
+    assert "s9" in cache
+
+
+def test_write_back_flushes_dirty_space_on_eviction():
+    store = InMemoryStore()
+    memory = MemoryCoordinator(ResidentSpaceCache(max_spaces=1), store=store, write_back=True)
+    memory.append("a", _msgs("a", 3))
+    assert store.load("a") == []  # buffered
+    memory.append("b", _msgs("b", 1))  # evicts "a" -> write back
+    assert [m.content for m in store.load("a")] == ["a-0", "a-1", "a-2"]
+    # reloading "a" evicts "b", whose history is written back as well
+    assert len(memory.prepare_context("a", "u")) == 3
+    assert len(store.load("b")) == 1
+    assert [m.content for m in memory.project("a", "u")] == ["a-0", "a-1", "a-2"]
+
+
+def test_cache_requires_store():
+    with pytest.raises(ConfigurationError):
+        MemoryCoordinator(ResidentSpaceCache(max_spaces=1))
+
+
+def test_runtime_keeps_resident_spaces_bounded(scripted_llm, make_runtime):
+    store = InMemoryStore()
+    runtime = make_runtime(scripted_llm(), store=store, residency=ResidentSpaceCache(max_spaces=3))
+    for round_ in range(2):
+        for i in range(10):
+            runtime.invoke(f"s{i}", UserMessageEvent(user_id="u", content=f"r{round_}"))
+    assert len(runtime._histories) == 3
+    assert runtime._histories.stats.evictions > 0
+    assert [m.content for m in store.load("s0") if m.type == "human"] == ["r0", "r1"]
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from weaver.exceptions import ConfigurationError, RuntimeInvocationError
+from weaver.models.events import UserMessageEvent
+from weaver.models.stream import FinalResultEvent
+from weaver.runtime.checkpoint import memory_checkpointer, sqlite_checkpointer
+from weaver.runtime.context import ContextWindow
+from weaver.runtime.store import SQLiteMemoryStore
+
+from tests.conftest import ScriptedLLM
+
+
+class RecordingSaver(InMemorySaver):
+    """Records how many messages each checkpoint carries."""
+
+    def __init__(self):
+        super().__init__()
+        self.sizes = []
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self.sizes.append(len(checkpoint["channel_values"].get("input", [])))
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
+class FlakyLLM(ScriptedLLM):
+    """Fails its ``fail_on``-th call once."""
+
+    def __init__(self, responses=None, fail_on=2):
+        super().__init__(responses)
+        self.fail_on = fail_on
+
+    def invoke(self, messages, config=None, **kwargs):
+        if self.calls + 1 == self.fail_on:
+            self.calls += 1
+            raise TimeoutError("provider timed out")
+        return super().invoke(messages, config)
+
+
+def _tool_call():
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": "post_to_shared", "args": {"content": "hi all"}, "id": "c1"}],
+    )
+
+
+def _thread(runtime, space_id):
+    return runtime.graph.compile(runtime.checkpointer).get_state(
+        {"configurable": {"thread_id": space_id}}
+    )
+
+
+def test_checkpoints_hold_only_the_in_flight_turn(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    saver = RecordingSaver()
+    runtime = make_runtime(llm, checkpointer=saver)
+    for turn in range(1, 21):
+        out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content=f"msg {turn}"))
+        assert out["messages_appended"] == 2 and out["steps_used"] == 1
+    # the agent still sees the whole history, but no checkpoint grows with it
+    assert len(llm.seen[-1]) == 1 + 39
+    assert max(saver.sizes) == 2
+    assert not saver.storage and not saver.writes
+
+
+def test_interrupted_turn_resumes_from_checkpoint(make_runtime):
+    llm = FlakyLLM([_tool_call()])
+    runtime = make_runtime(llm, checkpointer=memory_checkpointer())
+    with pytest.raises(RuntimeInvocationError):
+        runtime.invoke("s1", UserMessageEvent(user_id="u1", content="hello"))
+    assert runtime._histories["s1"] == []
+    assert _thread(runtime, "s1").next == ("agent",)
+
+    out = runtime.resume("s1")
+    # the tool step is not repeated: only the failed agent step runs again
+    assert llm.calls == 3
+    assert out["user_id"] == "u1" and out["messages_appended"] == 4
+    assert [m.type for m in runtime._histories["s1"]] == ["human", "ai", "tool", "ai"]
+    assert runtime.resume("s1") is None
+
+
+def test_new_turn_discards_interrupted_one(scripted_llm, make_runtime):
+    runtime = make_runtime(FlakyLLM(fail_on=1), checkpointer=memory_checkpointer())
+    with pytest.raises(RuntimeInvocationError):
+        runtime.invoke("s1", UserMessageEvent(user_id="u1", content="lost"))
+    out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content="again"))
+    assert out["messages_appended"] == 2
+    assert [m.content for m in runtime._histories["s1"] if m.type == "human"] == ["again"]
+    assert runtime.resume("s1") is None
+
+
+def test_sqlite_checkpoint_resumes_after_restart(tmp_path, scripted_llm, make_runtime):
+    pytest.importorskip("langgraph.checkpoint.sqlite")
+    path = tmp_path / "threads.db"
+    store = SQLiteMemoryStore(tmp_path / "memory.db")
+    first = make_runtime(FlakyLLM(fail_on=2), checkpointer=sqlite_checkpointer(path), store=store)
+    first.invoke("s1", UserMessageEvent(user_id="u1", content="hello"))
+    with pytest.raises(RuntimeInvocationError):
+        first.invoke("s1", UserMessageEvent(user_id="u2", content="hi"))
+
+    llm = scripted_llm()
+    saver = sqlite_checkpointer(path)
+    second = make_runtime(llm, checkpointer=saver, store=store)
+    out = second.resume("s1")
+    assert out["user_id"] == "u2" and out["messages_appended"] == 2
+    assert len(llm.seen[-1]) == 1 + 3  # system prompt + stored turn + resumed turn
+    assert saver.get_tuple({"configurable": {"thread_id": "s1"}}) is None
+
+
+def test_async_and_stream_paths(tmp_path, scripted_llm, make_runtime):
+    pytest.importorskip("langgraph.checkpoint.sqlite")
+    saver = sqlite_checkpointer(tmp_path / "threads.db")
+    runtime = make_runtime(scripted_llm(), checkpointer=saver)
+
+    async def run():
+        await runtime.ainvoke("s1", UserMessageEvent(user_id="u1", content="one"))
+        events = [
+            e async for e in runtime.astream("s1", UserMessageEvent(user_id="u2", content="two"))
+        ]
+        return events, await runtime.aresume("s1")
+
+    events, resumed = asyncio.run(run())
+    assert isinstance(events[-1], FinalResultEvent)
+    assert events[-1].result["messages_appended"] == 2 and resumed is None
+    events = list(runtime.stream("s1", UserMessageEvent(user_id="u1", content="three")))
+    assert events[-1].result["messages_appended"] == 2
+    assert len(runtime._histories["s1"]) == 6
+    assert saver.get_tuple({"configurable": {"thread_id": "s1"}}) is None
+
+
+def test_checkpointer_with_context_window(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    runtime = make_runtime(
+        llm,
+        checkpointer=memory_checkpointer(),
+        context_window=ContextWindow(5, token_counter=lambda message: 1),
+    )
+    for turn in range(5):
+        runtime.invoke("s1", UserMessageEvent(user_id="u1", content=f"msg {turn}"))
+    assert len(runtime._histories["s1"]) == 10
+    assert len(llm.seen[-1]) <= 1 + 5  # trimmed history + new message, not all 9
+    with pytest.raises(ConfigurationError):
+        make_runtime(scripted_llm()).resume("s1")
@@ -0,0 +1,49 @@
+from langchain_core.messages import AIMessage, HumanMessage
+
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.compaction import HistoryCompactor
+
+
+def _history(n):
+    return [HumanMessage(content=f"m{i}", id=f"m{i}") for i in range(n)]
+
+
+def test_compaction_folds_old_turns_into_summary(scripted_llm):
+    llm = scripted_llm([AIMessage(content="SUMMARY-1")])
+    compactor = HistoryCompactor(llm, threshold=10, keep_recent=4)
+    history = _history(12)
+    assert compactor.maybe_schedule("s", history[:10]) is None
+    compactor.maybe_schedule("s", history).result()
+    context = compactor.context("s", history)
+    assert context[0].type == "system" and "SUMMARY-1" in context[0].content
+    assert [m.content for m in context[1:]] == ["m8", "m9", "m10", "m11"]
+    compactor.shutdown()
+
+
+def test_checkpoints_fold_hierarchically(scripted_llm):
+    compactor = HistoryCompactor(scripted_llm(), threshold=3, keep_recent=1, fanout=2)
+    history = []
+    for i in range(3):
+        history.extend(_history(4 * (i + 1))[len(history) :])
+        compactor.compact("s", history)
+    levels = [cp.level for cp in compactor.checkpoints("s")]
+    assert levels == [1, 0]
+    assert compactor.checkpoints("s")[-1].covers_until == len(history) - 1
+    compactor.shutdown()
+
+
+def test_runtime_serves_summary_plus_tail(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    compactor = HistoryCompactor(threshold=8, keep_recent=4)
+    runtime = make_runtime(llm, compactor=compactor)
+    assert compactor.llm is llm
+    for i in range(6):
+        runtime.invoke("s", UserMessageEvent(user_id="u", content=f"turn {i}"))
+        compactor.wait_idle()
+    assert len(runtime._histories["s"]) == 12
+    assert compactor.checkpoints("s")
+    prompt = llm.seen[-1]
+    # graph system prompt, summary preamble, then a bounded verbatim tail
+    assert prompt[1].additional_kwargs.get("weaver_summary")
+    assert len(prompt) < 12
+    compactor.shutdown()
@@ -0,0 +1,83 @@
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.context import ContextWindow
+
+
+def _unit(message):
+    return 10
+
+
+def _msg(cls, content, idx, **kwargs):
+    return cls(content=content, id=f"m{idx}", **kwargs)
+
+
+def test_selects_newest_messages_within_budget():
+    history = [_msg(HumanMessage, f"h{i}", i) for i in range(10)]
+    window = ContextWindow(max_tokens=35, token_counter=_unit)
+    assert [m.content for m in window.select(history)] == ["h7", "h8", "h9"]
+
+
+def test_keeps_leading_system_and_latest_human():
+    history = [
+        _msg(SystemMessage, "summary", 0),
+        _msg(HumanMessage, "old", 1),
+        _msg(HumanMessage, "latest", 2),
+        _msg(AIMessage, "a" * 400, 3),
+    ]
+    window = ContextWindow(max_tokens=20)
+    selected = [m.content for m in window.select(history)]
+    assert selected[0] == "summary"
+    assert "latest" in selected
+    assert "old" not in selected
+
+
+def test_never_splits_tool_call_block():
+    call = AIMessage(
+        content="",
+        id="ai",
+        tool_calls=[
+            {"name": "reply_privately", "args": {"recipient": "a", "content": "x"}, "id": "c1"},
+            {"name": "post_to_shared", "args": {"content": "y"}, "id": "c2"},
+        ],
+    )
+    history = [
+        _msg(HumanMessage, "q", 0),
+        call,
+        ToolMessage(content="r1", tool_call_id="c1", id="t1"),
+        ToolMessage(content="r2", tool_call_id="c2", id="t2"),
+        _msg(AIMessage, "done", 4),
+    ]
+    # budget fits "done" + one tool message, but not the whole block
+    window = ContextWindow(max_tokens=25, token_counter=_unit)
+    selected = window.select(history)
+    assert [m.id for m in selected] == ["m0", "m4"]
+    window = ContextWindow(max_tokens=50, token_counter=_unit)
+    assert [m.id for m in window.select(history)] == ["m0", "ai", "t1", "t2", "m4"]
+
+
+def test_token_counts_are_cached_per_message():
+    counted = []
+
+    def counter(message):
+        counted.append(message.id)
+        return 1
+
+    window = ContextWindow(max_tokens=1000, token_counter=counter)
+    history = [_msg(HumanMessage, str(i), i) for i in range(5)]
+    window.select(history)
+    history.append(_msg(HumanMessage, "new", 5))
+    counted.clear()
+    window.select(history)
+    assert counted == ["m5"]
+
+
+def test_runtime_prompt_stays_bounded(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    runtime = make_runtime(llm, context_window=ContextWindow(max_tokens=400))
+    for i in range(40):
+        runtime.invoke("s", UserMessageEvent(user_id="u", content=f"message number {i} " * 5))
+    assert len(runtime._histories["s"]) == 80
+    # system prompt + windowed history, far below the full 80 messages
+    assert len(llm.seen[-1]) < 20
+    assert llm.seen[-1][-1].content.startswith("message number 39")
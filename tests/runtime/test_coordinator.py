@@ -0,0 +1,21 @@
+from langchain_core.messages import AIMessage, HumanMessage
+
+from weaver.runtime.coordinator import MemoryCoordinator
+
+
+def test_append_assigns_ids_and_dedupes():
+    histories = {}
+    memory = MemoryCoordinator(histories)
+    first = [HumanMessage(content="a"), AIMessage(content="b")]
+    assert memory.append("s", first) == 2
+    assert all(m.id for m in histories["s"])
+    # re-submitting the same messages (e.g. full state echo) is a no-op
+    assert memory.append("s", first + [HumanMessage(content="c")]) == 1
+    assert [m.content for m in histories["s"]] == ["a", "b", "c"]
+
+
+def test_prepopulated_history_is_indexed():
+    existing = HumanMessage(content="old", id="m-1")
+    memory = MemoryCoordinator({"s": [existing]})
+    assert memory.append("s", [HumanMessage(content="old", id="m-1")]) == 0
+    assert len(memory.prepare_context("s", "u")) == 1
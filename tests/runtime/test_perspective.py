@@ -0,0 +1,49 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from benchmarks.perspective import build_space
+from weaver.runtime.coordinator import MemoryCoordinator
+from weaver.runtime.perspective import PerspectiveIndex, project_history
+
+
+def _turn(user, private_to=None, shared=False, n=0):
+    calls = []
+    if private_to:
+        calls.append({"name": "reply_privately", "args": {"recipient": private_to}, "id": f"p{n}"})
+    if shared:
+        calls.append({"name": "post_to_shared", "args": {"content": "s"}, "id": f"s{n}"})
+    msgs = [
+        HumanMessage(content=f"{user}-{n}", additional_kwargs={"user_id": user}),
+        AIMessage(content="", tool_calls=calls),
+    ]
+    msgs += [ToolMessage(content=c["name"], name=c["name"], tool_call_id=c["id"]) for c in calls]
+    msgs.append(AIMessage(content=f"answer-{n}"))
+    return msgs
+
+
+def test_private_replies_only_reach_their_recipient():
+    memory = MemoryCoordinator({})
+    memory.append("s", _turn("alice", private_to="alice", shared=True, n=0))
+    memory.append("s", _turn("bob", private_to="bob", n=1))
+    alice = [m.content for m in memory.project("s", "alice")]
+    bob = [m.content for m in memory.project("s", "bob")]
+    assert alice == ["alice-0", "reply_privately", "post_to_shared", "answer-0"]
+    assert bob == ["post_to_shared", "bob-1", "reply_privately", "answer-1"]
+    # late joiner sees the shared backlog only
+    assert [m.content for m in memory.project("s", "carol")] == ["post_to_shared"]
+
+
+def test_index_matches_naive_projection_for_many_participants():
+    history = build_space(participants=12, turns=300, seed=7)
+    index = PerspectiveIndex()
+    for start in range(0, len(history), 17):  # incremental, uneven batches
+        index.observe("s", history[start : start + 17])
+    for i in range(12):
+        user = f"user{i}"
+        assert index.view("s", user) == project_history(history, user)
+
+
+def test_prepopulated_history_is_projected_lazily():
+    history = _turn("alice", private_to="alice", n=0)
+    memory = MemoryCoordinator({"s": history})
+    assert len(memory.project("s", "alice")) == 3
+    assert memory.project("s", "bob") == []
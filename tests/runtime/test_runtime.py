@@ -0,0 +1,87 @@
+import asyncio
+import os
+
+from langchain_core.messages import AIMessage
+
+from weaver.core.graph import WeaverGraph
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.runtime import load_env
+
+
+def test_history_grows_linearly_with_turns(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm())
+    for turn in range(1, 21):
+        out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content=f"msg {turn}"))
+        # one human message + one AI reply per turn, never the whole history again
+        assert out["messages_appended"] == 2
+        assert len(runtime._histories["s1"]) == 2 * turn
+    ids = [m.id for m in runtime._histories["s1"]]
+    assert len(set(ids)) == len(ids)
+
+
+def test_tool_loop_messages_persisted_once(scripted_llm, make_runtime):
+    tool_call = AIMessage(
+        content="",
+        tool_calls=[{"name": "post_to_shared", "args": {"content": "hi all"}, "id": "c1"}],
+    )
+    runtime = make_runtime(scripted_llm([tool_call]))
+    out = runtime.invoke("s1", UserMessageEvent(user_id="u1", content="hello"))
+    # human, AI tool call, tool result, final AI answer
+    assert out["messages_appended"] == 4
+    types = [m.type for m in runtime._histories["s1"]]
+    assert types == ["human", "ai", "tool", "ai"]
+    runtime.invoke("s1", UserMessageEvent(user_id="u2", content="again"))
+    assert len(runtime._histories["s1"]) == 6
+
+
+def test_ainvoke_matches_sync_shape(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm())
+    out = asyncio.run(runtime.ainvoke("s1", UserMessageEvent(user_id="u1", content="hi")))
+    assert out["messages_appended"] == 2
+    assert out["response"].startswith("(fake)")
+
+
+def test_abatch_concurrent_across_spaces_serial_within(scripted_llm, make_runtime):
+    llm = scripted_llm(delay=0.05)
+    runtime = make_runtime(llm)
+    items = [(f"space{i % 4}", UserMessageEvent(user_id="u", content=f"m{i}")) for i in range(12)]
+    results = asyncio.run(runtime.abatch(items))
+    assert [r["space_id"] for r in results] == [sid for sid, _ in items]
+    # four spaces in parallel, never two turns of the same space at once
+    assert llm.max_in_flight == 4
+    for i in range(4):
+        contents = [m.content for m in runtime._histories[f"space{i}"] if m.type == "human"]
+        assert contents == [f"m{j}" for j in range(i, 12, 4)]
+    assert len(runtime._space_locks) == 0
+
+
+def test_abatch_max_concurrency(scripted_llm, make_runtime):
+    llm = scripted_llm(delay=0.02)
+    runtime = make_runtime(llm)
+    items = [(f"s{i}", UserMessageEvent(user_id="u", content="x")) for i in range(6)]
+    asyncio.run(runtime.abatch(items, max_concurrency=2))
+    assert llm.max_in_flight == 2
+
+
+def test_invoke_many_single_turn_for_several_messages(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    runtime = make_runtime(llm)
+    events = [UserMessageEvent(user_id=u, content=f"from {u}") for u in ("u1", "u2")]
+    out = runtime.invoke_many("s1", events)
+    assert llm.calls == 1
+    assert out["user_id"] == "u2" and out["events_merged"] == 2
+    assert [m.type for m in runtime._histories["s1"]] == ["human", "human", "ai"]
+    assert runtime._histories["s1"][1].additional_kwargs["user_id"] == "u2"
+
+
+def test_dotenv_loaded_only_on_request(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("WEAVER_TEST_DOTENV=from-file\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("WEAVER_TEST_DOTENV", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    WeaverGraph(llm=None)  # building a default graph must not read .env
+    assert "WEAVER_TEST_DOTENV" not in os.environ
+    assert load_env() is True
+    assert os.environ["WEAVER_TEST_DOTENV"] == "from-file"
+    monkeypatch.delenv("WEAVER_TEST_DOTENV")
@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from weaver.exceptions import BackpressureError
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.scheduler import OverflowPolicy, SpaceScheduler
+
+
+def _event(content):
+    return UserMessageEvent(user_id="u", content=content)
+
+
+def test_worker_pool_bounds_concurrency_and_keeps_order(scripted_llm, make_runtime):
+    llm = scripted_llm(delay=0.02)
+    runtime = make_runtime(llm)
+    scheduler = SpaceScheduler(runtime, max_workers=2, inbox_size=10)
+
+    async def scenario():
+        futures = [await scheduler.enqueue(f"s{i % 3}", _event(f"m{i}")) for i in range(9)]
+        return await asyncio.gather(*futures)
+
+    results = asyncio.run(scenario())
+    assert len(results) == 9
+    assert llm.max_in_flight == 2
+    humans = [m.content for m in runtime._histories["s0"] if m.type == "human"]
+    assert humans == ["m0", "m3", "m6"]
+    stats = scheduler.totals
+    assert stats.processed == 9 and stats.queue_depth == 0
+    assert stats.max_wait >= stats.avg_wait > 0
+    # idle actors are dropped; their counters live on in the totals
+    assert len(scheduler) == 0 and scheduler.stats("s0").processed == 0
+
+
+def test_reject_policy_raises_when_inbox_full(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm(delay=0.05))
+    scheduler = SpaceScheduler(runtime, max_workers=1, inbox_size=1, overflow="reject")
+
+    async def scenario():
+        first = await scheduler.enqueue("hot", _event("a"))
+        with pytest.raises(BackpressureError):
+            await scheduler.enqueue("hot", _event("b"))
+        await first
+
+    asyncio.run(scenario())
+    assert scheduler.totals.rejected == 1
+
+
+def test_drop_oldest_fails_the_evicted_event(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm(delay=0.05))
+    scheduler = SpaceScheduler(runtime, max_workers=1, inbox_size=1, overflow="drop_oldest")
+
+    async def scenario():
+        running = await scheduler.enqueue("hot", _event("a"))
+        await asyncio.sleep(0)  # let the actor pick up "a"
+        oldest = await scheduler.enqueue("hot", _event("b"))
+        newest = await scheduler.enqueue("hot", _event("c"))
+        await running
+        with pytest.raises(BackpressureError):
+            await oldest
+        return await newest
+
+    asyncio.run(scenario())
+    assert scheduler.totals.dropped == 1
+    humans = [m.content for m in runtime._histories["hot"] if m.type == "human"]
+    assert humans == ["a", "c"]
+
+
+def test_block_policy_waits_for_free_slot(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm(delay=0.01))
+    scheduler = SpaceScheduler(runtime, max_workers=1, inbox_size=1, overflow=OverflowPolicy.BLOCK)
+
+    async def scenario():
+        results = await asyncio.gather(*(scheduler.submit("hot", _event(str(i))) for i in range(5)))
+        await scheduler.join()
+        return results
+
+    assert len(asyncio.run(scenario())) == 5
+    assert scheduler.totals.processed == 5 and len(scheduler) == 0
+
+
+def test_coalescing_window_merges_burst_into_one_turn(scripted_llm, make_runtime):
+    llm = scripted_llm(delay=0.02)
+    runtime = make_runtime(llm)
+    scheduler = SpaceScheduler(runtime, coalesce_ms=50)
+
+    async def scenario():
+        futures = []
+        for i, user in enumerate(["alice", "bob", "carol"]):
+            futures.append(
+                await scheduler.enqueue("room", UserMessageEvent(user_id=user, content=f"m{i}"))
+            )
+            await asyncio.sleep(0.01)
+        return await asyncio.gather(*futures)
+
+    results = asyncio.run(scenario())
+    assert llm.calls == 1
+    # the single turn saw every new human message, in arrival order
+    humans = [m.content for m in llm.seen[0] if m.type == "human"]
+    assert humans == ["m0", "m1", "m2"]
+    assert {r["response"] for r in results} == {results[0]["response"]}
+    assert [r["user_id"] for r in results] == ["alice", "bob", "carol"]
+    assert results[0]["events_merged"] == 3 and results[0]["messages_appended"] == 4
+    stats = scheduler.totals
+    assert stats.processed == 3 and stats.turns == 1 and stats.coalesced == 2
+
+
+def test_coalescing_window_per_space_and_max_batch(scripted_llm, make_runtime):
+    llm = scripted_llm()
+    runtime = make_runtime(llm)
+    scheduler = SpaceScheduler(runtime, coalesce_ms=30, max_coalesce=2)
+    scheduler.set_coalesce_window("solo", 0)
+
+    async def scenario():
+        futures = [await scheduler.enqueue("group", _event(f"g{i}")) for i in range(5)]
+        futures += [await scheduler.enqueue("solo", _event(f"s{i}")) for i in range(2)]
+        await asyncio.gather(*futures)
+
+    asyncio.run(scenario())
+    # group: 2 + 2 + 1 events in 3 turns; solo: 2 uncoalesced turns
+    assert llm.calls == 5
+    assert scheduler.totals.turns == 5 and scheduler.totals.coalesced == 2
+    humans = [m.content for m in runtime._histories["group"] if m.type == "human"]
+    assert humans == [f"g{i}" for i in range(5)]
+
+
+def test_coalesced_failure_propagates_to_every_caller(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm())
+    scheduler = SpaceScheduler(runtime, coalesce_ms=20)
+
+    async def boom(space_id, events, **kwargs):
+        raise RuntimeError("llm down")
+
+    runtime.ainvoke_many = boom
+
+    async def scenario():
+        futures = [await scheduler.enqueue("s", _event(f"m{i}")) for i in range(3)]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert scheduler.totals.failed == 3
+
+
+def test_live_stats_while_queued_and_actor_dropped_when_idle(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm(delay=0.02))
+    scheduler = SpaceScheduler(runtime, max_workers=1, inbox_size=4)
+
+    async def scenario():
+        futures = [await scheduler.enqueue(f"s{i}", _event("x")) for i in range(50)]
+        futures += [await scheduler.enqueue("s0", _event("y"))]
+        live = scheduler.stats("s0").queue_depth
+        await asyncio.gather(*futures)
+        return live
+
+    assert asyncio.run(scenario()) == 2
+    assert len(scheduler) == 0 and scheduler.snapshot() == {}
+    assert scheduler.totals.processed == 51 and scheduler.totals.turns == 51
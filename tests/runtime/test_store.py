@@ -0,0 +1,79 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from weaver.models.events import UserMessageEvent
+from weaver.runtime.coordinator import MemoryCoordinator
+from weaver.runtime.store import InMemoryStore, SQLiteMemoryStore
+
+
+def test_sqlite_roundtrip_preserves_message_types(tmp_path):
+    store = SQLiteMemoryStore(tmp_path / "weaver.db")
+    call = {"name": "post_to_shared", "args": {"content": "x"}, "id": "c1"}
+    messages = [
+        HumanMessage(content="你好", id="h", additional_kwargs={"user_id": "u1"}),
+        AIMessage(content="", id="a", tool_calls=[call]),
+        ToolMessage(content="[shared] x", name="post_to_shared", tool_call_id="c1", id="t"),
+    ]
+    store.append("s", messages)
+    store.append("s", messages[:1])  # duplicate ids are ignored
+    loaded = store.load("s")
+    assert [m.id for m in loaded] == ["h", "a", "t"]
+    assert loaded[0].additional_kwargs["user_id"] == "u1"
+    assert loaded[1].tool_calls[0]["args"] == {"content": "x"}
+    assert [m.id for m in store.recent("s", 2)] == ["a", "t"]
+    (mode,) = store._conn.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+    store.close()
+
+
+def test_recent_window_never_starts_with_orphan_tool_results(tmp_path):
+    call = {"name": "post_to_shared", "args": {"content": "x"}, "id": "c1"}
+    log = [
+        HumanMessage(content="hi", id="h"),
+        AIMessage(content="", id="a1", tool_calls=[call]),
+        ToolMessage(content="[shared] x", tool_call_id="c1", id="t"),
+        AIMessage(content="done", id="a2"),
+    ]
+    for store in (SQLiteMemoryStore(tmp_path / "weaver.db"), InMemoryStore()):
+        store.append("s", log)
+        assert [m.id for m in store.load("s", 2)] == ["a2"]
+        assert [m.id for m in store.load("s", 3)] == ["a1", "t", "a2"]
+        memory = MemoryCoordinator({}, store=store, load_recent=2)
+        assert [m.type for m in memory.prepare_context("s", "u")] == ["ai"]
+
+
+def test_two_stores_share_one_file(tmp_path):
+    path = tmp_path / "weaver.db"
+    first, second = SQLiteMemoryStore(path), SQLiteMemoryStore(path)
+    first.append("s", [HumanMessage(content="a1", id="a1")])
+    second.append("s", [HumanMessage(content="b1", id="b1")])
+    first.append("s", [HumanMessage(content="a2", id="a2"), HumanMessage(content="b1", id="b1")])
+    assert [m.content for m in second.load("s")] == ["a1", "b1", "a2"]
+    assert first.count("s") == 3
+
+
+def test_runtime_history_survives_restart(tmp_path, scripted_llm, make_runtime):
+    path = tmp_path / "weaver.db"
+    first = make_runtime(scripted_llm(), store=SQLiteMemoryStore(path))
+    for i in range(3):
+        first.invoke("s", UserMessageEvent(user_id="u", content=f"m{i}"))
+    first.memory.store.close()
+
+    llm = scripted_llm()
+    second = make_runtime(llm, store=SQLiteMemoryStore(path))
+    assert second._histories == {}  # nothing resident until first access
+    second.invoke("s", UserMessageEvent(user_id="u", content="after restart"))
+    assert [m.content for m in llm.seen[0] if m.type == "human"] == [
+        "m0",
+        "m1",
+        "m2",
+        "after restart",
+    ]
+    assert second.memory.store.count("s") == 8
+
+
+def test_lazy_load_recent_only(tmp_path):
+    store = SQLiteMemoryStore(tmp_path / "weaver.db")
+    store.append("s", [HumanMessage(content=str(i), id=str(i)) for i in range(50)])
+    memory = MemoryCoordinator({}, store=store, load_recent=10)
+    context = memory.prepare_context("s", "u")
+    assert [m.content for m in context] == [str(i) for i in range(40, 50)]
@@ -0,0 +1,58 @@
+import asyncio
+from itertools import cycle
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from weaver.models.events import UserMessageEvent
+from weaver.models.stream import DeliveryEvent, FinalResultEvent, TokenDeltaEvent, ToolCallEvent
+
+
+class _StreamingFake(GenericFakeChatModel):
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+def test_stream_yields_token_deltas_before_final(make_runtime):
+    llm = _StreamingFake(messages=cycle([AIMessage(content="let us build a budget")]))
+    runtime = make_runtime(llm)
+    events = list(runtime.stream("s", UserMessageEvent(user_id="u", content="hi")))
+    tokens = [e for e in events if isinstance(e, TokenDeltaEvent)]
+    assert len(tokens) > 1
+    assert "".join(t.content for t in tokens) == "let us build a budget"
+    assert isinstance(events[-1], FinalResultEvent)
+    assert events[-1].result["response"] == "let us build a budget"
+    assert len(runtime._histories["s"]) == 2
+
+
+def test_stream_reports_tool_calls_and_deliveries(scripted_llm, make_runtime):
+    calls = [
+        {"name": "reply_privately", "args": {"recipient": "bob", "content": "psst"}, "id": "c1"},
+        {"name": "post_to_shared", "args": {"content": "hello all"}, "id": "c2"},
+    ]
+    runtime = make_runtime(scripted_llm([AIMessage(content="", tool_calls=calls)]))
+    events = list(runtime.stream("s", UserMessageEvent(user_id="u", content="hi")))
+    kinds = [e.type for e in events]
+    assert kinds.index("tool_call") < kinds.index("delivery") < kinds.index("final")
+    assert [e.name for e in events if isinstance(e, ToolCallEvent)] == [
+        "reply_privately",
+        "post_to_shared",
+    ]
+    deliveries = [e for e in events if isinstance(e, DeliveryEvent)]
+    assert [(d.channel, d.recipient, d.content) for d in deliveries] == [
+        ("private", "bob", "psst"),
+        ("shared", None, "hello all"),
+    ]
+    assert events[-1].result["messages_appended"] == 5
+    assert len(runtime._histories["s"]) == 5
+
+
+def test_astream_matches_stream(scripted_llm, make_runtime):
+    runtime = make_runtime(scripted_llm())
+
+    async def collect():
+        return [e async for e in runtime.astream("s", UserMessageEvent(user_id="u", content="x"))]
+
+    events = asyncio.run(collect())
+    assert [e.type for e in events] == ["token", "final"]
+    assert events[-1].result["messages_appended"] == 2
@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from weaver.exceptions import RuntimeInvocationError
+from weaver.models.events import UserMessageEvent
+from weaver.telemetry import NOOP, MetricsRegistry, Telemetry, get_telemetry, set_telemetry
+
+
+def _tool_turn_llm(scripted_llm):
+    call = AIMessage(
+        content="",
+        tool_calls=[{"name": "post_to_shared", "args": {"content": "hi"}, "id": "c1"}],
+        usage_metadata={"input_tokens": 30, "output_tokens": 5, "total_tokens": 35},
+    )
+    final = AIMessage(
+        content="done",
+        usage_metadata={"input_tokens": 40, "output_tokens": 2, "total_tokens": 42},
+    )
+    return scripted_llm([call, final])
+
+
+def test_spans_cover_every_phase(scripted_llm, tmp_path, make_runtime):
+    telemetry = Telemetry(sink=tmp_path / "spans.jsonl")
+    runtime = make_runtime(_tool_turn_llm(scripted_llm), telemetry=telemetry)
+    runtime.invoke("s1", UserMessageEvent(user_id="u1", content="hello"))
+    telemetry.close()
+
+    spans = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    names = [s["name"] for s in spans]
+    assert names == ["context_prep", "agent", "tools", "agent", "memory_append", "turn"]
+    turn = spans[-1]
+    assert {s["trace_id"] for s in spans} == {turn["span_id"]}
+    assert all(s["parent_id"] == turn["span_id"] for s in spans[:-1])
+    agent = spans[1]
+    assert agent["prompt_tokens"] == 30 and agent["completion_tokens"] == 5
+    assert agent["tool_calls"] == 1 and agent["history_len"] == 1
+    assert spans[2]["tools"] == ["post_to_shared"] and spans[2]["tool_errors"] == 0
+    assert spans[4]["appended"] == 4
+    assert all(s["duration_ms"] >= 0 for s in spans)
+
+
+def test_registry_counters_and_render(scripted_llm, make_runtime):
+    registry = MetricsRegistry()
+    runtime = make_runtime(_tool_turn_llm(scripted_llm), telemetry=Telemetry(registry=registry))
+    asyncio.run(runtime.ainvoke("s1", UserMessageEvent(user_id="u1", content="hello")))
+
+    assert registry.counter_value("weaver_llm_prompt_tokens_total") == 70
+    assert registry.counter_value("weaver_llm_completion_tokens_total") == 7
+    assert registry.counter_value("weaver_llm_calls_total") == 2
+    assert registry.counter_value("weaver_tool_calls_total", tool="post_to_shared") == 1
+    assert registry.counter_value("weaver_turns_total", status="ok") == 1
+    assert registry.histogram_count("weaver_span_duration_seconds", span="agent") == 2
+    text = registry.render()
+    assert "# TYPE weaver_span_duration_seconds histogram" in text
+    assert 'weaver_span_duration_seconds_count{span="turn"} 1' in text
+    assert 'weaver_tool_calls_total{tool="post_to_shared"} 1' in text
+
+
+def test_failed_turn_counted(scripted_llm, make_runtime):
+    registry = MetricsRegistry()
+    runtime = make_runtime(scripted_llm(), telemetry=Telemetry(registry=registry))
+    runtime.memory.prepare_context = None  # force a failure inside the turn
+    with pytest.raises(RuntimeInvocationError):
+        runtime.invoke("s1", UserMessageEvent(user_id="u1", content="hello"))
+    assert registry.counter_value("weaver_turns_total", status="error") == 1
+
+
+def test_disabled_by_default_and_process_wide_switch(scripted_llm, make_runtime):
+    assert get_telemetry() is NOOP
+    assert NOOP.span("agent") is NOOP.span("tools")  # shared no-op span
+    registry = MetricsRegistry()
+    set_telemetry(Telemetry(registry=registry))
+    try:
+        make_runtime(scripted_llm()).invoke("s1", UserMessageEvent(user_id="u1", content="x"))
+    finally:
+        set_telemetry(None)
+    assert registry.counter_value("weaver_llm_calls_total") == 1
+    assert get_telemetry() is NOOP